@@ -0,0 +1,294 @@
+"""
+Benchmark Suite for the Unified Style Library
+==============================================
+
+Micro- and macro-benchmarks for unified_animation_timing.py. For every
+function in EASING_FUNCTIONS this measures:
+- Scalar call latency
+- ndarray throughput at 1e3 and 1e6 samples
+- sample_easing_function cost
+
+plus bezier() construction cost, the JSON/JavaScript export functions, and
+the time to import unified_color_schemes and fetch the first scheme. The
+import time must stay under an import budget (IMPORT_BUDGET), otherwise the
+run fails, so adding schemes cannot silently slow down every scene's import.
+
+Results are written as JSON ({"meta": ..., "results": {name: seconds}}), and
+a compare mode flags every benchmark that got slower than a baseline by more
+than a threshold.
+
+Usage:
+    python benchmarks.py                              # run and print
+    python benchmarks.py --output results.json        # run and save
+    python benchmarks.py --compare benchmark_baseline.json
+    python benchmarks.py --update-baseline            # rewrite the baseline
+    python benchmarks.py --quick                      # skip 1e6 samples
+
+Version: 1.0
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import timeit
+from typing import Callable, Dict, List, Tuple, Any
+
+import numpy as np
+
+from unified_animation_timing import (
+    EASING_FUNCTIONS,
+    bezier,
+    evaluate_easing,
+    sample_easing_function,
+    export_easing_to_json,
+    export_easing_to_javascript,
+)
+
+
+BASELINE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmark_baseline.json")
+DEFAULT_THRESHOLD = 0.25
+ARRAY_SIZES = {"1e3": 1_000, "1e6": 1_000_000}
+IMPORT_BUDGET = 0.05    # seconds for `import unified_color_schemes` in a cold interpreter
+
+# Run in a fresh interpreter with nothing preloaded, so the measured import
+# includes everything it pulls in (numpy is only needed by the first lookup)
+_IMPORT_SCRIPT = """
+import time
+start = time.perf_counter()
+import unified_color_schemes
+imported = time.perf_counter()
+unified_color_schemes.get_scheme("default")
+print(imported - start, time.perf_counter() - imported)
+"""
+
+
+# ============================================================================
+# TIMING HELPERS
+# ============================================================================
+
+def time_call(func: Callable[[], Any], repeat: int = 5, min_time: float = 0.05) -> float:
+    """
+    Time a zero-argument callable
+
+    The number of loops per repetition is chosen automatically so that one
+    repetition lasts at least min_time seconds; the best repetition is kept.
+
+    Args:
+        func: Callable to time
+        repeat: Number of repetitions
+        min_time: Minimum duration of one repetition in seconds
+
+    Returns:
+        Best time per call in seconds
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time:
+            break
+        number *= 10 if elapsed < min_time / 10 else 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, timer.timeit(number))
+    return best / number
+
+
+# ============================================================================
+# BENCHMARKS
+# ============================================================================
+
+def bench_scalar(func: Callable[[float], float]) -> float:
+    """Mean latency of one scalar call, averaged over t in [0, 1]"""
+    ts = [i / 10 for i in range(11)]
+
+    def run():
+        for t in ts:
+            func(t)
+    return time_call(run) / len(ts)
+
+
+def bench_array(func: Callable[[float], float], size: int) -> float:
+    """Time to evaluate func over an ndarray of `size` samples"""
+    t = np.linspace(0, 1, size)
+    repeat = 3 if size >= 1_000_000 else 5
+    return time_call(lambda: evaluate_easing(func, t), repeat=repeat)
+
+
+def bench_sample(func: Callable[[float], float]) -> float:
+    """Time of one sample_easing_function call with the export sample count"""
+    return time_call(lambda: sample_easing_function(func, num_samples=50))
+
+
+def bench_bezier(num_points: int) -> float:
+    """Construction cost of a bezier rate function with num_points controls"""
+    points = list(np.linspace(0, 1, num_points))
+    return time_call(lambda: bezier(points))
+
+
+def bench_exports() -> Dict[str, float]:
+    """Time the JSON and JavaScript easing exporters writing to a temp dir"""
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = os.path.join(tmp, "easing_functions.json")
+        js_path = os.path.join(tmp, "easing_functions.js")
+        return {
+            "export/json": time_call(lambda: export_easing_to_json(json_path), repeat=3),
+            "export/javascript": time_call(lambda: export_easing_to_javascript(js_path), repeat=3),
+        }
+
+
+def bench_import(repeat: int = 5) -> Dict[str, float]:
+    """Best-of-N import time of unified_color_schemes and its first get_scheme()"""
+    here = os.path.dirname(os.path.abspath(__file__))
+    env = dict(os.environ, PYTHONPATH=here)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    env.pop("UNIFIED_STYLE_PROFILE", None)
+    timings = []
+    # The first run also writes the bytecode cache, so it is not counted
+    for _ in range(repeat + 1):
+        output = subprocess.run([sys.executable, "-c", _IMPORT_SCRIPT], cwd=here, env=env,
+                                capture_output=True, text=True, check=True).stdout
+        timings.append(tuple(float(v) for v in output.split()))
+    return {
+        "import/color_schemes": min(t[0] for t in timings[1:]),
+        "import/first_scheme": min(t[1] for t in timings[1:]),
+    }
+
+
+def run_suite(quick: bool = False, only: List[str] = None) -> Dict[str, Any]:
+    """
+    Run the full benchmark suite
+
+    Args:
+        quick: Skip the 1e6-sample array benchmarks
+        only: Optional list of easing names to restrict the per-function runs
+
+    Returns:
+        Dictionary with "meta" and "results" (benchmark name -> seconds)
+    """
+    results = {}
+    names = only or list(EASING_FUNCTIONS.keys())
+    for name in names:
+        func = EASING_FUNCTIONS[name]
+        results[f"scalar/{name}"] = bench_scalar(func)
+        for label, size in ARRAY_SIZES.items():
+            if quick and size >= 1_000_000:
+                continue
+            results[f"array_{label}/{name}"] = bench_array(func, size)
+        results[f"sample/{name}"] = bench_sample(func)
+
+    for num_points in (2, 6, 16):
+        results[f"bezier/{num_points}"] = bench_bezier(num_points)
+
+    results.update(bench_exports())
+    results.update(bench_import())
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "machine": platform.machine(),
+            "quick": quick,
+        },
+        "results": results,
+    }
+
+
+# ============================================================================
+# COMPARISON
+# ============================================================================
+
+def compare_results(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    threshold: float = DEFAULT_THRESHOLD
+) -> List[Tuple[str, float, float, float]]:
+    """
+    Find benchmarks that regressed relative to a baseline
+
+    Benchmarks missing from either side are ignored.
+
+    Args:
+        current: Result of run_suite()
+        baseline: Previously saved result of run_suite()
+        threshold: Allowed slowdown as a fraction (0.25 = 25% slower)
+
+    Returns:
+        List of (name, baseline_seconds, current_seconds, ratio) tuples,
+        slowest ratio first
+    """
+    regressions = []
+    base = baseline["results"]
+    for name, seconds in current["results"].items():
+        if name not in base or base[name] <= 0:
+            continue
+        ratio = seconds / base[name]
+        if ratio > 1 + threshold:
+            regressions.append((name, base[name], seconds, ratio))
+    return sorted(regressions, key=lambda r: r[3], reverse=True)
+
+
+def format_seconds(seconds: float) -> str:
+    """Format a duration with a readable unit"""
+    for unit, scale in (("s", 1), ("ms", 1e-3), ("us", 1e-6)):
+        if seconds >= scale:
+            return f"{seconds / scale:.2f} {unit}"
+    return f"{seconds / 1e-9:.1f} ns"
+
+
+def print_results(data: Dict[str, Any]):
+    """Print benchmark results as an aligned table"""
+    for name, seconds in data["results"].items():
+        print(f"  {name:36} {format_seconds(seconds):>12}")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the unified animation timing library")
+    parser.add_argument("--output", help="Write results to this JSON file")
+    parser.add_argument("--compare", nargs="?", const=BASELINE_FILE, help="Compare against a baseline JSON file")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed slowdown fraction before flagging (default 0.25)")
+    parser.add_argument("--update-baseline", action="store_true", help="Overwrite the committed baseline")
+    parser.add_argument("--quick", action="store_true", help="Skip the 1e6-sample benchmarks")
+    parser.add_argument("--only", nargs="+", help="Restrict per-function benchmarks to these easing names")
+    parser.add_argument("--import-budget", type=float, default=IMPORT_BUDGET,
+                        help="Maximum seconds to import unified_color_schemes (default 0.05)")
+    args = parser.parse_args(argv)
+
+    data = run_suite(quick=args.quick, only=args.only)
+    print("Benchmark Results:")
+    print("==================")
+    print_results(data)
+
+    import_time = data["results"]["import/color_schemes"]
+    if import_time > args.import_budget:
+        print(f"\nIMPORT BUDGET EXCEEDED: unified_color_schemes took {format_seconds(import_time)} "
+              f"(budget {format_seconds(args.import_budget)})")
+        return 1
+
+    for path in filter(None, [args.output, BASELINE_FILE if args.update_baseline else None]):
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"\nResults written to {path}")
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare_results(data, baseline, args.threshold)
+        print(f"\nComparison against {args.compare} (threshold {args.threshold:.0%}):")
+        if not regressions:
+            print("  No regressions.")
+            return 0
+        for name, before, after, ratio in regressions:
+            print(f"  REGRESSION {name:36} {format_seconds(before):>12} -> {format_seconds(after):>12} ({ratio:.2f}x)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,721 @@
+"""
+Asset Build Pipeline for the Unified Style Library
+===================================================
+
+One command regenerates every generated file from a declared dependency
+graph (TARGETS):
+
+    color_schemes.css / .js      <- unified_color_schemes.py (+ color spaces)
+    ../css/color-schemes.css     <- copy of color_schemes.css
+    ../js/color-schemes.js       <- copy of color_schemes.js
+    easing_functions.json / .js  <- unified_animation_timing.py
+    STYLE_GUIDE.md               <- unified_style_guide.py
+    design_tokens.css / .js / .py, manim_design_tokens.py
+                                 <- unified_design_tokens.py (+ timing, schemes)
+    ../css/design-tokens.css     <- copy of design_tokens.css
+    ../js/design-tokens.js       <- copy of design_tokens.js
+
+Each target's inputs are hashed (the syntax tree of its source modules,
+so comment-only edits do not count, plus the exporter name and
+parameters; for copies, the bytes of the copied file). The last build's
+stamp records that hash and the digest of the file it wrote; a target whose
+inputs and file both still match is skipped. Any other target is exported
+and compared byte for byte, so a fresh clone (no stamps) with up-to-date
+files writes nothing, and a hand-edited output is regenerated. Independent
+exporters run in a process pool, and every output is written to a temporary
+file and renamed into place, so readers never see a half-written file.
+
+Watch mode (--watch) polls the source modules (or uses inotify when the
+inotify_simple package is installed), waits for a burst of saves to settle,
+and rebuilds what changed. Edits confined to individual entries of a
+registry (one scheme in COLOR_SCHEMES_DATA, one easing in EASING_FUNCTIONS
+and the functions it calls, one token in DESIGN_TOKENS) re-render only those
+entries; the rest of the output comes from the entries rendered last time.
+
+The exporters write canonical output (sorted keys, fixed float precision,
+upper-case hex, LF line endings), so the committed files are golden: --verify
+exports every target twice, in fresh interpreters with different hash
+seeds, and fails unless both runs match each other and the files on disk
+byte for byte.
+
+Every build and --check first runs the accessibility gate
+(unified_accessibility.validate_schemes): if a scheme listed in
+REQUIRED_LEVELS misses its contrast level, the build fails before writing
+anything (watch mode prints the failure and keeps watching).
+
+Usage:
+    python build_assets.py              # build what is out of date
+    python build_assets.py --check      # exit 1 if anything is stale or inaccessible (no writes)
+    python build_assets.py --force      # rebuild everything
+    python build_assets.py --list       # show the dependency graph
+    python build_assets.py --watch      # rebuild on every save until Ctrl+C
+    python build_assets.py --verify     # exit 1 unless exports are byte-identical
+
+Version: 1.0
+"""
+
+import argparse
+import ast
+import hashlib
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set, Tuple
+
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+except ImportError:    # polling works everywhere
+    INotify = None
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+STAMP_FILE = os.path.join(HERE, ".build_stamps.json")
+
+
+class Target(NamedTuple):
+    """One generated file and how to produce it"""
+    sources: Tuple[str, ...]          # Python modules whose code it depends on
+    exporter: Optional[str] = None    # "module:function" called with the output path
+    params: Tuple = ()                # Extra keyword arguments, as (name, value) pairs
+    copy_of: Optional[str] = None     # Or: another target this file mirrors
+
+
+# The token compiler reads easing names and scheme keys from these modules
+TOKEN_SOURCES = ("unified_design_tokens.py", "unified_animation_timing.py",
+                 "unified_color_schemes.py", "unified_color_spaces.py")
+
+# Output path (relative to this directory) -> Target
+TARGETS: Dict[str, Target] = {
+    "color_schemes.css": Target(
+        ("unified_color_schemes.py", "unified_color_spaces.py"),
+        "unified_color_schemes:export_all_schemes_to_css"),
+    "color_schemes.js": Target(
+        ("unified_color_schemes.py", "unified_color_spaces.py"),
+        "unified_color_schemes:export_all_schemes_to_js"),
+    "easing_functions.json": Target(
+        ("unified_animation_timing.py",),
+        "unified_animation_timing:export_easing_to_json"),
+    "easing_functions.js": Target(
+        ("unified_animation_timing.py",),
+        "unified_animation_timing:export_easing_to_javascript"),
+    "STYLE_GUIDE.md": Target(
+        ("unified_style_guide.py",),
+        "unified_style_guide:export_guide_to_markdown"),
+    "design_tokens.css": Target(TOKEN_SOURCES, "unified_design_tokens:export_tokens_to_css"),
+    "design_tokens.js": Target(TOKEN_SOURCES, "unified_design_tokens:export_tokens_to_js"),
+    "design_tokens.py": Target(TOKEN_SOURCES, "unified_design_tokens:export_tokens_to_python"),
+    "manim_design_tokens.py": Target(TOKEN_SOURCES, "unified_design_tokens:export_tokens_to_manim"),
+    os.path.join("..", "css", "color-schemes.css"): Target((), copy_of="color_schemes.css"),
+    os.path.join("..", "js", "color-schemes.js"): Target((), copy_of="color_schemes.js"),
+    os.path.join("..", "css", "design-tokens.css"): Target((), copy_of="design_tokens.css"),
+    os.path.join("..", "js", "design-tokens.js"): Target((), copy_of="design_tokens.js"),
+}
+
+# Source module -> registry whose entries its exporters can render one by one
+REGISTRIES: Dict[str, str] = {
+    "unified_color_schemes.py": "COLOR_SCHEMES_DATA",
+    "unified_animation_timing.py": "EASING_FUNCTIONS",
+    "unified_design_tokens.py": "DESIGN_TOKENS",
+}
+
+# Targets whose exporter takes a `cache` of rendered entries
+INCREMENTAL_TARGETS = ("color_schemes.css", "color_schemes.js", "easing_functions.json",
+                       "design_tokens.css", "design_tokens.js", "design_tokens.py",
+                       "manim_design_tokens.py")
+
+
+# ============================================================================
+# INPUT HASHING
+# ============================================================================
+
+_module_cache: Dict[str, bytes] = {}
+
+
+def module_digest(source: str) -> bytes:
+    """
+    Hash of a module's syntax tree (insensitive to comments and formatting)
+
+    The tree is hashed rather than marshalled bytecode, whose bytes depend
+    on the reference counts of the process doing the marshalling.
+    """
+    if source not in _module_cache:
+        path = os.path.join(HERE, source)
+        with open(path, "rb") as f:
+            tree = ast.parse(f.read(), source)
+        _module_cache[source] = hashlib.sha256(ast.dump(tree).encode()).digest()
+    return _module_cache[source]
+
+
+def file_digest(path: str) -> str:
+    """Hash of a file's bytes ("" if it does not exist)"""
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except FileNotFoundError:
+        return ""
+
+
+def input_hash(name: str, target: Target) -> str:
+    """Hash of everything a target is generated from"""
+    digest = hashlib.sha256(f"{sys.version_info[:2]}\0{target.exporter}\0{target.params!r}\0".encode())
+    for source in target.sources:
+        digest.update(module_digest(source))
+    if target.copy_of:
+        digest.update(file_digest(os.path.join(HERE, target.copy_of)).encode())
+    return digest.hexdigest()
+
+
+def build_levels(targets: Dict[str, Target] = TARGETS) -> List[List[str]]:
+    """Group targets so each group only depends on earlier groups"""
+    levels, done = [], set()
+    remaining = dict(targets)
+    while remaining:
+        ready = [name for name, t in remaining.items() if not t.copy_of or t.copy_of in done]
+        if not ready:
+            raise ValueError(f"Dependency cycle among {sorted(remaining)}")
+        levels.append(sorted(ready))
+        done.update(ready)
+        for name in ready:
+            del remaining[name]
+    return levels
+
+
+# ============================================================================
+# SCHEME VALIDATION
+# ============================================================================
+
+def _scheme_failures(_=None) -> str:
+    """REQUIRED_LEVELS contrast failures as a report (runs in a worker process)"""
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    accessibility = importlib.import_module("unified_accessibility")
+    return accessibility.format_findings(accessibility.validate_schemes())
+
+
+def check_schemes() -> str:
+    """
+    Audit the color schemes required to be accessible
+
+    Runs in a fresh worker process, so it sees the current sources even
+    after watch mode reloaded modules in this one.
+
+    Returns:
+        Report of the failing pairs ("" when every required scheme passes)
+    """
+    with ProcessPoolExecutor(max_workers=1) as pool:
+        return pool.submit(_scheme_failures).result()
+
+
+# ============================================================================
+# BUILDING
+# ============================================================================
+
+def _temporary_path(path: str) -> str:
+    directory, filename = os.path.split(path)
+    return os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+
+
+def _export(target: Target, path: str):
+    """Run a target's exporter, writing to `path`"""
+    module_name, function_name = target.exporter.split(":")
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    exporter = getattr(importlib.import_module(module_name), function_name)
+    exporter(path, **dict(target.params))
+
+
+def _build_target(job: Tuple[str, Target]) -> Tuple[str, float, bool]:
+    """
+    Produce one target atomically (runs in a worker process)
+
+    A file whose bytes would not change is left alone, keeping its
+    modification time.
+
+    Returns:
+        (name, seconds, whether the file was written)
+    """
+    name, target = job
+    started = time.perf_counter()
+    path = os.path.normpath(os.path.join(HERE, name))
+    temporary = _temporary_path(path)
+    try:
+        if target.copy_of:
+            shutil.copyfile(os.path.join(HERE, target.copy_of), temporary)
+        else:
+            _export(target, temporary)
+        written = file_digest(temporary) != file_digest(path)
+        if written:
+            os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return name, time.perf_counter() - started, written
+
+
+def _export_digest(job: Tuple[str, Target]) -> str:
+    """Export a target to `path` (runs in a worker process); returns the digest of the result"""
+    path, target = job
+    _export(target, path)
+    return file_digest(path)
+
+
+# Target -> {"inputs": input_hash(), "output": file_digest() of what was written}
+Stamps = Dict[str, Dict[str, str]]
+
+
+def load_stamps() -> Stamps:
+    try:
+        with open(STAMP_FILE) as f:
+            stamps = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+    # Stamps of older builds (input hash only) say nothing about the output
+    return {name: stamp for name, stamp in stamps.items() if isinstance(stamp, dict)}
+
+
+def stamp(name: str, target: Target) -> Dict[str, str]:
+    """The stamp of a target whose file is up to date"""
+    return {"inputs": input_hash(name, target), "output": file_digest(os.path.join(HERE, name))}
+
+
+def save_stamps(stamps: Stamps):
+    temporary = _temporary_path(STAMP_FILE)
+    with open(temporary, "w") as f:
+        json.dump(stamps, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.replace(temporary, STAMP_FILE)
+
+
+def is_stale(name: str, target: Target, stamps: Stamps) -> bool:
+    """Whether a target's stamp fails to vouch for it (inputs or file changed, or no stamp)"""
+    return stamps.get(name) != stamp(name, target)
+
+
+def stale_targets(targets: Dict[str, Target] = TARGETS, jobs: Optional[int] = None) -> List[str]:
+    """
+    Targets whose file differs from what a build would write (no writes)
+
+    Targets without a matching stamp are exported to a temporary directory
+    and compared byte for byte; a copy is compared with what its source
+    will hold.
+    """
+    stamps = load_stamps()
+    expected: Dict[str, str] = {}    # Target -> digest a build would write
+    stale = set()
+    with tempfile.TemporaryDirectory() as directory, ProcessPoolExecutor(max_workers=jobs) as pool:
+        for level in build_levels(targets):
+            # A copy of a stale target is stale unless it already holds the new bytes
+            unknown = [name for name in level
+                       if targets[name].copy_of in stale or is_stale(name, targets[name], stamps)]
+            exports = [name for name in unknown if not targets[name].copy_of]
+            work = [(os.path.join(directory, os.path.basename(name)), targets[name]) for name in exports]
+            expected.update(zip(exports, pool.map(_export_digest, work)))
+            for name in unknown:
+                source = targets[name].copy_of
+                if source:
+                    expected[name] = expected.get(source) or file_digest(os.path.join(HERE, source))
+                if expected[name] != file_digest(os.path.join(HERE, name)):
+                    stale.add(name)
+    return sorted(stale)
+
+
+def build(targets: Dict[str, Target] = TARGETS, force: bool = False,
+          jobs: Optional[int] = None, timings: Dict[str, float] = None) -> List[str]:
+    """
+    Regenerate out-of-date targets
+
+    Args:
+        targets: Dependency graph to build
+        force: Rebuild every target regardless of stamps
+        jobs: Worker processes (default: CPU count)
+        timings: Optional dict that receives target -> seconds spent, for
+            every target exported or copied
+
+    Returns:
+        Names of the targets whose files were rewritten
+
+    Raises:
+        ValueError: If a scheme misses its REQUIRED_LEVELS contrast (nothing
+            is written)
+    """
+    failures = check_schemes()
+    if failures:
+        raise ValueError(f"Required schemes miss their contrast level:\n{failures}")
+    stamps = load_stamps()
+    rebuilt = []
+    # A copy of a target rebuilt in this run is stale too, although its
+    # source still has the old bytes while the work is planned
+    work_by_level, stale = [], set()
+    for level in build_levels(targets):
+        work = [name for name in level
+                if force or targets[name].copy_of in stale or is_stale(name, targets[name], stamps)]
+        stale.update(work)
+        work_by_level.append([(name, targets[name]) for name in work])
+    if not any(work_by_level):
+        return rebuilt
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for work in work_by_level:
+            for name, seconds, written in pool.map(_build_target, work):
+                stamps[name] = stamp(name, targets[name])
+                if written:
+                    rebuilt.append(name)
+                if timings is not None:
+                    timings[name] = seconds
+    save_stamps(stamps)
+    return rebuilt
+
+
+# ============================================================================
+# REPRODUCIBILITY
+# ============================================================================
+
+# Hash seeds of the two verification runs (set iteration order differs)
+VERIFY_HASH_SEEDS = (1, 2)
+
+_EXPORT_SCRIPT = """
+import json, sys
+import build_assets
+for path, exporter, params in json.loads(sys.argv[1]):
+    build_assets._export(build_assets.Target((), exporter, tuple(map(tuple, params))), path)
+"""
+
+
+def verify_reproducible(targets: Dict[str, Target] = TARGETS,
+                        seeds: Iterable[int] = VERIFY_HASH_SEEDS) -> Dict[str, Optional[str]]:
+    """
+    Export every target in fresh interpreters and compare with the files on disk
+
+    Each run is a new Python process with its own PYTHONHASHSEED, so output
+    that depends on set ordering, caches or process state shows up as a
+    difference between runs. Copies are compared with the file they mirror.
+
+    Returns:
+        Target -> None if every run matched the file on disk, else a
+        description of the difference
+    """
+    exports = [(name, target) for name, target in targets.items() if not target.copy_of]
+    runs = []
+    with tempfile.TemporaryDirectory() as directory:
+        processes = []
+        for seed in seeds:
+            paths = [os.path.join(directory, f"{seed}-{i}-{os.path.basename(name)}")
+                     for i, (name, _) in enumerate(exports)]
+            jobs = [(path, target.exporter, target.params) for path, (_, target) in zip(paths, exports)]
+            env = dict(os.environ, PYTHONHASHSEED=str(seed), PYTHONDONTWRITEBYTECODE="1")
+            processes.append((paths, subprocess.Popen(
+                [sys.executable, "-c", _EXPORT_SCRIPT, json.dumps(jobs)], cwd=HERE, env=env)))
+        for paths, process in processes:
+            if process.wait() != 0:
+                raise RuntimeError(f"export run failed with exit code {process.returncode}")
+            runs.append({name: file_digest(path) for (name, _), path in zip(exports, paths)})
+
+    problems = {}
+    for name, target in targets.items():
+        on_disk = file_digest(os.path.join(HERE, name))
+        exported = {run[target.copy_of or name] for run in runs}
+        if len(exported) > 1:
+            problems[name] = "differs between runs"
+        elif not on_disk:
+            problems[name] = "missing"
+        elif on_disk not in exported:
+            problems[name] = "differs from a fresh export"
+        else:
+            problems[name] = None
+    return problems
+
+
+# ============================================================================
+# WATCH MODE
+# ============================================================================
+
+WATCH_INTERVAL = 0.2    # Seconds between polls
+DEBOUNCE = 0.3          # Quiet period that ends a burst of saves
+
+
+def registry_digests(source: str, registry: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Split a module into per-entry digests of one registry dict and the rest
+
+    An entry's digest covers its value in the dict literal plus every
+    top-level function it refers to (transitively), so editing a helper
+    invalidates the entries that call it. The rest digest covers everything
+    else; when it changes, entries cannot be rebuilt in isolation. Like
+    module_digest(), comments and formatting do not count.
+
+    Returns:
+        (rest digest, {entry key: digest})
+    """
+    with open(os.path.join(HERE, source), "rb") as f:
+        tree = ast.parse(f.read(), source)
+    functions = {node.name: node for node in tree.body
+                 if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))}
+    literal = None
+    for node in tree.body:
+        names = node.targets if isinstance(node, ast.Assign) else [getattr(node, "target", None)]
+        if (isinstance(node, (ast.Assign, ast.AnnAssign)) and isinstance(node.value, ast.Dict)
+                and any(isinstance(t, ast.Name) and t.id == registry for t in names)):
+            literal = node
+
+    def referenced(node: ast.AST) -> Set[str]:
+        found, pending = set(), [node]
+        while pending:
+            for child in ast.walk(pending.pop()):
+                if isinstance(child, ast.Name) and child.id in functions and child.id not in found:
+                    found.add(child.id)
+                    pending.append(functions[child.id])
+        return found
+
+    entries, owned = {}, set()
+    for key, value in zip(literal.value.keys, literal.value.values) if literal else ():
+        if not isinstance(key, ast.Constant):
+            return hashlib.sha256(ast.dump(tree).encode()).hexdigest(), {}
+        names = referenced(value)
+        owned |= names
+        digest = hashlib.sha256(ast.dump(value).encode())
+        for name in sorted(names):
+            digest.update(ast.dump(functions[name]).encode())
+        entries[key.value] = digest.hexdigest()
+
+    rest = hashlib.sha256()
+    for node in tree.body:
+        if node is not literal and getattr(node, "name", None) not in owned:
+            rest.update(ast.dump(node).encode())
+    return rest.hexdigest(), entries
+
+
+def _source_mtimes(sources: Iterable[str]) -> Dict[str, int]:
+    mtimes = {}
+    for source in sources:
+        try:
+            mtimes[source] = os.stat(os.path.join(HERE, source)).st_mtime_ns
+        except FileNotFoundError:
+            mtimes[source] = 0
+    return mtimes
+
+
+class Watcher:
+    """Rebuilds targets as their sources change, entry by entry where possible"""
+
+    def __init__(self, targets: Dict[str, Target] = TARGETS, jobs: Optional[int] = None):
+        self.targets = targets
+        self.jobs = jobs
+        self.sources = sorted({s for t in targets.values() for s in t.sources})
+        self.mtimes = _source_mtimes(self.sources)
+        self.digests = {source: registry_digests(source, registry)
+                        for source, registry in REGISTRIES.items() if source in self.sources}
+        # Rendered entries per incremental target, filled by its exporter
+        self.caches: Dict[str, Dict] = {name: {} for name in INCREMENTAL_TARGETS if name in targets}
+
+    def poll(self) -> Set[str]:
+        """Sources whose modification time changed since the last poll"""
+        mtimes = _source_mtimes(self.sources)
+        changed = {s for s in self.sources if mtimes[s] != self.mtimes[s]}
+        self.mtimes = mtimes
+        return changed
+
+    def wait(self) -> Set[str]:
+        """Block until sources change and a burst of saves has settled"""
+        if INotify is not None:
+            return self._wait_inotify()
+        changed = set()
+        quiet_since = None
+        while not changed or time.monotonic() - quiet_since < DEBOUNCE:
+            time.sleep(WATCH_INTERVAL)
+            burst = self.poll()
+            if burst:
+                changed |= burst
+                quiet_since = time.monotonic()
+        return changed
+
+    def _wait_inotify(self) -> Set[str]:
+        if not hasattr(self, "_inotify"):
+            self._inotify = INotify()
+            self._inotify.add_watch(HERE, inotify_flags.CLOSE_WRITE | inotify_flags.MOVED_TO
+                                    | inotify_flags.CREATE | inotify_flags.DELETE)
+        changed = set()
+        while True:
+            events = self._inotify.read(timeout=int(DEBOUNCE * 1000) if changed else None)
+            if not events and changed:
+                break
+            changed |= {event.name for event in events if event.name in self.sources}
+        self.mtimes = _source_mtimes(self.sources)
+        return changed
+
+    def _render(self, name: str, module) -> float:
+        """Re-render an incremental target in-process from its entry cache"""
+        started = time.perf_counter()
+        path = os.path.join(HERE, name)
+        temporary = _temporary_path(path)
+        exporter = getattr(module, self.targets[name].exporter.split(":")[1])
+        try:
+            exporter(temporary, cache=self.caches[name], **dict(self.targets[name].params))
+            os.replace(temporary, path)
+        finally:
+            if os.path.exists(temporary):
+                os.remove(temporary)
+        return time.perf_counter() - started
+
+    def rebuild(self, changed: Set[str]) -> Dict[str, float]:
+        """
+        Bring targets up to date after `changed` sources were edited
+
+        Returns:
+            Target -> seconds spent, for every target regenerated
+        """
+        timings = {}
+        for source in changed:
+            _module_cache.pop(source, None)
+        if HERE not in sys.path:
+            sys.path.insert(0, HERE)
+
+        stamps = load_stamps()
+        for source, (old_rest, old_entries) in list(self.digests.items()):
+            if source not in changed:
+                continue
+            rest, entries = registry_digests(source, REGISTRIES[source])
+            self.digests[source] = (rest, entries)
+            module_name = source[:-3]
+            names = [n for n in self.caches if source in self.targets[n].sources]
+            # Targets whose exporter lives in another module (design tokens
+            # after an easing edit) are rebuilt in full
+            for name in [n for n in names if self.targets[n].exporter.split(":")[0] != module_name]:
+                self.caches[name].clear()
+                names.remove(name)
+            dependencies = {s for n in names for s in self.targets[n].sources} - {source}
+            if rest != old_rest or changed & dependencies:
+                # Not confined to registry entries: forget the rendered
+                # entries and let the normal build regenerate everything
+                for name in names:
+                    self.caches[name].clear()
+                sys.modules.pop(module_name, None)
+                continue
+
+            edited = {k for k in entries.keys() | old_entries.keys() if entries.get(k) != old_entries.get(k)}
+            if edited:
+                module = sys.modules.get(module_name)
+                module = importlib.reload(module) if module else importlib.import_module(module_name)
+            for name in names:
+                cache = self.caches[name]
+                for key in [k for k in cache if (k[0] if isinstance(k, tuple) else k) in edited]:
+                    del cache[key]
+                if edited:
+                    timings[name] = self._render(name, module)
+                stamps[name] = stamp(name, self.targets[name])
+            print(f"  {source}: {len(edited)} entr{'y' if len(edited) == 1 else 'ies'} changed "
+                  f"({', '.join(sorted(edited)) or 'none'})")
+        save_stamps(stamps)
+
+        for source in changed - set(self.digests):
+            sys.modules.pop(source[:-3], None)
+        # Exporters importing a changed module must not reuse a stale import
+        for name, target in self.targets.items():
+            if target.exporter and changed & set(target.sources) and name not in timings:
+                sys.modules.pop(target.exporter.split(":")[0], None)
+        build(self.targets, jobs=self.jobs, timings=timings)
+        return timings
+
+    def prime(self):
+        """Render every entry of the incremental targets once, filling the caches"""
+        if HERE not in sys.path:
+            sys.path.insert(0, HERE)
+        for name, cache in self.caches.items():
+            module_name, function_name = self.targets[name].exporter.split(":")
+            exporter = getattr(importlib.import_module(module_name), function_name)
+            exporter(os.devnull, cache=cache, **dict(self.targets[name].params))
+
+    def run(self):
+        """Build once, then rebuild on every change until interrupted"""
+        timings = {}
+        try:
+            build(self.targets, jobs=self.jobs, timings=timings)
+        except ValueError as e:
+            print(f"Build failed: {e}")
+        _print_timings(timings)
+        self.prime()
+        mode = "inotify" if INotify is not None else f"polling every {WATCH_INTERVAL}s"
+        print(f"Watching {len(self.sources)} source modules ({mode}); Ctrl+C to stop.")
+        try:
+            while True:
+                changed = self.wait()
+                print(f"Changed: {', '.join(sorted(changed))}")
+                try:
+                    _print_timings(self.rebuild(changed))
+                except ValueError as e:
+                    print(f"Build failed: {e}")
+        except KeyboardInterrupt:
+            print()
+
+
+def _print_timings(timings: Dict[str, float]):
+    for name, seconds in sorted(timings.items(), key=lambda item: -item[1]):
+        print(f"  built {name:32} {seconds * 1000:8.1f} ms")
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build all generated style assets")
+    parser.add_argument("--check", action="store_true",
+                        help="Report targets whose files a build would change, and required schemes "
+                             "missing their contrast level; exit 1 if any")
+    parser.add_argument("--force", action="store_true", help="Rebuild every target")
+    parser.add_argument("--jobs", type=int, help="Worker processes (default: CPU count)")
+    parser.add_argument("--list", action="store_true", help="Print the dependency graph")
+    parser.add_argument("--watch", action="store_true", help="Rebuild on every change until interrupted")
+    parser.add_argument("--verify", action="store_true",
+                        help="Export twice in fresh processes; exit 1 unless every file is byte-identical")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, target in TARGETS.items():
+            inputs = [target.copy_of] if target.copy_of else list(target.sources)
+            print(f"  {name:32} <- {', '.join(inputs)}")
+        return 0
+
+    if args.check:
+        failures = check_schemes()
+        if failures:
+            print(f"Required schemes miss their contrast level:\n{failures}")
+        stale = stale_targets(jobs=args.jobs)
+        if stale:
+            print("Stale targets:")
+            for name in stale:
+                print(f"  {name}")
+        if failures or stale:
+            return 1
+        print("All targets are up to date.")
+        return 0
+
+    if args.verify:
+        problems = verify_reproducible()
+        for name, problem in problems.items():
+            digest = file_digest(os.path.join(HERE, name)) or "-"
+            print(f"  {name:32} {digest[:16]:16}  {problem or 'ok'}")
+        if any(problems.values()):
+            print("Exports are not reproducible (rebuild with --force if the files are stale).")
+            return 1
+        print(f"All {len(problems)} targets are byte-identical across {len(VERIFY_HASH_SEEDS)} fresh exports.")
+        return 0
+
+    if args.watch:
+        Watcher(jobs=args.jobs).run()
+        return 0
+
+    timings = {}
+    try:
+        rebuilt = build(force=args.force, jobs=args.jobs, timings=timings)
+    except ValueError as e:
+        print(f"Build failed: {e}")
+        return 1
+    _print_timings(timings)
+    print(f"{len(rebuilt)} of {len(TARGETS)} targets rebuilt.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,459 @@
+"""
+Per-Page Script Bundles with Dead-Data Elimination
+===================================================
+
+Every page loads the shared `js/color-schemes.js` (all ten schemes and
+their tone ramps), `js/style-config.js` and `js/global-scheme-config.js` as
+separate requests, although a page applies one scheme and reads a handful
+of color keys. This module scans each page (its inline scripts and the
+local scripts it loads) for what it actually uses:
+
+- scheme names: literal `setScheme('x')` calls, scheme arguments of
+  getColor()/getTone(), and the scheme set in global-scheme-config.js
+- color keys: literal `styleConfig.getColor('key')`, `getColor(s, 'key')`
+  and `getTone(s, 'key', level)` arguments
+- easings: literal names passed to getEasingFunction()/applyEasing() or
+  read as `EASING_FUNCTIONS.name`, for pages that load the generated
+  easing_functions.js
+
+and emits one minified script per page with only that data, followed by
+the style configuration code. Any use that cannot be resolved statically
+(a variable scheme name, getColors(), direct COLOR_SCHEMES access, ...)
+keeps the full data for that category, so bundling never changes what a
+page can look up. Unknown color keys are dropped; getColor() returns the
+same '#000000' fallback for them either way.
+
+Usage:
+    python bundle_pages.py              # report what each page would load
+    python publish_site.py --bundle     # publish pages with their bundles
+
+Version: 1.0
+"""
+
+import argparse
+import os
+import posixpath
+import re
+import sys
+from urllib.parse import unquote
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Tuple
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SITE_ROOT = os.path.dirname(HERE)
+
+# Shared scripts replaced by the bundle, in load order (site-relative)
+COLOR_SCRIPT = "js/color-schemes.js"
+SHARED_SCRIPTS = (COLOR_SCRIPT, "js/style-config.js", "js/global-scheme-config.js")
+
+EASING_SCRIPT = os.path.relpath(os.path.join(HERE, "easing_functions.js"), SITE_ROOT).replace(os.sep, "/")
+
+# Every script whose data goes into a bundle when a page loads it
+BUNDLED_SCRIPTS = SHARED_SCRIPTS + (EASING_SCRIPT,)
+
+DEFAULT_SCHEME = "default"    # StyleConfig.DEFAULT_SCHEME, always kept
+
+# Global names defined by easing_functions.js
+EASING_API = frozenset(("EASING_FUNCTIONS", "CSS_TIMING_FUNCTIONS", "getEasingFunction",
+                        "getCssTimingFunction", "applyEasing"))
+
+_LITERAL = re.compile(r"""\s*(['"])([\w-]+)\1\s*$""")
+_SCRIPT_TAG = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*(["'])([^"']+)\1[^>]*>\s*</script>""", re.I)
+# A script tag with the indentation and line break around it
+_SCRIPT_LINE = re.compile(
+    r"""([ \t]*)(<script\b[^>]*?\bsrc\s*=\s*(["'])([^"']+)\3[^>]*>\s*</script>)([ \t]*\r?\n)?""", re.I
+)
+_INLINE_SCRIPT = re.compile(r"<script\b(?![^>]*\bsrc\s*=)[^>]*>(.*?)</script>", re.I | re.S)
+
+
+# ============================================================================
+# MINIMAL JAVASCRIPT SCANNING
+# ============================================================================
+
+def _skip_literal(source: str, i: int, previous: str) -> Optional[int]:
+    """
+    If a string, template, comment or regex literal starts at i, return the
+    index just past it (comments included), else None. `previous` is the
+    last significant character before i, which tells a regex from a
+    division.
+    """
+    c = source[i]
+    if c in "'\"`":
+        j = i + 1
+        while j < len(source) and source[j] != c:
+            j += 2 if source[j] == "\\" else 1
+        return j + 1
+    if c == "/" and source.startswith("//", i):
+        end = source.find("\n", i)
+        return len(source) if end < 0 else end
+    if c == "/" and source.startswith("/*", i):
+        end = source.find("*/", i + 2)
+        return len(source) if end < 0 else end + 2
+    if c == "/" and (previous == "" or previous in "(,=:[!&|?{};+-*%<>~^" or
+                     re.search(r"\breturn\s*$", source[max(0, i - 12):i])):
+        j, in_class = i + 1, False
+        while j < len(source) and (source[j] != "/" or in_class):
+            if source[j] == "\\":
+                j += 1
+            elif source[j] == "[":
+                in_class = True
+            elif source[j] == "]":
+                in_class = False
+            j += 1
+        return j + 1
+    return None
+
+
+def minify_js(source: str) -> str:
+    """
+    Strip comments, indentation and blank lines
+
+    Line breaks are kept, so automatic semicolon insertion behaves exactly
+    as in the original.
+    """
+    out, i, previous = [], 0, ""
+    while i < len(source):
+        end = _skip_literal(source, i, previous)
+        if end is None:
+            out.append(source[i])
+            if not source[i].isspace():
+                previous = source[i]
+            i += 1
+        else:
+            if not source.startswith(("//", "/*"), i):
+                out.append(source[i:end])
+                previous = source[end - 1]
+            i = end
+    lines = (line.strip() for line in "".join(out).splitlines())
+    return "\n".join(line for line in lines if line)
+
+
+def split_statements(source: str) -> List[str]:
+    """Top-level statements of (minified) JavaScript"""
+    statements, start, depth, i, previous = [], 0, 0, 0, ""
+    while i < len(source):
+        end = _skip_literal(source, i, previous)
+        if end is not None:
+            previous, i = source[end - 1], end
+            continue
+        c = source[i]
+        i += 1
+        if not c.isspace():
+            previous = c
+        if c in "({[":
+            depth += 1
+        elif c in ")}]":
+            depth -= 1
+        if depth:
+            continue
+        block = c == "}" and re.match(r"(function|class|if|else)\b", source[start:].lstrip())
+        if c == ";" or (block and not re.match(r"\s*(else\b|[.,;)])", source[i:])):
+            statements.append(source[start:i].strip())
+            start = i
+    if source[start:].strip():
+        statements.append(source[start:].strip())
+    return statements
+
+
+def declared_name(statement: str) -> Optional[str]:
+    match = re.match(r"(?:(?:const|let|var)\s+(\w+)\s*=|function\s+(\w+)|class\s+(\w+))", statement)
+    return next(filter(None, match.groups())) if match else None
+
+
+def split_commas(text: str) -> List[str]:
+    """Top-level comma-separated pieces (object entries, call arguments)"""
+    parts, start, depth, i, previous = [], 0, 0, 0, ""
+    while i < len(text):
+        end = _skip_literal(text, i, previous)
+        if end is not None:
+            previous, i = text[end - 1], end
+            continue
+        if text[i] in "({[":
+            depth += 1
+        elif text[i] in ")}]":
+            depth -= 1
+        elif text[i] == "," and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+        if not text[i].isspace():
+            previous = text[i]
+        i += 1
+    if text[start:].strip():
+        parts.append(text[start:].strip())
+    return parts
+
+
+def split_entries(body: str) -> List[Tuple[str, str]]:
+    """(key, value) pairs of an object literal body ("a: 1, 'b': {...}")"""
+    entries = []
+    for entry in split_commas(body):
+        key, value = entry.split(":", 1)
+        entries.append((key.strip().strip("'\""), value.strip()))
+    return entries
+
+
+def _object_body(statement: str) -> str:
+    return statement[statement.index("{") + 1:statement.rindex("}")]
+
+
+def _call_arguments(text: str, pattern: str) -> Iterable[List[str]]:
+    """Argument lists of every call matching `pattern(`"""
+    for match in re.finditer(pattern + r"\s*\(", text):
+        depth, i, previous = 1, match.end(), "("
+        while i < len(text) and depth:
+            end = _skip_literal(text, i, previous)
+            if end is not None:
+                previous, i = text[end - 1], end
+                continue
+            depth += {"(": 1, ")": -1}.get(text[i], 0)
+            if not text[i].isspace():
+                previous = text[i]
+            i += 1
+        yield split_commas(text[match.end():i - 1])
+
+
+# ============================================================================
+# USAGE ANALYSIS
+# ============================================================================
+
+class PageUsage(NamedTuple):
+    """What a page reads from the shared scripts (None means "everything")"""
+    schemes: Optional[FrozenSet[str]]
+    keys: Optional[FrozenSet[str]]
+    easings: Optional[FrozenSet[str]]
+    identifiers: FrozenSet[str]    # Global names of the shared data/helpers used
+
+
+def _literal(argument: str) -> Optional[str]:
+    match = _LITERAL.match(argument)
+    return match.group(2) if match else None
+
+
+def analyze_usage(code: str, global_config: str = "") -> PageUsage:
+    """
+    Work out which schemes, color keys and easings page code can reach
+
+    Args:
+        code: The page's own JavaScript (inline scripts, handlers, local files)
+        global_config: Source of global-scheme-config.js when the page loads it
+    """
+    schemes, keys, easings = {DEFAULT_SCHEME}, set(), set()
+    all_schemes = all_keys = all_easings = False
+
+    def add(target: set, argument: Optional[str]) -> bool:
+        """Record a literal argument; False when it is not a literal"""
+        value = None if argument is None else _literal(argument)
+        if value is not None:
+            target.add(value)
+        return value is not None or argument is None
+
+    for text in (code, minify_js(global_config)):
+        for name in ("setScheme", "setElementScheme"):
+            for args in _call_arguments(text, rf"\.{name}"):
+                all_schemes |= not add(schemes, args[-1] if args else None)
+    for args in _call_arguments(code, r"\bstyleConfig\.getColor"):
+        all_keys |= not add(keys, args[0] if args else "")
+        all_schemes |= not add(schemes, args[1] if len(args) > 1 else None)
+    for args in _call_arguments(code, r"(?<![\w$.])(?:getColor|getTone)"):
+        all_schemes |= not add(schemes, args[0] if args else "")
+        all_keys |= not add(keys, args[1] if len(args) > 1 else "")
+    for args in _call_arguments(code, r"\bstyleConfig\.getColors"):
+        all_keys = True
+        all_schemes |= not add(schemes, args[0] if args else None)
+    if re.search(r"\b(COLOR_SCHEMES|COLOR_TONES|getAvailableSchemes)\b", code):
+        all_schemes = all_keys = True
+
+    uses_easing = re.search(r"\b(EASING_FUNCTIONS|getEasingFunction|applyEasing)\b", code)
+    if uses_easing:
+        easings.add("linear")    # the fallback of getEasingFunction()
+    for args in _call_arguments(code, r"(?<![\w$.])getEasingFunction"):
+        all_easings |= not add(easings, args[0] if args else "")
+    for args in _call_arguments(code, r"(?<![\w$.])applyEasing"):
+        all_easings |= not add(easings, args[3] if len(args) > 3 else None)
+    easings.update(re.findall(r"\bEASING_FUNCTIONS\.(\w+)", code))
+    for match in re.finditer(r"\bEASING_FUNCTIONS\s*\[([^\]]*)\]", code):
+        all_easings |= not add(easings, match.group(1))
+
+    identifiers = frozenset(re.findall(
+        r"(?<![\w$.])(getColor|getTone|hexToRgba|hexToRgb|COLOR_TONES|COLOR_TONE_KEYS|COLOR_TONE_LEVELS|"
+        r"EASING_FUNCTIONS|CSS_TIMING_FUNCTIONS|getEasingFunction|getCssTimingFunction|applyEasing)\b", code))
+    return PageUsage(
+        None if all_schemes else frozenset(schemes),
+        None if all_keys else frozenset(keys),
+        None if all_easings else frozenset(easings) if uses_easing else frozenset(),
+        identifiers,
+    )
+
+
+# ============================================================================
+# BUNDLE EMISSION
+# ============================================================================
+
+def _read(path: str) -> str:
+    with open(path, encoding="utf-8") as f:
+        return f.read()
+
+
+def _needed_declarations(declarations: Dict[str, str], roots: Iterable[str]) -> List[str]:
+    """Names of the declarations reachable from `roots`, in source order"""
+    needed, pending = set(), [name for name in roots if name in declarations]
+    while pending:
+        name = pending.pop()
+        if name in needed:
+            continue
+        needed.add(name)
+        pending.extend(other for other in declarations
+                       if other not in needed and re.search(rf"(?<![\w$.]){other}\b", declarations[name]))
+    return [name for name in declarations if name in needed]
+
+
+def _subset_object(statement: str, keep, transform=lambda value: value) -> str:
+    """Rewrite `const X = {...};` keeping only entries for which keep(key, value)"""
+    head = re.sub(r"\s*=\s*$", "=", statement[:statement.index("{")])
+    entries = [f"{key}:{transform(value)}" for key, value in split_entries(_object_body(statement))
+               if keep(key, value)]
+    return head + "{" + ",".join(entries) + "};"
+
+
+def color_data_js(source: str, usage: PageUsage) -> str:
+    """The used part of color-schemes.js"""
+    declarations = {declared_name(s): s for s in split_statements(minify_js(source)) if declared_name(s)}
+    schemes = usage.schemes
+    keys = usage.keys
+
+    def keep_scheme(name, _):
+        return schemes is None or name in schemes
+
+    def scheme_entry(value):
+        return "{" + ",".join(f"{k}:{v}" for k, v in split_entries(value[1:-1])
+                              if keys is None or k in keys) + "}"
+
+    parts = [_subset_object(declarations["COLOR_SCHEMES"], keep_scheme, scheme_entry)]
+    for name in _needed_declarations(declarations, usage.identifiers):
+        if name == "COLOR_SCHEMES":
+            continue
+        if name == "COLOR_TONES":
+            parts.append(_subset_object(declarations[name], keep_scheme))
+        else:
+            parts.append(declarations[name])
+    return "\n".join(parts)
+
+
+def easing_data_js(source: str, usage: PageUsage) -> str:
+    """The used easings (and their helpers) from easing_functions.js"""
+    if usage.easings is not None and not usage.easings and not usage.identifiers & EASING_API:
+        return ""
+    declarations = {declared_name(s): s for s in split_statements(minify_js(source)) if declared_name(s)}
+    functions = dict(split_entries(_object_body(declarations["EASING_FUNCTIONS"])))
+    names = set(functions) if usage.easings is None else set(usage.easings) & set(functions)
+    pending = list(names)
+    while pending:    # easings defined in terms of others (rushInto -> smooth)
+        for other in re.findall(r"\bEASING_FUNCTIONS\.(\w+)", functions[pending.pop()]):
+            if other in functions and other not in names:
+                names.add(other)
+                pending.append(other)
+    parts = ["const EASING_FUNCTIONS={" + ",".join(
+        f"{name}:{value}" for name, value in functions.items() if name in names) + "};"]
+    for name in _needed_declarations(declarations, usage.identifiers):
+        if name != "EASING_FUNCTIONS":
+            parts.append(declarations[name])
+    return "\n".join(parts)
+
+
+def page_code(html: str, page: str, root: str = SITE_ROOT) -> str:
+    """A page's own JavaScript: inline scripts, handler attributes and local scripts"""
+    directory = posixpath.dirname(page)
+    code = _INLINE_SCRIPT.findall(html)
+    for _, url in _SCRIPT_TAG.findall(html):
+        path = posixpath.normpath(posixpath.join(directory, unquote(url)))
+        if "//" not in url and path not in BUNDLED_SCRIPTS and os.path.isfile(os.path.join(root, path)):
+            code.append(_read(os.path.join(root, path)))
+    # Event handler attributes (onclick="...") also run page code
+    code.extend(re.findall(r"""\son\w+\s*=\s*"([^"]*)\"""", html))
+    return "\n".join(code)
+
+
+def bundle_page(html: str, page: str, root: str = SITE_ROOT) -> Tuple[str, Optional[str]]:
+    """
+    Build a page's bundle
+
+    Args:
+        html: Page source
+        page: Site-relative path of the page
+        root: Site root the shared scripts are read from
+
+    Returns:
+        (html, bundle): the page with the bundled script tags removed and a
+        `<!--bundle-->` marker where the first one was, and the minified
+        bundle holding data only from the scripts the page loads; (html,
+        None) when the page loads none of them
+    """
+    directory = posixpath.dirname(page)
+    loaded = []
+
+    def replace(match):
+        indent, _, _, url, newline = match.groups()
+        path = posixpath.normpath(posixpath.join(directory, unquote(url)))
+        if path not in BUNDLED_SCRIPTS:
+            return match.group(0)
+        loaded.append(path)
+        return f"{indent}<!--bundle-->{newline or ''}" if len(loaded) == 1 else ""
+
+    stripped = _SCRIPT_LINE.sub(replace, html)
+    if not loaded:
+        return html, None
+
+    global_config = _read(os.path.join(root, SHARED_SCRIPTS[2])) if SHARED_SCRIPTS[2] in loaded else ""
+    usage = analyze_usage(page_code(html, page, root), global_config)
+    parts = []
+    for path in BUNDLED_SCRIPTS:
+        if path not in loaded:
+            continue
+        source = _read(os.path.join(root, path))
+        if path == COLOR_SCRIPT:
+            parts.append(color_data_js(source, usage))
+        elif path == EASING_SCRIPT:
+            parts.append(easing_data_js(source, usage))
+        else:
+            parts.extend(s for s in split_statements(minify_js(source)) if "module.exports" not in s)
+    return stripped, "\n".join(part for part in parts if part) + "\n"
+
+
+def script_tag(bundle: str, src: Optional[str] = None) -> str:
+    """`<script src>` for an external bundle, or the bundle inlined"""
+    if src is not None:
+        return f'<script src="{src}"></script>'
+    return "<script>" + bundle.replace("</script", "<\\/script") + "</script>"
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Report the per-page script bundles")
+    parser.add_argument("pages", nargs="*", help="Site-relative pages (default: all)")
+    parser.add_argument("--show", action="store_true", help="Print each bundle")
+    args = parser.parse_args(argv)
+
+    from publish_site import PAGE_PATTERNS, site_files
+    pages = args.pages or site_files(SITE_ROOT, PAGE_PATTERNS)
+    shared = sum(os.path.getsize(os.path.join(SITE_ROOT, p)) for p in SHARED_SCRIPTS)
+    total = 0
+    for page in pages:
+        html = _read(os.path.join(SITE_ROOT, page))
+        _, bundle = bundle_page(html, page)
+        if bundle is None:
+            continue
+        usage = analyze_usage(page_code(html, page))
+        size = len(bundle.encode("utf-8"))
+        total += size
+        schemes = "all" if usage.schemes is None else ",".join(sorted(usage.schemes))
+        keys = "all" if usage.keys is None else len(usage.keys)
+        print(f"  {page:44} {size:7,} bytes  schemes: {schemes}  keys: {keys}")
+        if args.show:
+            print(bundle)
+    print(f"Shared scripts: {shared:,} bytes in {len(SHARED_SCRIPTS)} requests per page; "
+          f"bundles average {total // max(1, len(pages)):,} bytes in 1 request")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,171 +1,196 @@
-// Auto-generated color schemes for JavaScript use
-// Generated from unified_color_schemes.py
-
-const COLOR_SCHEMES = {
-  default: {
-    text_background: '#000000',
-    text: '#FFFFFF',
-    text_surrounding: '#000000',
-    background: '#000000',
-    highlight: '#FFFF00',
-    accent: '#58C4DD',
-    time: '#C55F73',
-    displacement: '#83C167',
-    dot: '#FC6255',
-    contrast_1: '#FF8C00',
-    contrast_2: '#00CED1'
-  },
-
-  dark_muted_pastels: {
-    text_background: '#2C2C2C',
-    text: '#E4E4E4',
-    text_surrounding: '#2C2C2C',
-    background: '#2C2C2C',
-    highlight: '#ABDADC',
-    accent: '#FFC1CC',
-    time: '#B39CD0',
-    displacement: '#B2DFDB',
-    dot: '#FF6B6B',
-    contrast_1: '#FFB74D',
-    contrast_2: '#81C784'
-  },
-
-  deep_jewel_tones: {
-    text_background: '#1a1a1a',
-    text: '#f0f0f0',
-    text_surrounding: '#1a1a1a',
-    background: '#1a1a1a',
-    highlight: '#004d61',
-    accent: '#822659',
-    time: '#3e5641',
-    displacement: '#90EE90',
-    dot: '#FF6B6B',
-    contrast_1: '#FFB74D',
-    contrast_2: '#9C27B0'
-  },
-
-  contrasting_vibrancy: {
-    text_background: '#181818',
-    text: '#f7f7f7',
-    text_surrounding: '#181818',
-    background: '#181818',
-    highlight: '#ff5722',
-    accent: '#673ab7',
-    time: '#ffeb3b',
-    displacement: '#009688',
-    dot: '#e91e63',
-    contrast_1: '#c2185b',
-    contrast_2: '#4caf50'
-  },
-
-  erau: {
-    text_background: '#03539E',
-    text: '#FFFFFF',
-    text_surrounding: '#FFCB06',
-    background: '#000000',
-    highlight: '#FFCB06',
-    accent: '#01B2E3',
-    time: '#FFE066',
-    displacement: '#90EE90',
-    dot: '#FF6B6B',
-    contrast_1: '#FF1493',
-    contrast_2: '#32CD32'
-  },
-
-  dark: {
-    text_background: '#000000',
-    text: '#E0E0E0',
-    text_surrounding: '#000000',
-    background: '#000000',
-    highlight: '#FF6B6B',
-    accent: '#4ECDC4',
-    time: '#45B7D1',
-    displacement: '#96CEB4',
-    dot: '#FECA57',
-    contrast_1: '#FF69B4',
-    contrast_2: '#00FA9A'
-  },
-
-  high_contrast: {
-    text_background: '#000000',
-    text: '#FFFFFF',
-    text_surrounding: '#000000',
-    background: '#000000',
-    highlight: '#FFFF00',
-    accent: '#00FFFF',
-    time: '#FF00FF',
-    displacement: '#00FF00',
-    dot: '#FF0000',
-    contrast_1: '#FFA500',
-    contrast_2: '#8A2BE2'
-  },
-
-  warm_sunset: {
-    text_background: '#1a0f0a',
-    text: '#fff8f0',
-    text_surrounding: '#2a1810',
-    background: '#1a0f0a',
-    highlight: '#ff6b35',
-    accent: '#f7931e',
-    time: '#fdc500',
-    displacement: '#c1666b',
-    dot: '#d62828',
-    contrast_1: '#fcbf49',
-    contrast_2: '#8b4513'
-  },
-
-  cool_ocean: {
-    text_background: '#0a1f2e',
-    text: '#e8f4f8',
-    text_surrounding: '#0a1f2e',
-    background: '#0a1f2e',
-    highlight: '#00d9ff',
-    accent: '#1e90ff',
-    time: '#40e0d0',
-    displacement: '#7fffd4',
-    dot: '#ff6b9d',
-    contrast_1: '#ff1493',
-    contrast_2: '#00fa9a'
-  },
-
-  forest_earth: {
-    text_background: '#1a2e1a',
-    text: '#f0f8f0',
-    text_surrounding: '#1a2e1a',
-    background: '#1a2e1a',
-    highlight: '#90ee90',
-    accent: '#8fbc8f',
-    time: '#daa520',
-    displacement: '#9acd32',
-    dot: '#dc143c',
-    contrast_1: '#ff8c00',
-    contrast_2: '#4682b4'
-  }
-};
-
-
-// Helper function to get a color from a scheme
-function getColor(schemeName, colorKey) {
-  return COLOR_SCHEMES[schemeName]?.[colorKey] || '#000000';
-}
-
-// Helper function to convert hex to RGB
-function hexToRgb(hex) {
-  const result = /^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i.exec(hex);
-  return result ? {
-    r: parseInt(result[1], 16),
-    g: parseInt(result[2], 16),
-    b: parseInt(result[3], 16)
-  } : null;
-}
-
-// Helper function to convert hex to RGBA string
-function hexToRgba(hex, alpha = 1.0) {
-  const rgb = hexToRgb(hex);
-  return rgb ? `rgba(${rgb.r}, ${rgb.g}, ${rgb.b}, ${alpha})` : 'rgba(0, 0, 0, 1)';
-}
-
-// Export for use in modules
-if (typeof module !== 'undefined' && module.exports) {
-  module.exports = { COLOR_SCHEMES, getColor, hexToRgb, hexToRgba };
-}
+// Auto-generated color schemes for JavaScript use
+// Generated from unified_color_schemes.py
+
+const COLOR_SCHEMES = {
+  contrasting_vibrancy: {
+    accent: '#673AB7',
+    background: '#181818',
+    contrast_1: '#C2185B',
+    contrast_2: '#4CAF50',
+    displacement: '#009688',
+    dot: '#E91E63',
+    highlight: '#FF5722',
+    text: '#F7F7F7',
+    text_background: '#181818',
+    text_surrounding: '#181818',
+    time: '#FFEB3B'
+  },
+
+  cool_ocean: {
+    accent: '#1E90FF',
+    background: '#0A1F2E',
+    contrast_1: '#FF1493',
+    contrast_2: '#00FA9A',
+    displacement: '#7FFFD4',
+    dot: '#FF6B9D',
+    highlight: '#00D9FF',
+    text: '#E8F4F8',
+    text_background: '#0A1F2E',
+    text_surrounding: '#0A1F2E',
+    time: '#40E0D0'
+  },
+
+  dark: {
+    accent: '#4ECDC4',
+    background: '#000000',
+    contrast_1: '#FF69B4',
+    contrast_2: '#00FA9A',
+    displacement: '#96CEB4',
+    dot: '#FECA57',
+    highlight: '#FF6B6B',
+    text: '#E0E0E0',
+    text_background: '#000000',
+    text_surrounding: '#000000',
+    time: '#45B7D1'
+  },
+
+  dark_muted_pastels: {
+    accent: '#FFC1CC',
+    background: '#2C2C2C',
+    contrast_1: '#FFB74D',
+    contrast_2: '#81C784',
+    displacement: '#B2DFDB',
+    dot: '#FF6B6B',
+    highlight: '#ABDADC',
+    text: '#E4E4E4',
+    text_background: '#2C2C2C',
+    text_surrounding: '#2C2C2C',
+    time: '#B39CD0'
+  },
+
+  deep_jewel_tones: {
+    accent: '#822659',
+    background: '#1A1A1A',
+    contrast_1: '#FFB74D',
+    contrast_2: '#9C27B0',
+    displacement: '#90EE90',
+    dot: '#FF6B6B',
+    highlight: '#004D61',
+    text: '#F0F0F0',
+    text_background: '#1A1A1A',
+    text_surrounding: '#1A1A1A',
+    time: '#3E5641'
+  },
+
+  default: {
+    accent: '#58C4DD',
+    background: '#000000',
+    contrast_1: '#FF8C00',
+    contrast_2: '#00CED1',
+    displacement: '#83C167',
+    dot: '#FC6255',
+    highlight: '#FFFF00',
+    text: '#FFFFFF',
+    text_background: '#000000',
+    text_surrounding: '#000000',
+    time: '#C55F73'
+  },
+
+  erau: {
+    accent: '#01B2E3',
+    background: '#000000',
+    contrast_1: '#FF1493',
+    contrast_2: '#32CD32',
+    displacement: '#90EE90',
+    dot: '#FF6B6B',
+    highlight: '#FFCB06',
+    text: '#FFFFFF',
+    text_background: '#03539E',
+    text_surrounding: '#FFCB06',
+    time: '#FFE066'
+  },
+
+  forest_earth: {
+    accent: '#8FBC8F',
+    background: '#1A2E1A',
+    contrast_1: '#FF8C00',
+    contrast_2: '#4682B4',
+    displacement: '#9ACD32',
+    dot: '#DC143C',
+    highlight: '#90EE90',
+    text: '#F0F8F0',
+    text_background: '#1A2E1A',
+    text_surrounding: '#1A2E1A',
+    time: '#DAA520'
+  },
+
+  high_contrast: {
+    accent: '#00FFFF',
+    background: '#000000',
+    contrast_1: '#FFA500',
+    contrast_2: '#8A2BE2',
+    displacement: '#00FF00',
+    dot: '#FF0000',
+    highlight: '#FFFF00',
+    text: '#FFFFFF',
+    text_background: '#000000',
+    text_surrounding: '#000000',
+    time: '#FF00FF'
+  },
+
+  warm_sunset: {
+    accent: '#F7931E',
+    background: '#1A0F0A',
+    contrast_1: '#FCBF49',
+    contrast_2: '#8B4513',
+    displacement: '#C1666B',
+    dot: '#D62828',
+    highlight: '#FF6B35',
+    text: '#FFF8F0',
+    text_background: '#1A0F0A',
+    text_surrounding: '#2A1810',
+    time: '#FDC500'
+  }
+};
+
+const COLOR_TONE_KEYS = ['accent', 'background', 'contrast_1', 'contrast_2', 'displacement', 'dot', 'highlight', 'text', 'text_background', 'text_surrounding', 'time'];
+const COLOR_TONE_LEVELS = [100, 200, 300, 400, 500, 600, 700, 800, 900];
+const COLOR_TONES = {
+  contrasting_vibrancy: new Uint8ClampedArray([245, 243, 255, 255, 208, 194, 255, 255, 171, 149, 233, 255, 135, 105, 209, 255, 103, 58, 183, 255, 81, 38, 151, 255, 61, 15, 120, 255, 40, 0, 87, 255, 20, 0, 49, 255, 245, 245, 245, 255, 183, 183, 183, 255, 125, 125, 125, 255, 71, 71, 71, 255, 24, 24, 24, 255, 16, 16, 16, 255, 9, 9, 9, 255, 4, 4, 4, 255, 1, 1, 1, 255, 255, 241, 243, 255, 255, 188, 201, 255, 243, 137, 162, 255, 220, 89, 126, 255, 194, 24, 91, 255, 156, 0, 69, 255, 116, 0, 50, 255, 78, 0, 31, 255, 43, 0, 14, 255, 226, 254, 225, 255, 190, 235, 189, 255, 154, 215, 153, 255, 117, 195, 117, 255, 76, 175, 80, 255, 48, 139, 53, 255, 15, 105, 26, 255, 0, 71, 10, 255, 0, 39, 3, 255, 222, 253, 247, 255, 178, 227, 218, 255, 134, 201, 190, 255, 85, 175, 163, 255, 0, 150, 136, 255, 0, 117, 106, 255, 0, 86, 78, 255, 0, 57, 51, 255, 0, 30, 26, 255, 255, 241, 243, 255, 255, 198, 205, 255, 255, 150, 168, 255, 251, 96, 131, 255, 233, 30, 99, 255, 188, 0, 75, 255, 140, 0, 54, 255, 95, 0, 34, 255, 54, 0, 16, 255, 255, 242, 238, 255, 255, 209, 196, 255, 255, 175, 152, 255, 255, 136, 103, 255, 255, 87, 34, 255, 207, 59, 0, 255, 155, 42, 0, 255, 106, 25, 0, 255, 60, 11, 0, 255, 247, 247, 247, 255, 247, 247, 247, 255, 247, 247, 247, 255, 247, 247, 247, 255, 247, 247, 247, 255, 195, 195, 195, 255, 146, 146, 146, 255, 99, 99, 99, 255, 56, 56, 56, 255, 245, 245, 245, 255, 183, 183, 183, 255, 125, 125, 125, 255, 71, 71, 71, 255, 24, 24, 24, 255, 16, 16, 16, 255, 9, 9, 9, 255, 4, 4, 4, 255, 1, 1, 1, 255, 245, 245, 245, 255, 183, 183, 183, 255, 125, 125, 125, 255, 71, 71, 71, 255, 24, 24, 24, 255, 16, 16, 16, 255, 9, 9, 9, 255, 4, 4, 4, 255, 1, 1, 1, 255, 252, 247, 206, 255, 252, 245, 177, 255, 253, 242, 147, 255, 254, 239, 111, 255, 255, 235, 59, 255, 203, 185, 0, 255, 152, 138, 0, 255, 104, 94, 0, 255, 59, 53, 0, 255]),
+  cool_ocean: new Uint8ClampedArray([239, 246, 255, 255, 194, 222, 255, 255, 148, 197, 255, 255, 99, 171, 255, 255, 30, 144, 255, 255, 0, 112, 207, 255, 0, 82, 155, 255, 0, 54, 106, 255, 0, 28, 60, 255, 239, 246, 253, 255, 175, 187, 196, 255, 115, 131, 143, 255, 60, 78, 92, 255, 10, 31, 46, 255, 4, 22, 35, 255, 1, 14, 25, 255, 0, 6, 15, 255, 0, 2, 5, 255, 255, 241, 245, 255, 255, 202, 220, 255, 255, 161, 195, 255, 255, 112, 171, 255, 255, 20, 147, 255, 203, 0, 115, 255, 152, 0, 85, 255, 104, 0, 56, 255, 59, 0, 29, 255, 221, 255, 233, 255, 188, 255, 213, 255, 147, 255, 192, 255, 103, 253, 173, 255, 0, 250, 154, 255, 0, 198, 121, 255, 0, 148, 89, 255, 0, 100, 59, 255, 0, 57, 31, 255, 221, 254, 241, 255, 201, 255, 233, 255, 179, 255, 226, 255, 155, 255, 219, 255, 127, 255, 212, 255, 86, 204, 166, 255, 42, 155, 122, 255, 0, 107, 81, 255, 0, 61, 45, 255, 255, 241, 244, 255, 255, 211, 222, 255, 255, 180, 200, 255, 255, 147, 179, 255, 255, 107, 157, 255, 208, 75, 122, 255, 162, 44, 89, 255, 118, 7, 58, 255, 69, 0, 31, 255, 229, 249, 255, 255, 194, 242, 255, 255, 155, 234, 255, 255, 108, 226, 255, 255, 0, 217, 255, 255, 0, 171, 202, 255, 0, 127, 151, 255, 0, 86, 103, 255, 0, 48, 58, 255, 242, 246, 247, 255, 240, 245, 247, 255, 237, 245, 247, 255, 235, 244, 248, 255, 232, 244, 248, 255, 182, 193, 196, 255, 135, 144, 147, 255, 91, 98, 101, 255, 50, 56, 58, 255, 239, 246, 253, 255, 175, 187, 196, 255, 115, 131, 143, 255, 60, 78, 92, 255, 10, 31, 46, 255, 4, 22, 35, 255, 1, 14, 25, 255, 0, 6, 15, 255, 0, 2, 5, 255, 239, 246, 253, 255, 175, 187, 196, 255, 115, 131, 143, 255, 60, 78, 92, 255, 10, 31, 46, 255, 4, 22, 35, 255, 1, 14, 25, 255, 0, 6, 15, 255, 0, 2, 5, 255, 217, 254, 249, 255, 187, 247, 238, 255, 154, 240, 228, 255, 116, 232, 218, 255, 64, 224, 208, 255, 3, 179, 165, 255, 0, 133, 123, 255, 0, 90, 83, 255, 0, 51, 46, 255]),
+  dark: new Uint8ClampedArray([221, 253, 249, 255, 190, 241, 236, 255, 157, 229, 222, 255, 121, 217, 209, 255, 78, 205, 196, 255, 41, 163, 155, 255, 0, 123, 116, 255, 0, 83, 78, 255, 0, 46, 43, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 241, 246, 255, 255, 211, 229, 255, 255, 180, 212, 255, 255, 146, 196, 255, 255, 105, 180, 255, 208, 73, 142, 255, 162, 41, 107, 255, 118, 2, 73, 255, 68, 0, 40, 255, 221, 255, 233, 255, 188, 255, 213, 255, 147, 255, 192, 255, 103, 253, 173, 255, 0, 250, 154, 255, 0, 198, 121, 255, 0, 148, 89, 255, 0, 100, 59, 255, 0, 57, 31, 255, 233, 250, 241, 255, 213, 239, 226, 255, 192, 228, 210, 255, 171, 217, 195, 255, 150, 206, 180, 255, 113, 163, 140, 255, 78, 123, 103, 255, 45, 84, 68, 255, 13, 49, 35, 255, 255, 244, 222, 255, 255, 234, 192, 255, 255, 224, 160, 255, 255, 213, 125, 255, 254, 202, 87, 255, 204, 158, 49, 255, 156, 116, 0, 255, 107, 78, 0, 255, 61, 43, 0, 255, 255, 242, 240, 255, 255, 212, 209, 255, 255, 181, 176, 255, 255, 147, 143, 255, 255, 107, 107, 255, 208, 76, 78, 255, 163, 45, 50, 255, 119, 8, 23, 255, 70, 0, 8, 255, 245, 245, 245, 255, 240, 240, 240, 255, 234, 234, 234, 255, 229, 229, 229, 255, 224, 224, 224, 255, 177, 177, 177, 255, 132, 132, 132, 255, 89, 89, 89, 255, 50, 50, 50, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 229, 249, 255, 255, 188, 234, 247, 255, 152, 217, 234, 255, 114, 200, 222, 255, 69, 183, 209, 255, 35, 145, 168, 255, 0, 108, 128, 255, 0, 73, 86, 255, 0, 40, 48, 255]),
+  dark_muted_pastels: new Uint8ClampedArray([255, 241, 243, 255, 255, 229, 233, 255, 255, 217, 224, 255, 255, 205, 214, 255, 255, 193, 204, 255, 205, 150, 160, 255, 157, 109, 118, 255, 111, 71, 79, 255, 68, 36, 43, 255, 245, 245, 245, 255, 190, 190, 190, 255, 137, 137, 137, 255, 89, 89, 89, 255, 44, 44, 44, 255, 32, 32, 32, 255, 21, 21, 21, 255, 11, 11, 11, 255, 4, 4, 4, 255, 255, 243, 228, 255, 255, 229, 196, 255, 255, 214, 162, 255, 255, 199, 124, 255, 255, 183, 77, 255, 206, 142, 40, 255, 157, 104, 0, 255, 107, 69, 0, 255, 61, 38, 0, 255, 231, 252, 231, 255, 206, 239, 206, 255, 180, 226, 181, 255, 155, 212, 157, 255, 129, 199, 132, 255, 95, 158, 99, 255, 63, 119, 67, 255, 32, 82, 37, 255, 1, 48, 8, 255, 235, 248, 247, 255, 221, 242, 240, 255, 207, 236, 233, 255, 192, 229, 226, 255, 178, 223, 219, 255, 137, 177, 173, 255, 97, 133, 130, 255, 60, 91, 89, 255, 26, 52, 51, 255, 255, 242, 240, 255, 255, 212, 209, 255, 255, 181, 176, 255, 255, 147, 143, 255, 255, 107, 107, 255, 208, 76, 78, 255, 163, 45, 50, 255, 119, 8, 23, 255, 70, 0, 8, 255, 234, 248, 249, 255, 219, 241, 242, 255, 203, 233, 234, 255, 187, 226, 227, 255, 171, 218, 220, 255, 131, 173, 175, 255, 92, 129, 131, 255, 56, 89, 90, 255, 23, 51, 52, 255, 245, 245, 245, 255, 241, 241, 241, 255, 236, 236, 236, 255, 232, 232, 232, 255, 228, 228, 228, 255, 180, 180, 180, 255, 134, 134, 134, 255, 91, 91, 91, 255, 51, 51, 51, 255, 245, 245, 245, 255, 190, 190, 190, 255, 137, 137, 137, 255, 89, 89, 89, 255, 44, 44, 44, 255, 32, 32, 32, 255, 21, 21, 21, 255, 11, 11, 11, 255, 4, 4, 4, 255, 245, 245, 245, 255, 190, 190, 190, 255, 137, 137, 137, 255, 89, 89, 89, 255, 44, 44, 44, 255, 32, 32, 32, 255, 21, 21, 21, 255, 11, 11, 11, 255, 4, 4, 4, 255, 248, 242, 255, 255, 231, 220, 246, 255, 213, 198, 233, 255, 196, 177, 221, 255, 179, 156, 208, 255, 142, 121, 167, 255, 106, 88, 128, 255, 72, 56, 91, 255, 41, 28, 56, 255]),
+  deep_jewel_tones: new Uint8ClampedArray([255, 241, 247, 255, 235, 184, 206, 255, 200, 135, 165, 255, 166, 87, 126, 255, 130, 38, 89, 255, 105, 21, 69, 255, 81, 3, 51, 255, 54, 0, 32, 255, 28, 0, 14, 255, 245, 245, 245, 255, 184, 184, 184, 255, 126, 126, 126, 255, 73, 73, 73, 255, 26, 26, 26, 255, 18, 18, 18, 255, 10, 10, 10, 255, 5, 5, 5, 255, 1, 1, 1, 255, 255, 243, 228, 255, 255, 229, 196, 255, 255, 214, 162, 255, 255, 199, 124, 255, 255, 183, 77, 255, 206, 142, 40, 255, 157, 104, 0, 255, 107, 69, 0, 255, 61, 38, 0, 255, 253, 240, 255, 255, 239, 186, 249, 255, 212, 141, 225, 255, 184, 94, 201, 255, 156, 39, 176, 255, 126, 11, 144, 255, 94, 0, 108, 255, 63, 0, 73, 255, 34, 0, 40, 255, 227, 254, 226, 255, 207, 250, 206, 255, 187, 247, 186, 255, 166, 242, 165, 255, 144, 238, 144, 255, 105, 190, 106, 255, 68, 144, 70, 255, 30, 100, 35, 255, 0, 58, 6, 255, 255, 242, 240, 255, 255, 212, 209, 255, 255, 181, 176, 255, 255, 147, 143, 255, 255, 107, 107, 255, 208, 76, 78, 255, 163, 45, 50, 255, 119, 8, 23, 255, 70, 0, 8, 255, 232, 248, 255, 255, 175, 203, 214, 255, 121, 159, 174, 255, 68, 117, 135, 255, 0, 77, 97, 255, 0, 59, 75, 255, 0, 42, 54, 255, 0, 25, 34, 255, 0, 10, 16, 255, 245, 245, 245, 255, 244, 244, 244, 255, 242, 242, 242, 255, 241, 241, 241, 255, 240, 240, 240, 255, 189, 189, 189, 255, 141, 141, 141, 255, 96, 96, 96, 255, 54, 54, 54, 255, 245, 245, 245, 255, 184, 184, 184, 255, 126, 126, 126, 255, 73, 73, 73, 255, 26, 26, 26, 255, 18, 18, 18, 255, 10, 10, 10, 255, 5, 5, 5, 255, 1, 1, 1, 255, 245, 245, 245, 255, 184, 184, 184, 255, 126, 126, 126, 255, 73, 73, 73, 255, 26, 26, 26, 255, 18, 18, 18, 255, 10, 10, 10, 255, 5, 5, 5, 255, 1, 1, 1, 255, 239, 248, 240, 255, 192, 205, 193, 255, 146, 163, 148, 255, 103, 124, 105, 255, 62, 86, 65, 255, 45, 67, 48, 255, 29, 48, 32, 255, 14, 31, 17, 255, 3, 15, 4, 255]),
+  default: new Uint8ClampedArray([229, 249, 255, 255, 192, 237, 249, 255, 160, 224, 240, 255, 126, 210, 231, 255, 88, 196, 221, 255, 54, 155, 178, 255, 13, 117, 136, 255, 0, 79, 93, 255, 0, 44, 53, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 242, 234, 255, 255, 219, 193, 255, 255, 195, 149, 255, 255, 169, 99, 255, 255, 140, 0, 255, 202, 109, 0, 255, 151, 80, 0, 255, 103, 53, 0, 255, 58, 27, 0, 255, 216, 254, 254, 255, 180, 242, 243, 255, 142, 230, 231, 255, 96, 218, 220, 255, 0, 206, 209, 255, 0, 162, 165, 255, 0, 121, 122, 255, 0, 81, 83, 255, 0, 45, 46, 255, 233, 252, 225, 255, 207, 237, 195, 255, 182, 223, 165, 255, 156, 208, 134, 255, 131, 193, 103, 255, 98, 153, 72, 255, 67, 115, 42, 255, 37, 79, 11, 255, 15, 44, 0, 255, 255, 242, 240, 255, 255, 210, 203, 255, 255, 177, 166, 255, 255, 140, 126, 255, 252, 98, 85, 255, 206, 67, 58, 255, 161, 36, 31, 255, 118, 0, 4, 255, 68, 0, 1, 255, 247, 250, 201, 255, 249, 252, 172, 255, 251, 253, 139, 255, 253, 254, 98, 255, 255, 255, 0, 255, 202, 202, 0, 255, 151, 151, 0, 255, 103, 103, 0, 255, 58, 58, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 202, 202, 202, 255, 151, 151, 151, 255, 103, 103, 103, 255, 58, 58, 58, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 241, 243, 255, 254, 199, 207, 255, 236, 165, 175, 255, 217, 130, 145, 255, 197, 95, 115, 255, 160, 69, 88, 255, 124, 44, 62, 255, 89, 19, 38, 255, 55, 0, 17, 255]),
+  erau: new Uint8ClampedArray([233, 248, 255, 255, 182, 233, 255, 255, 138, 215, 247, 255, 91, 197, 237, 255, 1, 178, 227, 255, 0, 140, 179, 255, 0, 103, 133, 255, 0, 69, 91, 255, 0, 38, 51, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 241, 245, 255, 255, 202, 220, 255, 255, 161, 195, 255, 255, 112, 171, 255, 255, 20, 147, 255, 203, 0, 115, 255, 152, 0, 85, 255, 104, 0, 56, 255, 59, 0, 29, 255, 225, 255, 222, 255, 184, 245, 179, 255, 147, 232, 141, 255, 106, 219, 101, 255, 50, 205, 50, 255, 0, 163, 11, 255, 0, 121, 6, 255, 0, 82, 3, 255, 0, 46, 1, 255, 227, 254, 226, 255, 207, 250, 206, 255, 187, 247, 186, 255, 166, 242, 165, 255, 144, 238, 144, 255, 105, 190, 106, 255, 68, 144, 70, 255, 30, 100, 35, 255, 0, 58, 6, 255, 255, 242, 240, 255, 255, 212, 209, 255, 255, 181, 176, 255, 255, 147, 143, 255, 255, 107, 107, 255, 208, 76, 78, 255, 163, 45, 50, 255, 119, 8, 23, 255, 70, 0, 8, 255, 255, 245, 217, 255, 255, 235, 182, 255, 255, 225, 144, 255, 255, 214, 98, 255, 255, 203, 6, 255, 202, 160, 0, 255, 151, 119, 0, 255, 103, 80, 0, 255, 58, 44, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 202, 202, 202, 255, 151, 151, 151, 255, 103, 103, 103, 255, 58, 58, 58, 255, 239, 246, 255, 255, 173, 205, 245, 255, 121, 164, 216, 255, 69, 123, 187, 255, 3, 83, 158, 255, 0, 64, 125, 255, 0, 45, 92, 255, 0, 28, 61, 255, 0, 12, 33, 255, 255, 245, 217, 255, 255, 235, 182, 255, 255, 225, 144, 255, 255, 214, 98, 255, 255, 203, 6, 255, 202, 160, 0, 255, 151, 119, 0, 255, 103, 80, 0, 255, 58, 44, 0, 255, 254, 246, 213, 255, 254, 241, 188, 255, 254, 235, 163, 255, 255, 230, 134, 255, 255, 224, 102, 255, 204, 176, 63, 255, 155, 131, 15, 255, 107, 88, 0, 255, 61, 50, 0, 255]),
+  forest_earth: new Uint8ClampedArray([236, 250, 235, 255, 212, 234, 212, 255, 189, 219, 189, 255, 166, 203, 166, 255, 143, 188, 143, 255, 109, 149, 109, 255, 76, 112, 77, 255, 46, 76, 46, 255, 17, 44, 19, 255, 240, 248, 240, 255, 181, 193, 180, 255, 125, 140, 125, 255, 73, 91, 73, 255, 26, 46, 26, 255, 17, 34, 17, 255, 8, 23, 8, 255, 2, 13, 2, 255, 0, 5, 0, 255, 255, 242, 234, 255, 255, 219, 193, 255, 255, 195, 149, 255, 255, 169, 99, 255, 255, 140, 0, 255, 202, 109, 0, 255, 151, 80, 0, 255, 103, 53, 0, 255, 58, 27, 0, 255, 237, 246, 255, 255, 189, 218, 244, 255, 149, 188, 222, 255, 110, 159, 201, 255, 70, 130, 180, 255, 47, 102, 146, 255, 24, 74, 113, 255, 0, 48, 82, 255, 0, 25, 46, 255, 235, 253, 213, 255, 214, 241, 178, 255, 194, 229, 142, 255, 174, 217, 102, 255, 154, 205, 50, 255, 118, 163, 0, 255, 87, 121, 0, 255, 58, 82, 0, 255, 30, 45, 0, 255, 255, 241, 241, 255, 255, 195, 193, 255, 255, 143, 144, 255, 241, 92, 101, 255, 220, 20, 60, 255, 176, 0, 43, 255, 131, 0, 30, 255, 89, 0, 17, 255, 50, 0, 6, 255, 227, 254, 226, 255, 207, 250, 206, 255, 187, 247, 186, 255, 166, 242, 165, 255, 144, 238, 144, 255, 105, 190, 106, 255, 68, 144, 70, 255, 30, 100, 35, 255, 0, 58, 6, 255, 244, 246, 244, 255, 243, 247, 243, 255, 242, 247, 242, 255, 241, 248, 241, 255, 240, 248, 240, 255, 189, 196, 189, 255, 141, 147, 141, 255, 95, 100, 95, 255, 53, 57, 53, 255, 240, 248, 240, 255, 181, 193, 180, 255, 125, 140, 125, 255, 73, 91, 73, 255, 26, 46, 26, 255, 17, 34, 17, 255, 8, 23, 8, 255, 2, 13, 2, 255, 0, 5, 0, 255, 240, 248, 240, 255, 181, 193, 180, 255, 125, 140, 125, 255, 73, 91, 73, 255, 26, 46, 26, 255, 17, 34, 17, 255, 8, 23, 8, 255, 2, 13, 2, 255, 0, 5, 0, 255, 255, 244, 222, 255, 249, 224, 174, 255, 239, 204, 135, 255, 229, 185, 93, 255, 218, 165, 32, 255, 174, 129, 0, 255, 129, 95, 0, 255, 87, 63, 0, 255, 49, 34, 0, 255]),
+  high_contrast: new Uint8ClampedArray([212, 255, 254, 255, 185, 255, 254, 255, 153, 255, 254, 255, 110, 255, 254, 255, 0, 255, 255, 255, 0, 202, 202, 255, 0, 151, 151, 255, 0, 103, 103, 255, 0, 58, 58, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 243, 230, 255, 255, 225, 191, 255, 255, 206, 149, 255, 255, 186, 100, 255, 255, 165, 0, 255, 202, 129, 0, 255, 151, 96, 0, 255, 103, 64, 0, 255, 58, 34, 0, 255, 247, 243, 255, 255, 218, 197, 255, 255, 192, 149, 255, 255, 165, 101, 244, 255, 138, 43, 226, 255, 111, 9, 188, 255, 82, 0, 142, 255, 54, 0, 96, 255, 28, 0, 55, 255, 225, 255, 222, 255, 196, 255, 191, 255, 162, 255, 155, 255, 117, 255, 109, 255, 0, 255, 0, 255, 0, 202, 0, 255, 0, 151, 0, 255, 0, 103, 0, 255, 0, 58, 0, 255, 255, 242, 239, 255, 255, 203, 194, 255, 255, 160, 146, 255, 255, 110, 93, 255, 255, 0, 0, 255, 202, 0, 0, 255, 151, 0, 0, 255, 103, 0, 0, 255, 58, 0, 0, 255, 247, 250, 201, 255, 249, 252, 172, 255, 251, 253, 139, 255, 253, 254, 98, 255, 255, 255, 0, 255, 202, 202, 0, 255, 151, 151, 0, 255, 103, 103, 0, 255, 58, 58, 0, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 255, 202, 202, 202, 255, 151, 151, 151, 255, 103, 103, 103, 255, 58, 58, 58, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 245, 245, 245, 255, 167, 167, 167, 255, 95, 95, 95, 255, 32, 32, 32, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 0, 0, 0, 255, 255, 240, 254, 255, 255, 203, 252, 255, 255, 163, 251, 255, 255, 114, 252, 255, 255, 0, 255, 255, 202, 0, 202, 255, 151, 0, 151, 255, 103, 0, 103, 255, 58, 0, 58, 255]),
+  warm_sunset: new Uint8ClampedArray([255, 243, 232, 255, 255, 220, 190, 255, 255, 196, 144, 255, 254, 171, 92, 255, 247, 147, 30, 255, 197, 114, 0, 255, 147, 83, 0, 255, 100, 55, 0, 255, 57, 29, 0, 255, 249, 244, 242, 255, 187, 179, 176, 255, 129, 119, 114, 255, 74, 63, 58, 255, 26, 15, 10, 255, 19, 9, 5, 255, 12, 4, 2, 255, 6, 2, 1, 255, 2, 0, 0, 255, 255, 244, 225, 255, 255, 231, 191, 255, 255, 218, 155, 255, 255, 204, 115, 255, 252, 191, 73, 255, 203, 149, 34, 255, 154, 109, 0, 255, 105, 73, 0, 255, 60, 40, 0, 255, 255, 242, 235, 255, 234, 195, 173, 255, 202, 152, 123, 255, 171, 110, 74, 255, 139, 69, 19, 255, 112, 50, 0, 255, 82, 35, 0, 255, 54, 21, 0, 255, 28, 8, 0, 255, 255, 241, 241, 255, 251, 202, 203, 255, 232, 168, 170, 255, 213, 135, 138, 255, 193, 102, 107, 255, 156, 75, 81, 255, 121, 50, 56, 255, 87, 26, 32, 255, 54, 2, 11, 255, 255, 242, 240, 255, 255, 195, 187, 255, 254, 144, 132, 255, 235, 98, 88, 255, 214, 40, 40, 255, 175, 2, 17, 255, 131, 0, 9, 255, 89, 0, 4, 255, 50, 0, 1, 255, 255, 242, 238, 255, 255, 212, 198, 255, 255, 181, 157, 255, 255, 147, 111, 255, 255, 107, 53, 255, 208, 76, 21, 255, 159, 51, 0, 255, 108, 32, 0, 255, 62, 14, 0, 255, 251, 249, 246, 255, 252, 249, 245, 255, 253, 248, 243, 255, 254, 248, 242, 255, 255, 248, 240, 255, 202, 196, 189, 255, 152, 146, 140, 255, 104, 99, 94, 255, 60, 56, 52, 255, 249, 244, 242, 255, 187, 179, 176, 255, 129, 119, 114, 255, 74, 63, 58, 255, 26, 15, 10, 255, 19, 9, 5, 255, 12, 4, 2, 255, 6, 2, 1, 255, 2, 0, 0, 255, 251, 243, 240, 255, 194, 182, 177, 255, 140, 125, 118, 255, 89, 71, 64, 255, 42, 24, 16, 255, 32, 16, 9, 255, 22, 8, 4, 255, 13, 3, 1, 255, 5, 1, 0, 255, 255, 244, 219, 255, 255, 233, 182, 255, 255, 222, 141, 255, 255, 209, 91, 255, 253, 197, 0, 255, 200, 155, 0, 255, 149, 115, 0, 255, 102, 77, 0, 255, 58, 43, 0, 255])
+};
+
+
+// Helper function to get a color from a scheme
+function getColor(schemeName, colorKey) {
+  return COLOR_SCHEMES[schemeName]?.[colorKey] || '#000000';
+}
+
+// Helper function to get a tint/shade (e.g. level 300) as a hex string
+function getTone(schemeName, colorKey, level) {
+  const tones = COLOR_TONES[schemeName];
+  const k = COLOR_TONE_KEYS.indexOf(colorKey);
+  const l = COLOR_TONE_LEVELS.indexOf(level);
+  if (!tones || k < 0 || l < 0) return '#000000';
+  const i = (k * COLOR_TONE_LEVELS.length + l) * 4;
+  return '#' + Array.from(tones.subarray(i, i + 3), v => v.toString(16).padStart(2, '0')).join('').toUpperCase();
+}
+
+// Helper function to convert hex to RGB
+function hexToRgb(hex) {
+  const result = /^#?([a-f\d]{2})([a-f\d]{2})([a-f\d]{2})$/i.exec(hex);
+  return result ? {
+    r: parseInt(result[1], 16),
+    g: parseInt(result[2], 16),
+    b: parseInt(result[3], 16)
+  } : null;
+}
+
+// Helper function to convert hex to RGBA string
+function hexToRgba(hex, alpha = 1.0) {
+  const rgb = hexToRgb(hex);
+  return rgb ? `rgba(${rgb.r}, ${rgb.g}, ${rgb.b}, ${alpha})` : 'rgba(0, 0, 0, 1)';
+}
+
+// Export for use in modules
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = { COLOR_SCHEMES, COLOR_TONES, COLOR_TONE_KEYS, COLOR_TONE_LEVELS, getColor, getTone, hexToRgb, hexToRgba };
+}
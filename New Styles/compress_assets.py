@@ -0,0 +1,272 @@
+"""
+Minified and Precompressed Static Assets
+=========================================
+
+Compresses text assets once at build time so the server can send the
+stored bytes with `Content-Encoding` instead of compressing per request:
+
+- minify(): CSS, JavaScript and JSON minification (comments and
+  insignificant whitespace only; JavaScript keeps its line breaks)
+- `.gz` siblings at maximum compression; with the optional `zopfli`
+  package, zopfli's iterated deflate (same format, 3-8% smaller)
+- `.br` siblings when the optional `brotli` (or `brotlicffi`) package is
+  installed
+- A size report that compares every file with the previous run
+
+Compressed files are deterministic (no timestamps), are only regenerated
+when their source is newer, and are skipped when they would not be smaller.
+
+Usage:
+    python compress_assets.py                       # precompress ../dist
+    python compress_assets.py some/dir --min-size 512
+    python compress_assets.py --minify ../css/color-schemes.css
+
+Version: 1.0
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+from typing import Dict, List, NamedTuple, Optional
+
+from bundle_pages import minify_js
+
+try:
+    import zopfli.gzip
+except ImportError:    # gzip level 9 is the fallback
+    zopfli = None
+
+try:
+    import brotli
+except ImportError:
+    try:
+        import brotlicffi as brotli
+    except ImportError:    # .br files are optional
+        brotli = None
+
+
+COMPRESSIBLE_EXTENSIONS = (".html", ".css", ".js", ".json", ".svg", ".md", ".txt")
+
+COMPRESSED_SUFFIXES = (".gz", ".br")
+
+MIN_SIZE = 256              # Smaller files are not worth a Content-Encoding
+
+ZOPFLI_ITERATIONS = 15
+
+REPORT_NAME = ".compress-report.json"
+
+
+# ============================================================================
+# MINIFICATION
+# ============================================================================
+
+_CSS_STRING = re.compile(r"""("(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')""")
+
+
+def minify_css(source: str) -> str:
+    """Strip comments and insignificant whitespace (strings are kept as is)"""
+    source = re.sub(r"/\*.*?\*/", "", source, flags=re.S)
+    pieces = _CSS_STRING.split(source)
+    for i in range(0, len(pieces), 2):    # odd pieces are string literals
+        text = re.sub(r"\s+", " ", pieces[i])
+        text = re.sub(r"\s*([{};,])\s*", r"\1", text)
+        # "prop : value" -> "prop:value" (only declarations, so selectors
+        # such as "a :hover" keep their descendant combinator)
+        text = re.sub(r"([{;])([\w-]+)\s*:\s*(?=[^{}]*[;}])", r"\1\2:", text)
+        pieces[i] = text.replace(";}", "}")
+    return "".join(pieces).strip()
+
+
+def minify_json(source: str) -> str:
+    return json.dumps(json.loads(source), separators=(",", ":"), ensure_ascii=False)
+
+
+_MINIFIERS = {".css": minify_css, ".js": minify_js, ".json": minify_json}
+
+
+def minify(path: str, data: bytes) -> bytes:
+    """Minified bytes for a CSS/JS/JSON file (other files are returned unchanged)"""
+    minifier = _MINIFIERS.get(os.path.splitext(path)[1].lower())
+    if minifier is None:
+        return data
+    return minifier(data.decode("utf-8")).encode("utf-8")
+
+
+def minified_name(path: str) -> str:
+    """`name.css` -> `name.min.css`"""
+    stem, ext = os.path.splitext(path)
+    return f"{stem}.min{ext}"
+
+
+# ============================================================================
+# COMPRESSION
+# ============================================================================
+
+def gzip_bytes(data: bytes) -> bytes:
+    """Smallest available gzip encoding (zopfli if installed), without a timestamp"""
+    if zopfli is not None:
+        return zopfli.gzip.compress(data, numiterations=ZOPFLI_ITERATIONS)
+    return gzip.compress(data, compresslevel=9, mtime=0)
+
+
+def brotli_bytes(data: bytes) -> Optional[bytes]:
+    """Brotli at quality 11, or None when no brotli module is installed"""
+    if brotli is None:
+        return None
+    return brotli.compress(data, quality=11)
+
+
+class CompressedSizes(NamedTuple):
+    raw: int
+    gzip: Optional[int]       # None when not worth compressing
+    brotli: Optional[int]
+
+
+def _write(path: str, data: bytes):
+    temporary = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def precompress_file(path: str, min_size: int = MIN_SIZE) -> CompressedSizes:
+    """
+    Write (or refresh) the `.gz` and `.br` siblings of one file
+
+    Siblings newer than the file are reused; encodings that would not be
+    smaller than the file are not written (and stale ones are removed).
+    """
+    raw = os.path.getsize(path)
+    sizes = {}
+    for suffix, encode in ((".gz", gzip_bytes), (".br", brotli_bytes)):
+        sibling = path + suffix
+        if raw < min_size or (suffix == ".br" and brotli is None):
+            if os.path.exists(sibling):
+                os.remove(sibling)
+            sizes[suffix] = None
+            continue
+        if os.path.exists(sibling) and os.path.getmtime(sibling) >= os.path.getmtime(path):
+            sizes[suffix] = os.path.getsize(sibling)
+            continue
+        with open(path, "rb") as f:
+            encoded = encode(f.read())
+        if len(encoded) < raw:
+            _write(sibling, encoded)
+            sizes[suffix] = len(encoded)
+        else:
+            if os.path.exists(sibling):
+                os.remove(sibling)
+            sizes[suffix] = None
+    return CompressedSizes(raw, sizes[".gz"], sizes[".br"])
+
+
+def precompress_directory(directory: str, min_size: int = MIN_SIZE) -> Dict[str, CompressedSizes]:
+    """
+    Precompress every text asset below a directory
+
+    Siblings whose source file no longer exists are deleted.
+
+    Returns:
+        Relative path -> sizes
+    """
+    results = {}
+    for root, _, files in os.walk(directory):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            if name.endswith(COMPRESSED_SUFFIXES):
+                if not os.path.exists(path[:-3]):
+                    os.remove(path)
+            elif name.lower().endswith(COMPRESSIBLE_EXTENSIONS) and not name.startswith("."):
+                results[os.path.relpath(path, directory).replace(os.sep, "/")] = precompress_file(path, min_size)
+    return results
+
+
+# ============================================================================
+# SIZE REPORT
+# ============================================================================
+
+def size_report(results: Dict[str, CompressedSizes], previous: Dict[str, List]) -> List[str]:
+    """Report lines comparing each file's sizes with the previous run"""
+    def size(value):
+        return "-" if value is None else f"{value:,}"
+
+    def delta(now, before):
+        if now is None or before is None or now == before:
+            return ""
+        return f"{now - before:+,}"
+
+    lines = [f"  {'file':48} {'raw':>9} {'gzip':>9} {'brotli':>9}  {'gzip vs last':>12}"]
+    for path, sizes in sorted(results.items()):
+        before = CompressedSizes(*previous[path]) if path in previous else None
+        change = "new" if before is None else delta(sizes.gzip, before.gzip) or delta(sizes.raw, before.raw)
+        lines.append(f"  {path:48} {size(sizes.raw):>9} {size(sizes.gzip):>9} {size(sizes.brotli):>9}"
+                     f"  {change:>12}")
+    raw = sum(s.raw for s in results.values())
+    sent = sum(s.brotli or s.gzip or s.raw for s in results.values())
+    lines.append(f"  {len(results)} files: {raw:,} bytes raw, {sent:,} bytes compressed "
+                 f"({100 * (1 - sent / max(raw, 1)):.1f}% saved)")
+    removed = sorted(set(previous) - set(results))
+    if removed:
+        lines.append(f"  removed since last run: {', '.join(removed)}")
+    return lines
+
+
+def compress_with_report(directory: str, min_size: int = MIN_SIZE,
+                         labels: Optional[Dict[str, str]] = None) -> List[str]:
+    """
+    Precompress a directory and return the size report, updating the stored sizes
+
+    Args:
+        directory: Directory to precompress
+        min_size: Smallest file to compress
+        labels: Optional relative path -> report name, e.g. to report hashed
+            files under their unhashed names so they compare across builds;
+            files without a label are compressed but left out of the report
+    """
+    report_path = os.path.join(directory, REPORT_NAME)
+    try:
+        with open(report_path) as f:
+            previous = json.load(f)
+    except (FileNotFoundError, ValueError):
+        previous = {}
+    results = precompress_directory(directory, min_size)
+    if labels is not None:
+        results = {labels[path]: sizes for path, sizes in results.items() if path in labels}
+    _write(report_path, (json.dumps({p: list(s) for p, s in results.items()}, indent=2, sort_keys=True)
+                         + "\n").encode())
+    return size_report(results, previous)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Minify and precompress static assets")
+    parser.add_argument("paths", nargs="*", help="Directories to precompress (default: ../dist), "
+                                                 "or files to minify with --minify")
+    parser.add_argument("--minify", action="store_true", help="Write name.min.ext next to each file")
+    parser.add_argument("--min-size", type=int, default=MIN_SIZE, help="Smallest file to compress")
+    args = parser.parse_args(argv)
+
+    encoders = ["zopfli" if zopfli is not None else "gzip -9"] + (["brotli"] if brotli is not None else [])
+    if args.minify:
+        for path in args.paths:
+            with open(path, "rb") as f:
+                data = f.read()
+            target = minified_name(path)
+            _write(target, minify(path, data))
+            sizes = precompress_file(target, args.min_size)
+            print(f"  {target}: {len(data):,} -> {sizes.raw:,} bytes, gzip {sizes.gzip or '-'}, "
+                  f"brotli {sizes.brotli or '-'}")
+        return 0
+
+    from publish_site import DIST_DIR
+    for directory in args.paths or [DIST_DIR]:
+        print(f"{directory} ({', '.join(encoders)}):")
+        for line in compress_with_report(directory, args.min_size):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
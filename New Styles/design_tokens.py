@@ -0,0 +1,55 @@
+"""Design tokens (auto-generated from unified_design_tokens.py; do not edit)"""
+
+PIXELS_PER_UNIT = 100
+
+# duration (s)
+DURATION_DEFAULT = 1.0  # Most animations, fade in
+DURATION_EMPHASIS = 0.8  # Indicate, appear with bounce
+DURATION_FADE_OUT = 0.8  # Standard fade out
+DURATION_PAUSE = 0.5  # Pause to show a result
+DURATION_QUICK = 0.5  # Brief transitions
+DURATION_SLOW = 2.0  # Detailed transformations
+DURATION_TEXT_DISPLAY = 2.0  # Minimum time text stays on screen
+DURATION_TRANSFORM = 1.5  # Transforming equations and shapes
+DURATION_VERY_SLOW = 3.0  # Complex sequences
+
+# spacing (Manim units)
+SPACING_LARGE = 1.0  # LARGE_BUFF, generous spacing
+SPACING_LARGE_PX = 100
+SPACING_MED_LARGE = 0.5  # MED_LARGE_BUFF, comfortable spacing
+SPACING_MED_LARGE_PX = 50
+SPACING_MED_SMALL = 0.25  # MED_SMALL_BUFF
+SPACING_MED_SMALL_PX = 25
+SPACING_SMALL = 0.1  # SMALL_BUFF, tight spacing
+SPACING_SMALL_PX = 10
+
+# stroke (px)
+STROKE_BOLD = 8  # Bold
+STROKE_EMPHASIS = 6  # Emphasis
+STROKE_FINE = 2  # Fine detail
+STROKE_STANDARD = 4  # Default
+
+# font (pt)
+FONT_BODY = 48  # Main content
+FONT_DISPLAY = 96  # Key equations
+FONT_HEADER = 72  # Titles
+FONT_SMALL = 24  # Annotations, labels
+
+# easing (easing name)
+EASING_APPEAR = 'smooth'  # Fade in, grow
+EASING_BOUNCE = 'ease_out_back'  # Appear with overshoot
+EASING_CONSTANT_RATE = 'linear'  # Constant rates
+EASING_DISAPPEAR = 'smooth'  # Fade out, shrink
+EASING_EMPHASIS = 'there_and_back'  # Brief highlight
+EASING_FAST_APPEAR = 'rush_into'  # Fast appearance
+EASING_FAST_DISAPPEAR = 'rush_from'  # Fast disappearance
+EASING_MOVE = 'smooth'  # Moving and transforming
+
+# color (color scheme key)
+COLOR_BACKGROUND = 'background'  # Backgrounds, de-emphasis
+COLOR_EMPHASIS = 'highlight'  # Temporary highlights
+COLOR_IMPORTANT = 'dot'  # Important points, answers
+COLOR_PRIMARY = 'accent'  # Functions, curves, primary objects
+COLOR_SECONDARY = 'displacement'  # Secondary objects, comparisons
+COLOR_TEXT = 'text'  # Text, labels
+COLOR_TIME = 'time'  # Time, animation progress
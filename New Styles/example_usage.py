@@ -8,6 +8,7 @@ timing functions in a Manim scene.
 
 from manimlib import *
 from unified_color_schemes import get_scheme
+from unified_manim_adapter import apply_scheme
 from unified_animation_timing import (
     smooth, rush_into, rush_from, there_and_back,
     ease_in_back, ease_out_back
@@ -196,11 +197,12 @@ class ColorSchemeShowcase(Scene):
             for color_key in colors:
                 swatch = Square(
                     side_length=0.4,
-                    fill_color=scheme.hex(color_key),
                     fill_opacity=1,
                     stroke_width=2,
                     stroke_color=WHITE
                 )
+                # Pre-parsed RGBA from the adapter cache, no hex parsing
+                apply_scheme(swatch, color_key, scheme, stroke=False)
                 swatches.add(swatch)
             
             swatches.arrange(RIGHT, buff=0.1)
@@ -0,0 +1,56 @@
+"""
+Manim constants from the design tokens (auto-generated from
+unified_design_tokens.py; do not edit)
+
+    self.play(FadeIn(obj), run_time=RUN_TIME_QUICK, rate_func=RATE_FUNC_APPEAR)
+"""
+
+from unified_animation_timing import ease_out_back, linear, rush_from, rush_into, smooth, there_and_back
+
+# duration (s)
+RUN_TIME_DEFAULT = 1.0  # Most animations, fade in
+RUN_TIME_EMPHASIS = 0.8  # Indicate, appear with bounce
+RUN_TIME_FADE_OUT = 0.8  # Standard fade out
+RUN_TIME_PAUSE = 0.5  # Pause to show a result
+RUN_TIME_QUICK = 0.5  # Brief transitions
+RUN_TIME_SLOW = 2.0  # Detailed transformations
+RUN_TIME_TEXT_DISPLAY = 2.0  # Minimum time text stays on screen
+RUN_TIME_TRANSFORM = 1.5  # Transforming equations and shapes
+RUN_TIME_VERY_SLOW = 3.0  # Complex sequences
+
+# spacing (Manim units)
+BUFF_LARGE = 1.0  # LARGE_BUFF, generous spacing
+BUFF_MED_LARGE = 0.5  # MED_LARGE_BUFF, comfortable spacing
+BUFF_MED_SMALL = 0.25  # MED_SMALL_BUFF
+BUFF_SMALL = 0.1  # SMALL_BUFF, tight spacing
+
+# stroke (px)
+STROKE_WIDTH_BOLD = 8  # Bold
+STROKE_WIDTH_EMPHASIS = 6  # Emphasis
+STROKE_WIDTH_FINE = 2  # Fine detail
+STROKE_WIDTH_STANDARD = 4  # Default
+
+# font (pt)
+FONT_SIZE_BODY = 48  # Main content
+FONT_SIZE_DISPLAY = 96  # Key equations
+FONT_SIZE_HEADER = 72  # Titles
+FONT_SIZE_SMALL = 24  # Annotations, labels
+
+# easing (easing name)
+RATE_FUNC_APPEAR = smooth  # Fade in, grow
+RATE_FUNC_BOUNCE = ease_out_back  # Appear with overshoot
+RATE_FUNC_CONSTANT_RATE = linear  # Constant rates
+RATE_FUNC_DISAPPEAR = smooth  # Fade out, shrink
+RATE_FUNC_EMPHASIS = there_and_back  # Brief highlight
+RATE_FUNC_FAST_APPEAR = rush_into  # Fast appearance
+RATE_FUNC_FAST_DISAPPEAR = rush_from  # Fast disappearance
+RATE_FUNC_MOVE = smooth  # Moving and transforming
+
+# color (color scheme key)
+COLOR_BACKGROUND = 'background'  # Backgrounds, de-emphasis
+COLOR_EMPHASIS = 'highlight'  # Temporary highlights
+COLOR_IMPORTANT = 'dot'  # Important points, answers
+COLOR_PRIMARY = 'accent'  # Functions, curves, primary objects
+COLOR_SECONDARY = 'displacement'  # Secondary objects, comparisons
+COLOR_TEXT = 'text'  # Text, labels
+COLOR_TIME = 'time'  # Time, animation progress
@@ -0,0 +1,269 @@
+"""
+Publishing the Site with Content-Hashed Assets
+===============================================
+
+Copies the site into a deployable directory (DIST_DIR, `../dist`) in which
+every stylesheet and script under `css/` and `js/` carries a hash of its
+content in its file name:
+
+    css/color-schemes.css   ->  css/color-schemes.3f9c0a17b2.css
+    js/style-config.js      ->  js/style-config.8e41d2c09a.js
+
+A manifest (MANIFEST_NAME) maps the original paths to the hashed ones, and
+the `<script src>` / `<link href>` references in `index.html`,
+`applets/*.html` and `pages/*.html` are rewritten to the hashed names. A
+hashed file never changes, so it can be served with a year-long immutable
+cache header; only the small HTML pages need revalidating. The files of the
+previous publish are kept, so pages still cached by browsers keep working
+until they are revalidated.
+
+With --bundle, each page's shared color/style scripts are replaced by one
+per-page bundle holding only the data the page uses (see bundle_pages.py),
+published as `js/bundle.<hash>.js` (pages with the same needs share one
+file) or inlined with --inline. --minify publishes minified CSS/JS, and
+--compress adds precompressed `.gz` (and `.br`) siblings plus a size report
+(see compress_assets.py).
+
+Usage:
+    python publish_site.py               # build stale assets, then publish
+    python publish_site.py --no-build    # publish the files as they are
+    python publish_site.py -o /srv/site  # publish somewhere else
+    python publish_site.py --bundle      # one minimal script per page
+    python publish_site.py --bundle --minify --compress
+
+Version: 1.0
+"""
+
+import argparse
+import fnmatch
+import hashlib
+import json
+import os
+import posixpath
+import re
+import sys
+from collections import Counter
+from typing import Dict, List
+
+import build_assets
+import bundle_pages
+import compress_assets
+
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+SITE_ROOT = os.path.dirname(HERE)
+
+DIST_DIR = os.path.join(SITE_ROOT, "dist")
+
+# Directories (relative to the site root) whose files get hashed names
+ASSET_DIRS = ("css", "js")
+
+# HTML pages (glob patterns relative to the site root) that are published
+PAGE_PATTERNS = ("index.html", "applets/*.html", "pages/*.html")
+
+MANIFEST_NAME = "asset-manifest.json"
+
+HASH_LENGTH = 10
+
+_REFERENCE = re.compile(
+    r"""(<(?:script|link)\b[^>]*?\b(?:src|href)\s*=\s*)(["'])([^"']+)\2""", re.I
+)
+
+
+# ============================================================================
+# MANIFEST
+# ============================================================================
+
+def hashed_name(path: str, data: bytes) -> str:
+    """`dir/name.ext` -> `dir/name.<content hash>.ext`"""
+    stem, ext = posixpath.splitext(path)
+    return f"{stem}.{hashlib.sha256(data).hexdigest()[:HASH_LENGTH]}{ext}"
+
+
+def site_files(root: str, patterns) -> List[str]:
+    """Site-relative (posix) paths of the files matching glob patterns"""
+    found = []
+    for pattern in patterns:
+        directory = posixpath.dirname(pattern)
+        try:
+            names = sorted(os.listdir(os.path.join(root, directory)))
+        except FileNotFoundError:
+            continue
+        found.extend(posixpath.join(directory, name) for name in names
+                     if fnmatch.fnmatch(name, posixpath.basename(pattern))
+                     and os.path.isfile(os.path.join(root, directory, name)))
+    return found
+
+
+def asset_bytes(root: str, path: str, minify: bool = False) -> bytes:
+    """The published content of an asset"""
+    with open(os.path.join(root, path), "rb") as f:
+        data = f.read()
+    return compress_assets.minify(path, data) if minify else data
+
+
+def build_manifest(root: str = SITE_ROOT, minify: bool = False) -> Dict[str, str]:
+    """
+    Hash every asset of the site
+
+    Args:
+        root: Site root
+        minify: Hash the minified content (as published with minify=True)
+
+    Returns:
+        Site-relative path -> site-relative hashed path
+    """
+    manifest = {}
+    for path in site_files(root, [f"{d}/*" for d in ASSET_DIRS]):
+        manifest[path] = hashed_name(path, asset_bytes(root, path, minify))
+    return manifest
+
+
+# ============================================================================
+# HTML REWRITING
+# ============================================================================
+
+def rewrite_references(html: str, page: str, manifest: Dict[str, str]) -> str:
+    """
+    Point a page's script and stylesheet references at hashed files
+
+    Args:
+        html: Page source
+        page: Site-relative path of the page (references are relative to it)
+        manifest: From build_manifest()
+
+    Returns:
+        The page with every reference to a manifest entry replaced; external
+        URLs and unknown files are left alone
+    """
+    directory = posixpath.dirname(page)
+
+    def replace(match):
+        prefix, quote, url = match.groups()
+        if "//" in url or url.startswith(("/", "data:", "#")):
+            return match.group(0)
+        path, suffix = re.match(r"([^?#]*)(.*)", url).groups()
+        resolved = posixpath.normpath(posixpath.join(directory, path))
+        if resolved not in manifest:
+            return match.group(0)
+        hashed = posixpath.relpath(manifest[resolved], directory or ".")
+        return f"{prefix}{quote}{hashed}{suffix}{quote}"
+
+    return _REFERENCE.sub(replace, html)
+
+
+# ============================================================================
+# PUBLISHING
+# ============================================================================
+
+def _write_atomic(path: str, data: bytes):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    temporary = os.path.join(os.path.dirname(path), f".{os.path.basename(path)}.{os.getpid()}.tmp")
+    with open(temporary, "wb") as f:
+        f.write(data)
+    os.replace(temporary, path)
+
+
+def load_manifest(dist: str = DIST_DIR) -> Dict[str, str]:
+    try:
+        with open(os.path.join(dist, MANIFEST_NAME)) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _bundle_tag(page: str, script: str, manifest: Dict[str, str], dist: str, inline: bool) -> str:
+    """Script tag for a page bundle, writing the hashed bundle file unless inlined"""
+    if inline:
+        return bundle_pages.script_tag(script)
+    # Named by content alone, so pages with identical bundles share one file
+    path = f"js/bundle-{posixpath.splitext(page)[0].replace('/', '-')}.js"
+    data = script.encode("utf-8")
+    manifest[path] = hashed_name("js/bundle.js", data)
+    if not os.path.exists(os.path.join(dist, manifest[path])):
+        _write_atomic(os.path.join(dist, manifest[path]), data)
+    return bundle_pages.script_tag(script, posixpath.relpath(path, posixpath.dirname(page) or "."))
+
+
+def publish(root: str = SITE_ROOT, dist: str = DIST_DIR, bundle: bool = False,
+            inline: bool = False, minify: bool = False) -> Dict[str, str]:
+    """
+    Write hashed assets, rewritten pages and the manifest to `dist`
+
+    Hashed files that already exist are not rewritten. Hashed files of
+    older publishes other than the previous one are deleted.
+
+    Args:
+        root: Site root
+        dist: Output directory
+        bundle: Replace each page's shared scripts by a per-page bundle
+        inline: Inline the bundles instead of writing them as files
+        minify: Publish minified CSS/JS/JSON assets
+
+    Returns:
+        The new manifest
+    """
+    previous = load_manifest(dist)
+    manifest = build_manifest(root, minify)
+
+    for path, hashed in manifest.items():
+        target = os.path.join(dist, hashed)
+        if not os.path.exists(target):
+            _write_atomic(target, asset_bytes(root, path, minify))
+
+    for page in site_files(root, PAGE_PATTERNS):
+        with open(os.path.join(root, page), encoding="utf-8", newline="") as f:
+            html = f.read()
+        if bundle:
+            html, script = bundle_pages.bundle_page(html, page, root)
+            if script is not None:
+                html = html.replace("<!--bundle-->", _bundle_tag(page, script, manifest, dist, inline), 1)
+        _write_atomic(os.path.join(dist, page), rewrite_references(html, page, manifest).encode("utf-8"))
+
+    # Keep this publish and the previous one (and their precompressed
+    # siblings); drop anything older
+    keep = set(manifest.values()) | set(previous.values())
+    for path in site_files(dist, [f"{d}/*" for d in ASSET_DIRS]):
+        source = path[:-3] if path.endswith(compress_assets.COMPRESSED_SUFFIXES) else path
+        if source not in keep:
+            os.remove(os.path.join(dist, path))
+
+    _write_atomic(os.path.join(dist, MANIFEST_NAME),
+                  (json.dumps(manifest, indent=2, sort_keys=True) + "\n").encode())
+    return manifest
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Publish the site with content-hashed asset names")
+    parser.add_argument("-o", "--output", default=DIST_DIR, help=f"Output directory (default: {DIST_DIR})")
+    parser.add_argument("--no-build", action="store_true", help="Do not run build_assets first")
+    parser.add_argument("--bundle", action="store_true", help="Give each page one minimal script bundle")
+    parser.add_argument("--inline", action="store_true", help="With --bundle, inline the bundles")
+    parser.add_argument("--minify", action="store_true", help="Publish minified CSS/JS")
+    parser.add_argument("--compress", action="store_true", help="Write .gz/.br siblings and a size report")
+    args = parser.parse_args(argv)
+
+    if not args.no_build:
+        build_assets.build()
+
+    previous = load_manifest(args.output)
+    manifest = publish(dist=args.output, bundle=args.bundle, inline=args.inline, minify=args.minify)
+    changed = sorted(path for path, hashed in manifest.items() if previous.get(path) != hashed)
+    for path in changed:
+        print(f"  {path:32} -> {manifest[path]}")
+    print(f"Published {len(manifest)} assets ({len(changed)} changed) to {args.output}")
+    if args.compress:
+        # Report hashed files under their original names so sizes compare
+        # across builds (shared bundles keep their hashed name)
+        owners = Counter(manifest.values())
+        labels = {hashed: path if owners[hashed] == 1 else hashed for path, hashed in manifest.items()}
+        labels.update((page, page) for page in site_files(args.output, PAGE_PATTERNS))
+        labels[MANIFEST_NAME] = MANIFEST_NAME
+        for line in compress_assets.compress_with_report(args.output, labels=labels):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,444 @@
+"""
+Static Server for the Applet Site
+=================================
+
+A drop-in replacement for `python -m http.server` when a whole classroom
+opens the applets at once:
+
+- One thread per connection with HTTP/1.1 keep-alive and a deep listen
+  backlog, so simultaneous page loads do not queue behind each other
+- A file index built at startup (size, modification time, strong ETag from
+  the content hash, content type) so requests do not touch the disk until
+  the body is sent; send SIGHUP (or restart) to re-index after changes
+- Conditional requests (If-None-Match / If-Modified-Since -> 304)
+- `Accept-Encoding` negotiation to the `.br` / `.gz` siblings written by
+  compress_assets.py, so compressed responses cost no CPU
+- Single byte ranges (206 / 416, If-Range)
+- Directories requested without a trailing slash are redirected (301) to
+  "/dir/", which serves its index.html (there are no directory listings)
+- Bodies sent with os.sendfile() (zero-copy) where the platform allows
+- `Cache-Control: immutable` for a year on content-hashed files from
+  publish_site.py; everything else is revalidated on every use
+- An access log and a latency histogram, printed on exit (Ctrl+C or
+  SIGTERM) and optionally every few seconds
+
+Usage:
+    python serve_site.py                     # serves ../dist if published, else the site
+    python serve_site.py --root .. --port 8080 --quiet --stats-interval 30
+
+Version: 1.0
+"""
+
+import argparse
+import email.utils
+import hashlib
+import mimetypes
+import os
+import re
+import shutil
+import signal
+import sys
+import threading
+import time
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple
+from urllib.parse import unquote, urlsplit
+
+from compress_assets import COMPRESSED_SUFFIXES
+from publish_site import DIST_DIR, HASH_LENGTH, SITE_ROOT
+
+
+DEFAULT_PORT = 8000
+
+LISTEN_BACKLOG = 256
+
+IMMUTABLE_CACHE = "public, max-age=31536000, immutable"
+REVALIDATE_CACHE = "no-cache"
+
+# Content-Encoding -> sibling suffix, in order of preference
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
+_HASHED_NAME = re.compile(rf"\.[0-9a-f]{{{HASH_LENGTH}}}\.\w+$")
+_RANGE = re.compile(r"bytes=(\d*)-(\d*)$")
+
+SENDFILE_CHUNK = 1 << 20
+
+
+# ============================================================================
+# FILE INDEX
+# ============================================================================
+
+class FileVariant(NamedTuple):
+    """One stored representation of a resource"""
+    path: str           # Absolute file path
+    size: int
+    etag: str           # Quoted strong ETag
+
+
+class IndexedFile(NamedTuple):
+    identity: FileVariant
+    encoded: Dict[str, FileVariant]    # Content-Encoding -> precompressed sibling
+    content_type: str
+    last_modified: str                 # HTTP date
+    mtime: int                         # Whole seconds, for If-Modified-Since
+    cache_control: str
+
+
+def _variant(path: str, stat: os.stat_result, suffix: str = "") -> FileVariant:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 16), b""):
+            digest.update(chunk)
+    return FileVariant(path, stat.st_size, f'"{digest.hexdigest()[:20]}{suffix}"')
+
+
+def _content_type(name: str) -> str:
+    content_type = mimetypes.guess_type(name)[0] or "application/octet-stream"
+    if content_type.startswith("text/") or content_type in ("application/javascript", "application/json",
+                                                           "image/svg+xml"):
+        content_type += "; charset=utf-8"
+    return content_type
+
+
+def build_index(root: str) -> Dict[str, IndexedFile]:
+    """
+    Index every servable file below `root`
+
+    Returns:
+        URL path ("/applets/x.html") -> IndexedFile; directories with an
+        index.html are also reachable as "/dir/"
+    """
+    index = {}
+    for directory, subdirectories, files in os.walk(root):
+        subdirectories[:] = sorted(d for d in subdirectories if not d.startswith("."))
+        names = set(files)
+        for name in sorted(files):
+            if name.startswith(".") or name.endswith(COMPRESSED_SUFFIXES):
+                continue
+            path = os.path.join(directory, name)
+            stat = os.stat(path)
+            encoded = {}
+            for encoding, suffix in ENCODINGS:
+                if name + suffix in names:
+                    sibling = path + suffix
+                    encoded[encoding] = _variant(sibling, os.stat(sibling), "-" + encoding)
+            url = "/" + os.path.relpath(path, root).replace(os.sep, "/")
+            index[url] = IndexedFile(
+                _variant(path, stat),
+                encoded,
+                _content_type(name),
+                email.utils.formatdate(stat.st_mtime, usegmt=True),
+                int(stat.st_mtime),
+                IMMUTABLE_CACHE if _HASHED_NAME.search(name) else REVALIDATE_CACHE,
+            )
+            if name == "index.html":
+                index[url[:-len("index.html")]] = index[url]
+    return index
+
+
+def list_directories(root: str) -> Set[str]:
+    """URL paths ("/applets/") of every directory below `root` that build_index walks"""
+    directories = set()
+    for directory, subdirectories, _ in os.walk(root):
+        subdirectories[:] = [d for d in subdirectories if not d.startswith(".")]
+        relative = os.path.relpath(directory, root).replace(os.sep, "/")
+        directories.add("/" if relative == "." else f"/{relative}/")
+    return directories
+
+
+def negotiate(accept_encoding: str, available: Dict[str, FileVariant]) -> Optional[str]:
+    """Preferred available Content-Encoding acceptable to the client (None: identity)"""
+    accepted = {}
+    for item in accept_encoding.split(","):
+        name, _, params = item.strip().partition(";")
+        q = 1.0
+        match = re.search(r"q\s*=\s*([0-9.]+)", params)
+        if match:
+            try:
+                q = float(match.group(1))
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    for encoding, _ in ENCODINGS:
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if encoding in available and q > 0:
+            return encoding
+    return None
+
+
+def parse_range(header: str, size: int) -> Optional[Tuple[int, int]]:
+    """
+    Resolve a single-range `Range` header
+
+    Returns:
+        (start, end) inclusive; (size, size - 1) when unsatisfiable; None
+        when the header is not a single byte range (serve the whole file)
+    """
+    match = _RANGE.match(header.strip())
+    if not match or not (match.group(1) or match.group(2)):
+        return None
+    first, last = match.groups()
+    if not first:                      # bytes=-N: the last N bytes
+        length = int(last)
+        return (max(0, size - length), size - 1) if length else (size, size - 1)
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if start >= size or (last and int(last) < start):
+        return size, size - 1
+    return start, end
+
+
+# ============================================================================
+# LATENCY HISTOGRAM
+# ============================================================================
+
+class LatencyHistogram:
+    """Thread-safe request latency histogram with power-of-two buckets"""
+
+    # Upper bounds in milliseconds: 0.125, 0.25, ... 4096, then overflow
+    BOUNDS = tuple(2.0 ** k for k in range(-3, 13))
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counts = [0] * (len(self.BOUNDS) + 1)
+        self.total = 0.0
+        self.maximum = 0.0
+
+    def add(self, milliseconds: float):
+        bucket = next((i for i, bound in enumerate(self.BOUNDS) if milliseconds <= bound), len(self.BOUNDS))
+        with self._lock:
+            self.counts[bucket] += 1
+            self.total += milliseconds
+            self.maximum = max(self.maximum, milliseconds)
+
+    @property
+    def count(self) -> int:
+        return sum(self.counts)
+
+    def percentile(self, fraction: float) -> float:
+        """Upper bound of the bucket containing the given fraction of requests"""
+        target, seen = fraction * self.count, 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= target:
+                return self.BOUNDS[i] if i < len(self.BOUNDS) else self.maximum
+        return 0.0
+
+    def report(self) -> List[str]:
+        count = self.count
+        if not count:
+            return ["  no requests"]
+        lines = [f"  {count} requests, mean {self.total / count:.2f} ms, p50 <= {self.percentile(0.5):g} ms, "
+                 f"p99 <= {self.percentile(0.99):g} ms, max {self.maximum:.2f} ms"]
+        peak = max(self.counts)
+        lower = 0.0
+        for i, n in enumerate(self.counts):
+            if n:
+                upper = f"{self.BOUNDS[i]:g}" if i < len(self.BOUNDS) else "inf"
+                lines.append(f"  {lower:>8g} - {upper:<6} ms {n:>7}  {'#' * max(1, round(40 * n / peak))}")
+            lower = self.BOUNDS[i] if i < len(self.BOUNDS) else lower
+        return lines
+
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class SiteRequestHandler(BaseHTTPRequestHandler):
+    """GET/HEAD from the server's file index"""
+
+    protocol_version = "HTTP/1.1"
+    server_version = "UnifiedStyleSite/1.0"
+
+    def do_GET(self):
+        started = time.perf_counter()
+        try:
+            self._serve(send_body=True)
+        finally:
+            self.server.histogram.add((time.perf_counter() - started) * 1000)
+
+    def do_HEAD(self):
+        started = time.perf_counter()
+        try:
+            self._serve(send_body=False)
+        finally:
+            self.server.histogram.add((time.perf_counter() - started) * 1000)
+
+    def _serve(self, send_body: bool):
+        parts = urlsplit(self.path)
+        url = unquote(parts.path)
+        entry = self.server.index.get(url)
+        if entry is None and not url.endswith("/") and url + "/" in self.server.directories:
+            # Like http.server: "/applets" -> "/applets/" so relative links resolve
+            self.send_response(HTTPStatus.MOVED_PERMANENTLY)
+            self.send_header("Location", parts.path + "/" + (f"?{parts.query}" if parts.query else ""))
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if entry is None:
+            self._send_empty(HTTPStatus.NOT_FOUND)
+            return
+
+        byte_range = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if byte_range and if_range and if_range.strip() != entry.identity.etag:
+            byte_range = None    # the client's copy is outdated: send it all
+        # Ranges refer to the identity bytes, so they are never compressed
+        encoding = None if byte_range else negotiate(self.headers.get("Accept-Encoding", ""), entry.encoded)
+        variant = entry.encoded[encoding] if encoding else entry.identity
+
+        if self._not_modified(entry, variant):
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self._send_cache_headers(entry, variant)
+            self.end_headers()
+            return
+
+        start, end = 0, variant.size - 1
+        status = HTTPStatus.OK
+        if byte_range:
+            resolved = parse_range(byte_range, variant.size)
+            if resolved is not None:
+                start, end = resolved
+                if start > end:
+                    self.send_response(HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                    self.send_header("Content-Range", f"bytes */{variant.size}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                status = HTTPStatus.PARTIAL_CONTENT
+
+        self.send_response(status)
+        self.send_header("Content-Type", entry.content_type)
+        self.send_header("Content-Length", str(end - start + 1))
+        self.send_header("Accept-Ranges", "bytes")
+        if status == HTTPStatus.PARTIAL_CONTENT:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{variant.size}")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self._send_cache_headers(entry, variant)
+        self.end_headers()
+        if send_body and end >= start:
+            self._send_file(variant.path, start, end - start + 1)
+
+    def _not_modified(self, entry: IndexedFile, variant: FileVariant) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            tags = [tag[2:] if tag.startswith("W/") else tag for tag in tags]
+            return "*" in tags or variant.etag in tags
+        if_modified_since = self.headers.get("If-Modified-Since")
+        if if_modified_since:
+            try:
+                since = email.utils.parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+            return entry.mtime <= since
+        return False
+
+    def _send_cache_headers(self, entry: IndexedFile, variant: FileVariant):
+        self.send_header("ETag", variant.etag)
+        self.send_header("Last-Modified", entry.last_modified)
+        self.send_header("Cache-Control", entry.cache_control)
+        if entry.encoded:
+            self.send_header("Vary", "Accept-Encoding")
+
+    def _send_empty(self, status: HTTPStatus):
+        self.send_response(status)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send_file(self, path: str, offset: int, count: int):
+        with open(path, "rb") as f:
+            if self.server.use_sendfile:
+                try:
+                    while count > 0:
+                        sent = os.sendfile(self.connection.fileno(), f.fileno(), offset,
+                                           min(count, SENDFILE_CHUNK))
+                        if sent == 0:
+                            break
+                        offset += sent
+                        count -= sent
+                    return
+                except OSError as e:
+                    if count == 0 or e.errno not in (22, 38, 95):    # EINVAL, ENOSYS, EOPNOTSUPP
+                        raise
+                    self.server.use_sendfile = False
+            f.seek(offset)
+            while count > 0:
+                chunk = f.read(min(count, SENDFILE_CHUNK))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                count -= len(chunk)
+
+    def log_request(self, code="-", size="-"):
+        if not self.server.quiet:
+            super().log_request(code, size)
+
+
+class SiteServer(ThreadingHTTPServer):
+    """Threaded server holding the file index and request statistics"""
+
+    daemon_threads = True
+    request_queue_size = LISTEN_BACKLOG
+
+    def __init__(self, address: Tuple[str, int], root: str, quiet: bool = False):
+        self.root = os.path.abspath(root)
+        self.quiet = quiet
+        self.histogram = LatencyHistogram()
+        self.use_sendfile = hasattr(os, "sendfile")
+        self.index: Dict[str, IndexedFile] = {}
+        self.directories: Set[str] = set()
+        self.reindex()
+        super().__init__(address, SiteRequestHandler)
+
+    def reindex(self):
+        """Rebuild the file index (swapped in atomically)"""
+        self.index = build_index(self.root)
+        self.directories = list_directories(self.root)
+
+
+def default_root() -> str:
+    """The published site if there is one, else the source tree"""
+    return DIST_DIR if os.path.isdir(DIST_DIR) else SITE_ROOT
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Serve the applet site")
+    parser.add_argument("--root", help="Directory to serve (default: ../dist if published, else the site)")
+    parser.add_argument("--bind", default="", help="Address to bind (default: all interfaces)")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port (default: {DEFAULT_PORT})")
+    parser.add_argument("--quiet", action="store_true", help="No per-request access log")
+    parser.add_argument("--stats-interval", type=float, help="Print the latency histogram every N seconds")
+    args = parser.parse_args(argv)
+
+    server = SiteServer((args.bind, args.port), args.root or default_root(), args.quiet)
+    compressed = sum(1 for url, entry in server.index.items() if entry.encoded and not url.endswith("/"))
+    print(f"Serving {server.root} on http://{args.bind or 'localhost'}:{server.server_address[1]}/ "
+          f"({len(server.index)} paths, {compressed} precompressed, "
+          f"{'sendfile' if server.use_sendfile else 'copy'})")
+
+    if hasattr(signal, "SIGHUP"):
+        signal.signal(signal.SIGHUP, lambda *_: (server.reindex(), print("Re-indexed.")))
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))    # still prints the histogram
+    if args.stats_interval:
+        def print_stats():
+            while True:
+                time.sleep(args.stats_interval)
+                print("\n".join(server.histogram.report()))
+        threading.Thread(target=print_stats, daemon=True).start()
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print()
+    finally:
+        server.server_close()
+        print("Latency histogram:")
+        print("\n".join(server.histogram.report()))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,275 @@
+"""
+Accessibility Audit for Color Schemes
+======================================
+
+Vectorized WCAG 2 contrast checks across every scheme at once:
+- Relative luminance of all S x K colors in one call
+- The full pairwise contrast-ratio tensor (S x K x K)
+- AA / AAA checks for the semantic foreground/background pairs
+- Color-vision-deficiency (protan / deutan / tritan) simulation applied to
+  whole palettes, so the checks can be repeated as seen by CVD viewers
+
+Schemes listed in REQUIRED_LEVELS (e.g. `high_contrast` must meet AAA) make
+the command-line audit fail, so it can run on every build:
+
+    python unified_accessibility.py              # report, exit 1 on failure
+    python unified_accessibility.py --vision all # also check simulated CVD
+
+Version: 1.0
+"""
+
+import argparse
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from unified_color_schemes import COLOR_SCHEMES, SchemeTable
+from unified_color_spaces import srgb_to_linear, linear_to_srgb
+
+
+# ============================================================================
+# WCAG THRESHOLDS AND PAIRS
+# ============================================================================
+
+# Minimum contrast ratios (WCAG 2.1 SC 1.4.3 / 1.4.6 for text,
+# SC 1.4.11 for graphical objects, which has no AAA level)
+THRESHOLDS = {
+    "text": {"AA": 4.5, "AAA": 7.0},
+    "graphic": {"AA": 3.0, "AAA": 3.0},
+}
+
+# (foreground, background) -> kind of content drawn in that pair
+AUDIT_PAIRS = {
+    ("text", "background"): "text",
+    ("text", "text_background"): "text",
+    ("highlight", "background"): "text",
+    ("accent", "background"): "graphic",
+    ("time", "background"): "graphic",
+    ("displacement", "background"): "graphic",
+    ("dot", "background"): "graphic",
+    ("contrast_1", "background"): "graphic",
+    ("contrast_2", "background"): "graphic",
+}
+
+# Schemes that must pass at the given level for the audit to succeed
+REQUIRED_LEVELS = {
+    "high_contrast": "AAA",
+}
+
+
+# ============================================================================
+# LUMINANCE AND CONTRAST
+# ============================================================================
+
+def relative_luminance(rgb: np.ndarray) -> np.ndarray:
+    """
+    WCAG relative luminance of sRGB colors
+
+    Args:
+        rgb: Array of shape (..., 3) or (..., 4), sRGB 0-1
+
+    Returns:
+        Luminance array with shape rgb.shape[:-1]
+    """
+    linear = srgb_to_linear(np.asarray(rgb)[..., :3])
+    return linear @ np.array([0.2126, 0.7152, 0.0722])
+
+
+def contrast_ratio(luminance_a: np.ndarray, luminance_b: np.ndarray) -> np.ndarray:
+    """WCAG contrast ratio (1 to 21) between broadcastable luminance arrays"""
+    lighter = np.maximum(luminance_a, luminance_b)
+    darker = np.minimum(luminance_a, luminance_b)
+    return (lighter + 0.05) / (darker + 0.05)
+
+
+def contrast_tensor(rgba: np.ndarray) -> np.ndarray:
+    """
+    Pairwise contrast ratios between all colors of every scheme
+
+    Args:
+        rgba: (S x K x 3/4) colors, e.g. COLOR_TABLE.rgba
+
+    Returns:
+        (S x K x K) symmetric tensor; [s, i, j] is the contrast between keys
+        i and j of scheme s
+    """
+    luminance = relative_luminance(rgba)
+    return contrast_ratio(luminance[:, :, None], luminance[:, None, :])
+
+
+# ============================================================================
+# COLOR VISION DEFICIENCY SIMULATION
+# ============================================================================
+
+# Machado, Oliveira & Fernandes (2009), severity 1.0, applied to linear RGB
+CVD_MATRICES = {
+    "protan": np.array([
+        [0.152286, 1.052583, -0.204868],
+        [0.114503, 0.786281, 0.099216],
+        [-0.003882, -0.048116, 1.051998],
+    ]),
+    "deutan": np.array([
+        [0.367322, 0.860646, -0.227968],
+        [0.280085, 0.672501, 0.047413],
+        [-0.011820, 0.042940, 0.968881],
+    ]),
+    "tritan": np.array([
+        [1.255528, -0.076749, -0.178779],
+        [-0.078411, 0.930809, 0.147602],
+        [0.004733, 0.691367, 0.303900],
+    ]),
+}
+
+
+def simulate_cvd(rgba: np.ndarray, vision: str, severity: float = 1.0) -> np.ndarray:
+    """
+    Simulate how colors appear with a color vision deficiency
+
+    Args:
+        rgba: Array of shape (..., 3) or (..., 4), sRGB 0-1; alpha is kept
+        vision: "protan", "deutan" or "tritan"
+        severity: 0 (normal vision) to 1 (full dichromacy), blended linearly
+
+    Returns:
+        Simulated sRGB(A) colors, float64, same shape
+    """
+    if vision not in CVD_MATRICES:
+        raise ValueError(f"Unknown vision type {vision!r}; choose from {', '.join(CVD_MATRICES)}")
+    matrix = severity * CVD_MATRICES[vision] + (1 - severity) * np.eye(3)
+    rgba = np.asarray(rgba, dtype=np.float64)
+    result = rgba.copy()
+    linear = srgb_to_linear(rgba[..., :3]) @ matrix.T
+    result[..., :3] = np.clip(linear_to_srgb(np.clip(linear, 0.0, 1.0)), 0.0, 1.0)
+    return result
+
+
+# ============================================================================
+# AUDIT
+# ============================================================================
+
+class Finding(NamedTuple):
+    """One foreground/background pair that misses its required contrast"""
+    scheme: str
+    foreground: str
+    background: str
+    ratio: float
+    required: float
+    level: str
+    vision: str
+
+
+def audit_schemes(
+    table: SchemeTable = None,
+    level: str = "AA",
+    vision: Optional[str] = None,
+    pairs: Dict = None,
+    levels: Dict[str, str] = None
+) -> List[Finding]:
+    """
+    Check the semantic color pairs of every scheme against WCAG thresholds
+
+    Args:
+        table: Schemes to audit; default every table in COLOR_SCHEMES at the
+            time of the call (including tables attached with add_table)
+        level: Default level ("AA" or "AAA") for every scheme
+        vision: Optional CVD type to simulate before measuring
+        pairs: (foreground, background) -> "text"/"graphic"; default AUDIT_PAIRS
+        levels: Per-scheme level overrides (scheme name -> "AA"/"AAA")
+
+    Returns:
+        List of failing pairs, worst ratio first
+    """
+    if table is None:
+        findings = [f for t in COLOR_SCHEMES.tables() for f in audit_schemes(t, level, vision, pairs, levels)]
+        return sorted(findings, key=lambda f: f.ratio / f.required)
+    pairs = AUDIT_PAIRS if pairs is None else pairs
+    levels = levels or {}
+    rgba = table.rgba if vision is None else simulate_cvd(table.rgba, vision)
+    ratios = contrast_tensor(rgba)
+
+    pairs = [(fg, bg, kind) for (fg, bg), kind in pairs.items()
+             if fg in table.key_index and bg in table.key_index]
+    if not pairs:
+        return []
+    fg_index = np.array([table.key_index[fg] for fg, _, _ in pairs])
+    bg_index = np.array([table.key_index[bg] for _, bg, _ in pairs])
+    scheme_levels = [levels.get(name, level) for name in table.names]
+    required = np.array([[THRESHOLDS[kind][scheme_level] for _, _, kind in pairs]
+                         for scheme_level in scheme_levels])
+
+    pair_ratios = ratios[:, fg_index, bg_index]           # (S x P)
+    failing = np.argwhere(pair_ratios < required)
+    findings = [
+        Finding(table.names[s], pairs[p][0], pairs[p][1], float(pair_ratios[s, p]),
+                float(required[s, p]), scheme_levels[s], vision or "normal")
+        for s, p in failing
+    ]
+    return sorted(findings, key=lambda f: f.ratio / f.required)
+
+
+def validate_schemes(
+    table: SchemeTable = None,
+    required_levels: Dict[str, str] = None,
+    visions: Sequence[Optional[str]] = (None,)
+) -> List[Finding]:
+    """
+    Failures for the schemes that are required to be accessible
+
+    Args:
+        table: Schemes to audit; default every table in COLOR_SCHEMES
+        required_levels: Scheme name -> level; default REQUIRED_LEVELS
+        visions: Vision types to check (None = normal vision)
+
+    Returns:
+        Failing pairs of the required schemes (empty when all pass)
+    """
+    required_levels = REQUIRED_LEVELS if required_levels is None else required_levels
+    findings = []
+    for vision in visions:
+        findings += [f for f in audit_schemes(table, vision=vision, levels=required_levels)
+                     if f.scheme in required_levels]
+    return findings
+
+
+def format_findings(findings: List[Finding]) -> str:
+    """Format findings as an aligned text report"""
+    lines = []
+    for f in findings:
+        lines.append(f"  {f.scheme:22} {f.foreground:>13} on {f.background:16} "
+                     f"{f.ratio:5.2f}:1 < {f.required:.1f}:1 ({f.level}, {f.vision})")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="WCAG contrast audit for all color schemes")
+    parser.add_argument("--level", choices=("AA", "AAA"), default="AA",
+                        help="Level reported for schemes without a required level")
+    parser.add_argument("--vision", choices=("normal", "all") + tuple(CVD_MATRICES), default="normal",
+                        help="Also check colors as seen with a color vision deficiency")
+    args = parser.parse_args(argv)
+
+    visions = [None]
+    if args.vision == "all":
+        visions += list(CVD_MATRICES)
+    elif args.vision != "normal":
+        visions.append(args.vision)
+
+    print("Contrast Audit:")
+    print("===============")
+    for vision in visions:
+        findings = audit_schemes(level=args.level, vision=vision, levels=REQUIRED_LEVELS)
+        print(f"\n{vision or 'normal'} vision: {len(findings)} pair(s) below threshold")
+        if findings:
+            print(format_findings(findings))
+
+    failures = validate_schemes(visions=visions)
+    if failures:
+        print(f"\nFAILED: required schemes miss their level:\n{format_findings(failures)}")
+        return 1
+    print(f"\nOK: {', '.join(f'{name} ({lvl})' for name, lvl in REQUIRED_LEVELS.items())} pass")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -19,6 +19,7 @@ Author: Generated from manim libraries
 Version: 1.0
 """
 
+import os
 import numpy as np
 from typing import Callable, Tuple, List, Dict, Any
 import json
@@ -532,26 +533,67 @@ def sample_easing_function(
     return [(t, func(t)) for t in np.linspace(0, 1, num_samples)]
 
 
-def export_easing_to_json(filename: str = "easing_functions.json"):
+def evaluate_easing(func: Callable[[float], float], t: np.ndarray) -> np.ndarray:
+    """
+    Evaluate an easing function over an array of time values
+
+    Functions written with plain arithmetic accept arrays directly. Functions
+    that branch on t (e.g. ``t < 0.5``) cannot, so they fall back to an
+    element-wise loop.
+
+    Args:
+        func: Easing function to evaluate
+        t: Array of time parameters (0 to 1)
+
+    Returns:
+        Array of eased values with the same shape as t
+    """
+    t = np.asarray(t, dtype=float)
+    try:
+        return np.broadcast_to(np.asarray(func(t), dtype=float), t.shape)
+    except ValueError:
+        return np.fromiter((func(x) for x in t.ravel()), dtype=float, count=t.size).reshape(t.shape)
+
+
+# Decimal places of exported samples; digits beyond this are floating-point
+# noise that can differ between platforms and numpy builds
+EXPORT_PRECISION = 6
+
+
+def _canonical_float(value: float) -> float:
+    return round(float(value), EXPORT_PRECISION) + 0.0    # + 0.0 turns -0.0 into 0.0
+
+
+def export_easing_to_json(filename: str = "easing_functions.json", cache: Dict[str, Dict] = None):
     """
     Export sampled easing functions to JSON for use in web applications
     
+    The output is canonical (samples rounded to EXPORT_PRECISION places,
+    sorted keys, LF line endings), so it is byte-identical across machines.
+    
     Args:
         filename: Output JSON filename
+        cache: Optional easing name -> entry dict; entries found in it are
+            reused and new ones are stored (used by watch mode)
     """
+    cache = {} if cache is None else cache
     data = {}
     for name, func in EASING_FUNCTIONS.items():
+        if name in cache:
+            data[name] = cache[name]
+            continue
         try:
             samples = sample_easing_function(func, num_samples=50)
-            data[name] = {
-                "samples": [[float(t), float(v)] for t, v in samples],
+            data[name] = cache[name] = {
+                "samples": [[_canonical_float(t), _canonical_float(v)] for t, v in samples],
                 "css": CSS_TIMING_FUNCTIONS.get(name, "linear")
             }
         except Exception as e:
             print(f"Warning: Could not sample {name}: {e}")
     
-    with open(filename, 'w') as f:
-        json.dump(data, f, indent=2)
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write("\n")
 
 
 def export_easing_to_javascript(filename: str = "easing_functions.js"):
@@ -561,7 +603,7 @@ def export_easing_to_javascript(filename: str = "easing_functions.js"):
     Args:
         filename: Output JavaScript filename
     """
-    with open(filename, 'w') as f:
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("// Auto-generated easing functions for JavaScript use\n")
         f.write("// Generated from unified_animation_timing.py\n\n")
         
@@ -574,6 +616,7 @@ def export_easing_to_javascript(filename: str = "easing_functions.js"):
         functions.append("  rushInto: (t) => 2 * EASING_FUNCTIONS.smooth(0.5 * t)")
         functions.append("  rushFrom: (t) => 2 * EASING_FUNCTIONS.smooth(0.5 * (t + 1)) - 1")
         functions.append("  slowInto: (t) => Math.sqrt(1 - (1 - t) * (1 - t))")
+        functions.append("  thereAndBack: (t) => EASING_FUNCTIONS.smooth(t < 0.5 ? 2 * t : 2 * (1 - t))")
         functions.append("  easeInSine: (t) => 1 - Math.cos((t * Math.PI) / 2)")
         functions.append("  easeOutSine: (t) => Math.sin((t * Math.PI) / 2)")
         functions.append("  easeInOutSine: (t) => -(Math.cos(Math.PI * t) - 1) / 2")
@@ -591,7 +634,7 @@ def export_easing_to_javascript(filename: str = "easing_functions.js"):
         
         # CSS timing functions
         f.write("const CSS_TIMING_FUNCTIONS = {\n")
-        items = [f"  '{k}': '{v}'" for k, v in CSS_TIMING_FUNCTIONS.items()]
+        items = [f"  '{k}': '{v}'" for k, v in sorted(CSS_TIMING_FUNCTIONS.items())]
         f.write(",\n".join(items))
         f.write("\n};\n\n")
         
@@ -627,6 +670,13 @@ if (typeof module !== 'undefined' && module.exports) {
 """)
 
 
+# Opt-in call profiling (see unified_profiling.py); nothing is wrapped unless
+# the UNIFIED_STYLE_PROFILE environment variable is set
+if os.environ.get("UNIFIED_STYLE_PROFILE") and __name__ != "__main__":
+    import unified_profiling
+    unified_profiling.install_from_env()
+
+
 if __name__ == "__main__":
     # Example usage and testing
     print("Available Easing Functions:")
@@ -0,0 +1,235 @@
+"""
+Perceptual Distinctness of Scheme Colors (CIEDE2000)
+=====================================================
+
+A vectorized CIEDE2000 color difference and the reports built on it:
+- All intra-scheme and cross-scheme differences as one (S x K x S x K) tensor
+- Roles within a scheme that are visually indistinguishable
+- The same role reused with (nearly) the same color by different schemes
+
+Delta E 2000 below about 1 is imperceptible and below about 2.3 (one "just
+noticeable difference") hard to tell apart side by side, which is the
+default threshold here.
+
+Command line (exits 1 when distinct roles collide, so it can gate builds):
+    python unified_color_difference.py
+    python unified_color_difference.py --threshold 5 --cross
+
+Version: 1.0
+"""
+
+import argparse
+import sys
+from typing import FrozenSet, List, NamedTuple, Set
+
+import numpy as np
+
+from unified_color_schemes import COLOR_TABLE, SchemeTable
+from unified_color_spaces import srgb_to_lab
+
+
+DEFAULT_THRESHOLD = 2.3
+
+# Roles that are expected to share a color (backdrops for text and scene)
+SHARED_ROLES = frozenset({"text_background", "text_surrounding", "background"})
+
+# Deliberate reuse of one color for two roles in a specific scheme
+ALLOWED_COLLISIONS = frozenset({
+    ("erau", "text_surrounding", "highlight"),    # both SUNRISE_YELLOW (brand)
+})
+
+
+# ============================================================================
+# CIEDE2000
+# ============================================================================
+
+def ciede2000(lab1: np.ndarray, lab2: np.ndarray) -> np.ndarray:
+    """
+    CIEDE2000 color difference between broadcastable CIELAB arrays
+
+    Implements Sharma, Wu & Dalal (2005) with kL = kC = kH = 1.
+
+    Args:
+        lab1: Array of shape (..., 3)
+        lab2: Array of shape (..., 3), broadcastable against lab1
+
+    Returns:
+        Delta E 2000 values with the broadcast shape minus the channel axis
+    """
+    lab1 = np.asarray(lab1, dtype=np.float64)
+    lab2 = np.asarray(lab2, dtype=np.float64)
+    L1, a1, b1 = lab1[..., 0], lab1[..., 1], lab1[..., 2]
+    L2, a2, b2 = lab2[..., 0], lab2[..., 1], lab2[..., 2]
+
+    C_mean = (np.hypot(a1, b1) + np.hypot(a2, b2)) / 2
+    C_mean7 = C_mean ** 7
+    G = 0.5 * (1 - np.sqrt(C_mean7 / (C_mean7 + 25.0 ** 7)))
+    a1p = (1 + G) * a1
+    a2p = (1 + G) * a2
+    C1p = np.hypot(a1p, b1)
+    C2p = np.hypot(a2p, b2)
+    h1p = np.degrees(np.arctan2(b1, a1p)) % 360
+    h2p = np.degrees(np.arctan2(b2, a2p)) % 360
+
+    dLp = L2 - L1
+    dCp = C2p - C1p
+    chroma_zero = (C1p * C2p) == 0
+    dhp = h2p - h1p
+    dhp = np.where(dhp > 180, dhp - 360, np.where(dhp < -180, dhp + 360, dhp))
+    dhp = np.where(chroma_zero, 0.0, dhp)
+    dHp = 2 * np.sqrt(C1p * C2p) * np.sin(np.radians(dhp) / 2)
+
+    Lp_mean = (L1 + L2) / 2
+    Cp_mean = (C1p + C2p) / 2
+    h_sum = h1p + h2p
+    hp_mean = np.where(
+        chroma_zero, h_sum,
+        np.where(np.abs(h1p - h2p) <= 180, h_sum / 2,
+                 np.where(h_sum < 360, (h_sum + 360) / 2, (h_sum - 360) / 2)))
+
+    T = (1
+         - 0.17 * np.cos(np.radians(hp_mean - 30))
+         + 0.24 * np.cos(np.radians(2 * hp_mean))
+         + 0.32 * np.cos(np.radians(3 * hp_mean + 6))
+         - 0.20 * np.cos(np.radians(4 * hp_mean - 63)))
+    d_theta = 30 * np.exp(-(((hp_mean - 275) / 25) ** 2))
+    Cp_mean7 = Cp_mean ** 7
+    R_C = 2 * np.sqrt(Cp_mean7 / (Cp_mean7 + 25.0 ** 7))
+    S_L = 1 + (0.015 * (Lp_mean - 50) ** 2) / np.sqrt(20 + (Lp_mean - 50) ** 2)
+    S_C = 1 + 0.045 * Cp_mean
+    S_H = 1 + 0.015 * Cp_mean * T
+    R_T = -np.sin(np.radians(2 * d_theta)) * R_C
+
+    return np.sqrt(
+        (dLp / S_L) ** 2
+        + (dCp / S_C) ** 2
+        + (dHp / S_H) ** 2
+        + R_T * (dCp / S_C) * (dHp / S_H)
+    )
+
+
+def delta_e_tensor(table: SchemeTable = COLOR_TABLE, chunk_size: int = 4096) -> np.ndarray:
+    """
+    Delta E 2000 between every pair of colors in a scheme table
+
+    Args:
+        table: Schemes to compare
+        chunk_size: Rows computed per batch, bounding temporary memory for
+            large scheme libraries
+
+    Returns:
+        (S x K x S x K) float32 tensor; [s, i, t, j] compares key i of scheme
+        s with key j of scheme t. [s, :, s, :] are the intra-scheme matrices.
+    """
+    S, K = len(table.names), len(table.keys)
+    lab = srgb_to_lab(table.rgba[..., :3]).reshape(S * K, 3)
+    result = np.empty((S * K, S * K), dtype=np.float32)
+    for start in range(0, S * K, chunk_size):
+        stop = min(start + chunk_size, S * K)
+        result[start:stop] = ciede2000(lab[start:stop, None, :], lab[None, :, :])
+    return result.reshape(S, K, S, K)
+
+
+def intra_scheme_delta_e(table: SchemeTable = COLOR_TABLE) -> np.ndarray:
+    """(S x K x K) Delta E 2000 between the keys of each scheme"""
+    lab = srgb_to_lab(table.rgba[..., :3])
+    return ciede2000(lab[:, :, None, :], lab[:, None, :, :]).astype(np.float32)
+
+
+# ============================================================================
+# REPORTS
+# ============================================================================
+
+class Collision(NamedTuple):
+    """Two scheme colors closer than the distinctness threshold"""
+    scheme_a: str
+    key_a: str
+    scheme_b: str
+    key_b: str
+    delta_e: float
+
+
+def indistinguishable_roles(
+    table: SchemeTable = COLOR_TABLE,
+    threshold: float = DEFAULT_THRESHOLD,
+    shared_roles: FrozenSet[str] = SHARED_ROLES,
+    allowed: FrozenSet[tuple] = ALLOWED_COLLISIONS
+) -> List[Collision]:
+    """
+    Roles within a scheme whose colors cannot be told apart
+
+    Args:
+        table: Schemes to check
+        threshold: Maximum Delta E 2000 considered indistinguishable
+        shared_roles: Roles allowed to share a color with each other
+        allowed: (scheme, key, key) triples that may share a color
+
+    Returns:
+        Collisions, closest first
+    """
+    delta = intra_scheme_delta_e(table)
+    keys = table.keys
+    shared = np.array([[a in shared_roles and b in shared_roles for b in keys] for a in keys])
+    upper = np.triu(np.ones((len(keys), len(keys)), dtype=bool), k=1)
+    hits = np.argwhere((delta < threshold) & (upper & ~shared)[None])
+    collisions = [Collision(table.names[s], keys[i], table.names[s], keys[j], float(delta[s, i, j]))
+                  for s, i, j in hits
+                  if (table.names[s], keys[i], keys[j]) not in allowed
+                  and (table.names[s], keys[j], keys[i]) not in allowed]
+    return sorted(collisions, key=lambda c: c.delta_e)
+
+
+def shared_across_schemes(
+    table: SchemeTable = COLOR_TABLE,
+    threshold: float = DEFAULT_THRESHOLD,
+    exclude: Set[str] = SHARED_ROLES
+) -> List[Collision]:
+    """
+    The same role given (nearly) the same color by different schemes
+
+    Args:
+        table: Schemes to check
+        threshold: Maximum Delta E 2000 considered the same color
+        exclude: Roles to skip (backgrounds are often plain black everywhere)
+
+    Returns:
+        Collisions, closest first
+    """
+    lab = srgb_to_lab(table.rgba[..., :3])                 # (S x K x 3)
+    delta = ciede2000(lab[:, None, :, :], lab[None, :, :, :])  # (S x S x K)
+    upper = np.triu(np.ones((len(table.names),) * 2, dtype=bool), k=1)
+    hits = np.argwhere((delta < threshold) & upper[:, :, None])
+    collisions = [Collision(table.names[s], table.keys[k], table.names[t], table.keys[k], float(delta[s, t, k]))
+                  for s, t, k in hits if table.keys[k] not in exclude]
+    return sorted(collisions, key=lambda c: c.delta_e)
+
+
+def format_collisions(collisions: List[Collision]) -> str:
+    """Format collisions as an aligned text report"""
+    lines = []
+    for c in collisions:
+        left = f"{c.scheme_a}.{c.key_a}"
+        right = f"{c.scheme_b}.{c.key_b}"
+        lines.append(f"  {left:36} ~ {right:36} dE00 = {c.delta_e:.2f}")
+    return "\n".join(lines)
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="CIEDE2000 distinctness check for color scheme roles")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Delta E 2000 below which colors count as indistinguishable")
+    parser.add_argument("--cross", action="store_true",
+                        help="Also list roles reused with the same color across schemes")
+    args = parser.parse_args(argv)
+
+    collisions = indistinguishable_roles(threshold=args.threshold)
+    print(f"Indistinguishable roles (dE00 < {args.threshold}):")
+    print(format_collisions(collisions) or "  None.")
+    if args.cross:
+        print(f"\nRoles sharing a color across schemes (dE00 < {args.threshold}):")
+        print(format_collisions(shared_across_schemes(threshold=args.threshold)) or "  None.")
+    return 1 if collisions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
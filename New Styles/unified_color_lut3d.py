@@ -0,0 +1,252 @@
+"""
+3D Color LUTs for Retheming Rendered Images and Videos
+=======================================================
+
+Builds a 3D color lookup table (e.g. 33 x 33 x 33) that maps the colors of
+one scheme onto the same-role colors of another. Every grid color is moved in
+OKLab by a weighted blend of the palette offsets (target - source) of the
+nearby source roles, with a Gaussian falloff, so scheme colors land exactly
+on their targets, anti-aliased edges follow smoothly and unrelated colors
+stay untouched.
+
+The LUT can be:
+- Exported as a standard .cube file for ffmpeg's lut3d filter:
+      ffmpeg -i render.mp4 -vf lut3d=dark_to_erau.cube rethemed.mp4
+- Applied to NumPy images with trilinear interpolation, or streamed over
+  large .npy frame stacks chunk by chunk through memory maps
+
+Command line:
+    python unified_color_lut3d.py deep_jewel_tones erau -o jewel_to_erau.cube
+
+Version: 1.0
+"""
+
+import argparse
+import sys
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from unified_color_schemes import ColorScheme, get_scheme
+from unified_color_spaces import srgb_to_oklab, oklab_to_srgb
+
+
+DEFAULT_SIZE = 33
+DEFAULT_FALLOFF = 0.1    # OKLab distance at which a role's pull drops to ~60%
+
+# Roles that win when several roles share one source color
+PRIMARY_ROLES = ("background", "text", "highlight")
+
+
+def _resolve_scheme(scheme: Union[str, ColorScheme]) -> ColorScheme:
+    return get_scheme(scheme) if isinstance(scheme, str) else scheme
+
+
+# ============================================================================
+# LUT CONSTRUCTION
+# ============================================================================
+
+def palette_mapping(
+    from_scheme: Union[str, ColorScheme],
+    to_scheme: Union[str, ColorScheme],
+    keys: Optional[Sequence[str]] = None
+) -> tuple:
+    """
+    Source and target OKLab colors for each distinct source color
+
+    When several roles share one source color (e.g. background and
+    text_background) the pixel cannot tell them apart, so the target of the
+    first role in PRIMARY_ROLES order (then keys() order) wins.
+
+    Returns:
+        (source_lab, target_lab), each (M x 3)
+    """
+    start = _resolve_scheme(from_scheme)
+    end = _resolve_scheme(to_scheme)
+    keys = list(keys or start.keys())
+    keys.sort(key=lambda key: PRIMARY_ROLES.index(key) if key in PRIMARY_ROLES else len(PRIMARY_ROLES))
+    source = start.take(keys, np.uint8)[:, :3]
+    _, first = np.unique(source, axis=0, return_index=True)
+    first = np.sort(first)
+    chosen = [keys[i] for i in first]
+    return srgb_to_oklab(source[first] / 255.0), srgb_to_oklab(end.take(chosen)[:, :3])
+
+
+def build_lut3d(
+    from_scheme: Union[str, ColorScheme],
+    to_scheme: Union[str, ColorScheme],
+    size: int = DEFAULT_SIZE,
+    falloff: float = DEFAULT_FALLOFF,
+    keys: Optional[Sequence[str]] = None
+) -> np.ndarray:
+    """
+    Build a 3D LUT mapping one scheme's palette onto another's
+
+    Args:
+        from_scheme: Scheme the footage was rendered with
+        to_scheme: Scheme to retheme to
+        size: Grid points per axis (17, 33 and 65 are common)
+        falloff: Gaussian width in OKLab units; larger values recolor a wider
+            neighbourhood around each palette color
+        keys: Roles to map (default: all keys of from_scheme)
+
+    Returns:
+        (size x size x size x 3) float32 sRGB array indexed [r, g, b]
+    """
+    source, target = palette_mapping(from_scheme, to_scheme, keys)
+    axis = np.linspace(0, 1, size)
+    grid = np.stack(np.meshgrid(axis, axis, axis, indexing="ij"), axis=-1).reshape(-1, 3)
+    lab = srgb_to_oklab(grid)
+
+    distance2 = np.sum((lab[:, None, :] - source[None, :, :]) ** 2, axis=-1)
+    # Inverse-distance weights pick the nearest role(s) and reproduce each
+    # palette color exactly; the Gaussian of the nearest distance fades the
+    # whole offset out away from the palette
+    inverse = 1.0 / np.maximum(distance2, 1e-12) ** 2
+    offset = (inverse @ (target - source)) / inverse.sum(axis=1, keepdims=True)
+    falloff_weight = np.exp(-distance2.min(axis=1) / (2 * falloff ** 2))
+    lab += falloff_weight[:, None] * offset
+
+    return oklab_to_srgb(lab).reshape(size, size, size, 3).astype(np.float32)
+
+
+# ============================================================================
+# .CUBE EXPORT
+# ============================================================================
+
+def export_cube(lut: np.ndarray, filename: str, title: str = "Unified style retheme"):
+    """
+    Write a LUT as an Adobe/Resolve .cube file (readable by ffmpeg lut3d)
+
+    Args:
+        lut: (N x N x N x 3) sRGB array indexed [r, g, b]
+        filename: Output .cube filename
+        title: TITLE line written into the file
+    """
+    size = lut.shape[0]
+    # .cube lists entries with red changing fastest, then green, then blue
+    rows = np.transpose(lut, (2, 1, 0, 3)).reshape(-1, 3)
+    with open(filename, 'w', newline='\n') as f:
+        f.write(f'TITLE "{title}"\n')
+        f.write(f"LUT_3D_SIZE {size}\n")
+        f.write("DOMAIN_MIN 0.0 0.0 0.0\n")
+        f.write("DOMAIN_MAX 1.0 1.0 1.0\n")
+        np.savetxt(f, rows, fmt="%.6f")
+
+
+def load_cube(filename: str) -> np.ndarray:
+    """Read a .cube file back into an (N x N x N x 3) array indexed [r, g, b]"""
+    size = None
+    values = []
+    with open(filename) as f:
+        for line in f:
+            parts = line.split()
+            if not parts or parts[0].startswith("#"):
+                continue
+            if parts[0] == "LUT_3D_SIZE":
+                size = int(parts[1])
+            elif parts[0][0].isdigit() or parts[0][0] in "-.":
+                values.append([float(p) for p in parts[:3]])
+    if size is None:
+        raise ValueError(f"{filename} is not a 3D .cube file (no LUT_3D_SIZE)")
+    rows = np.array(values, dtype=np.float32).reshape(size, size, size, 3)
+    return np.transpose(rows, (2, 1, 0, 3))
+
+
+# ============================================================================
+# APPLYING LUTS TO IMAGES
+# ============================================================================
+
+def apply_lut3d(image: np.ndarray, lut: np.ndarray, chunk_pixels: int = 1 << 20) -> np.ndarray:
+    """
+    Recolor an image through a 3D LUT with trilinear interpolation
+
+    Args:
+        image: (..., 3) or (..., 4) array, uint8 (0-255) or float (0-1);
+            alpha is copied unchanged
+        lut: (N x N x N x 3) sRGB LUT indexed [r, g, b]
+        chunk_pixels: Pixels interpolated per batch (bounds temporary memory)
+
+    Returns:
+        Recolored image with the same shape and dtype
+    """
+    image = np.asarray(image)
+    is_uint8 = image.dtype == np.uint8
+    pixels = image.reshape(-1, image.shape[-1])
+    result = np.empty_like(pixels)
+    size = lut.shape[0]
+    flat_lut = lut.reshape(-1, 3).astype(np.float32)
+    strides = np.array([size * size, size, 1])
+
+    for start in range(0, len(pixels), chunk_pixels):
+        chunk = pixels[start:start + chunk_pixels]
+        rgb = chunk[:, :3].astype(np.float32)
+        if is_uint8:
+            rgb /= 255.0
+        coords = np.clip(rgb, 0.0, 1.0) * (size - 1)
+        low = np.minimum(coords.astype(np.intp), size - 2)
+        frac = coords - low
+        base = low @ strides
+
+        out = np.zeros((len(chunk), 3), dtype=np.float32)
+        for corner in range(8):
+            offset = np.array([(corner >> 2) & 1, (corner >> 1) & 1, corner & 1])
+            weight = np.prod(np.where(offset, frac, 1.0 - frac), axis=1)
+            out += weight[:, None] * flat_lut[base + offset @ strides]
+
+        if is_uint8:
+            out = np.rint(out * 255.0)
+        result[start:start + len(chunk), :3] = out
+        result[start:start + len(chunk), 3:] = chunk[:, 3:]
+    return result.reshape(image.shape)
+
+
+def apply_lut3d_to_file(
+    source: str,
+    destination: str,
+    lut: np.ndarray,
+    frames_per_chunk: int = 8
+):
+    """
+    Stream a .npy stack of frames (F x H x W x C) through a 3D LUT
+
+    Both files are memory-mapped, so only frames_per_chunk frames are in
+    memory at a time regardless of the video length.
+
+    Args:
+        source: Input .npy file (e.g. frames dumped from a render)
+        destination: Output .npy file, created with the same shape and dtype
+        lut: (N x N x N x 3) sRGB LUT indexed [r, g, b]
+        frames_per_chunk: Frames processed per batch
+    """
+    frames = np.load(source, mmap_mode="r")
+    output = np.lib.format.open_memmap(destination, mode="w+", dtype=frames.dtype, shape=frames.shape)
+    for start in range(0, frames.shape[0], frames_per_chunk):
+        output[start:start + frames_per_chunk] = apply_lut3d(frames[start:start + frames_per_chunk], lut)
+    output.flush()
+    del output
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Build a .cube LUT that rethemes one color scheme to another")
+    parser.add_argument("from_scheme", help="Scheme the footage was rendered with")
+    parser.add_argument("to_scheme", help="Scheme to retheme to")
+    parser.add_argument("-o", "--output", help="Output .cube file (default <from>_to_<to>.cube)")
+    parser.add_argument("--size", type=int, default=DEFAULT_SIZE, help="Grid points per axis")
+    parser.add_argument("--falloff", type=float, default=DEFAULT_FALLOFF, help="Gaussian width in OKLab units")
+    parser.add_argument("--apply", nargs=2, metavar=("SRC_NPY", "DST_NPY"),
+                        help="Also stream a .npy frame stack through the LUT")
+    args = parser.parse_args(argv)
+
+    lut = build_lut3d(args.from_scheme, args.to_scheme, size=args.size, falloff=args.falloff)
+    output = args.output or f"{args.from_scheme}_to_{args.to_scheme}.cube"
+    export_cube(lut, output, title=f"{args.from_scheme} to {args.to_scheme}")
+    print(f"Wrote {output} ({args.size}^3)")
+    if args.apply:
+        apply_lut3d_to_file(args.apply[0], args.apply[1], lut)
+        print(f"Wrote {args.apply[1]}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
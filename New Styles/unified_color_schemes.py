@@ -17,7 +17,15 @@ Author: Generated from manim libraries
 Version: 1.0
 """
 
-from typing import Dict, Tuple, List, Any
+import os
+import warnings
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Dict, Tuple, List, Any, Iterable, Callable
+
+# NumPy and the color-space math are imported by the functions that need
+# them, so importing this module (e.g. just for the hex data) stays cheap
+if TYPE_CHECKING:
+    import numpy as np
 
 
 def hex_to_rgb(hex_str: str) -> Tuple[float, float, float]:
@@ -26,72 +34,391 @@ def hex_to_rgb(hex_str: str) -> Tuple[float, float, float]:
     return tuple(int(hex_str[i:i+2], 16) / 255.0 for i in (0, 2, 4))
 
 
+# (byte value -> hex digit value with 255 for non-digits, digit -> byte);
+# built on first use
+_HEX_TABLES = None
+
+
+def _hex_tables() -> Tuple["np.ndarray", "np.ndarray"]:
+    global _HEX_TABLES
+    if _HEX_TABLES is None:
+        import numpy as np
+        digit_values = np.full(256, 255, dtype=np.uint8)
+        for digit, char in enumerate(b"0123456789abcdef"):
+            digit_values[char] = digit
+            digit_values[bytes([char]).upper()[0]] = digit
+        _HEX_TABLES = (digit_values, np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8))
+    return _HEX_TABLES
+
+
+def hex_to_rgb_many(hex_values, dtype="float32") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Convert many hex colors to RGBA at once
+    
+    Accepts '#RGB', '#RRGGBB' and '#RRGGBBAA' (the '#' is optional,
+    surrounding whitespace is ignored). The strings are parsed as one
+    fixed-width character buffer (np.frombuffer) with table lookups instead
+    of one int() call per channel.
+    
+    Args:
+        hex_values: Sequence or array of hex strings (any shape)
+        dtype: np.float32 for values 0-1 or np.uint8 for values 0-255
+        
+    Returns:
+        (rgba, valid): rgba has shape hex_values.shape + (4,) with alpha 1 (or
+        255) unless given; valid is a boolean mask that is False where the
+        string could not be parsed (those rows are opaque black)
+        
+    Example:
+        >>> rgba, valid = hex_to_rgb_many(["#FFFF00", "#0f0", "oops"], np.uint8)
+        >>> valid
+        array([ True,  True, False])
+    """
+    import numpy as np
+    strings = np.char.strip(np.asarray(hex_values, dtype=str))
+    shape = strings.shape
+    count = strings.size
+    
+    # View the fixed-width UTF-32 buffer as one code point per cell; anything
+    # outside ASCII maps to 0xFF, which is not a hex digit
+    chars = max(strings.dtype.itemsize // 4, 1)
+    width = max(chars, 9)
+    buf = np.zeros((count, width), dtype=np.uint8)
+    if count:
+        codes = np.frombuffer(np.ascontiguousarray(strings).tobytes(), dtype=np.uint32)
+        buf[:, :chars] = np.where(codes < 128, codes, 0xFF).reshape(count, chars)
+    
+    lengths = np.count_nonzero(buf, axis=1)
+    has_hash = buf[:, 0] == ord("#")
+    num_digits = lengths - has_hash
+    
+    # Up to 8 digit values per string, starting after the optional '#'
+    positions = np.minimum(has_hash[:, None] + np.arange(8), width - 1)
+    nibbles = _hex_tables()[0][np.take_along_axis(buf, positions, axis=1)].astype(np.uint16)
+    in_use = np.arange(8) < num_digits[:, None]
+    valid = np.isin(num_digits, (3, 6, 8)) & ~np.any(in_use & (nibbles == 255), axis=1)
+    
+    short = (num_digits == 3)[:, None]
+    pairs = nibbles[:, 0::2] * 16 + nibbles[:, 1::2]
+    rgba8 = np.empty((count, 4), dtype=np.uint8)
+    rgba8[:, :3] = np.where(short, nibbles[:, :3] * 17, pairs[:, :3])
+    rgba8[:, 3] = np.where(num_digits == 8, pairs[:, 3], 255)
+    rgba8[~valid] = (0, 0, 0, 255)
+    
+    rgba8 = rgba8.reshape(shape + (4,))
+    valid = valid.reshape(shape)
+    if np.dtype(dtype) == np.uint8:
+        return rgba8, valid
+    return rgba8.astype(dtype) / np.asarray(255, dtype=dtype), valid
+
+
+def rgb_to_hex_many(colors, include_alpha: bool = False) -> "np.ndarray":
+    """
+    Convert many RGB or RGBA colors to '#RRGGBB' (or '#RRGGBBAA') strings
+    
+    Args:
+        colors: Array of shape (..., 3) or (..., 4); floats are treated as
+            0-1 and clipped, integers as 0-255
+        include_alpha: Append the alpha channel (255 if colors have none)
+        
+    Returns:
+        Array of uppercase hex strings with shape colors.shape[:-1]
+    """
+    import numpy as np
+    colors = np.asarray(colors)
+    if np.issubdtype(colors.dtype, np.floating):
+        values = np.rint(np.clip(colors, 0.0, 1.0) * 255).astype(np.uint8)
+    else:
+        values = np.clip(colors, 0, 255).astype(np.uint8)
+    if include_alpha and values.shape[-1] == 3:
+        values = np.concatenate([values, np.full(values.shape[:-1] + (1,), 255, np.uint8)], axis=-1)
+    channels = values[..., :4 if include_alpha else 3].reshape(-1, 4 if include_alpha else 3)
+    
+    digit_chars = _hex_tables()[1]
+    width = 1 + 2 * channels.shape[1]
+    chars = np.empty((channels.shape[0], width), dtype=np.uint8)
+    chars[:, 0] = ord("#")
+    chars[:, 1::2] = digit_chars[channels >> 4]
+    chars[:, 2::2] = digit_chars[channels & 0x0F]
+    strings = np.ascontiguousarray(chars).view(f"S{width}").ravel().astype(f"U{width}")
+    return strings.reshape(colors.shape[:-1])
+
+
+def _warn_invalid(name: str, keys: Tuple[str, ...], valid: "np.ndarray"):
+    """Warn about colors that failed to parse (they are stored as black)"""
+    if not valid.all():
+        bad = [key for key, ok in zip(keys, valid) if not ok]
+        warnings.warn(f"Color scheme {name!r}: invalid colors for {bad} replaced with black")
+
+
+# Tone levels of derived palettes: 100 (lightest tint) to 900 (darkest
+# shade), with the scheme color itself at 500
+TONE_LEVELS = (100, 200, 300, 400, 500, 600, 700, 800, 900)
+BASE_TONE = 500
+
+# Translucent fill levels (e.g. fill_opacity=0.3)
+ALPHA_LEVELS = (0.1, 0.2, 0.3, 0.4, 0.5, 0.6, 0.7, 0.8, 0.9)
+
+
+def tone_palette(rgba: "np.ndarray", levels: Iterable[int] = TONE_LEVELS) -> "np.ndarray":
+    """
+    Tints and shades of colors at the given tone levels, in OKLCH
+    
+    Lightness moves from the color's own value at 500 toward near-white at
+    100 and toward 35% of its value at 900; chroma tapers toward both ends
+    and is then reduced as needed to stay in sRGB gamut. Hue is kept.
+    
+    Args:
+        rgba: (..., 3/4) sRGB colors (0-1); alpha is copied
+        levels: Tone levels (500 = the color itself)
+        
+    Returns:
+        (..., N, 4) float32 RGBA array, one entry per level
+    """
+    import numpy as np
+    from unified_color_spaces import gamut_map_oklch, oklab_to_oklch, oklch_to_oklab, srgb_to_oklab, oklab_to_srgb
+    rgba = np.asarray(rgba, dtype=np.float64)
+    levels = np.asarray(list(levels), dtype=np.float64)
+    lch = oklab_to_oklch(srgb_to_oklab(rgba[..., :3]))[..., None, :]
+    amount = np.abs(levels - BASE_TONE) / 400
+    lighter = levels < BASE_TONE
+    
+    L, C = lch[..., 0], lch[..., 1]
+    L_end = np.where(lighter, np.maximum(L, 0.97), 0.35 * L)
+    toned = np.broadcast_to(lch, lch.shape[:-2] + (len(levels), 3)).copy()
+    toned[..., 0] = L + (L_end - L) * amount
+    toned[..., 1] = C * (1 - np.where(lighter, 0.7, 0.3) * np.minimum(amount, 1))
+    
+    result = np.empty(toned.shape[:-1] + (4,), dtype=np.float32)
+    result[..., :3] = oklab_to_srgb(oklch_to_oklab(gamut_map_oklch(toned)))
+    result[..., 3] = rgba[..., None, 3] if rgba.shape[-1] > 3 else 1.0
+    # The base level is the exact input color
+    result[..., levels == BASE_TONE, :3] = rgba[..., None, :3]
+    return result
+
+
 class ColorScheme:
-    """Base class for color scheme definitions"""
+    """
+    Base class for color scheme definitions
+    
+    Colors are stored packed: one contiguous (K x 4) float32 RGBA array, a
+    uint8 copy of it, and a key -> row index. Both arrays are read-only and
+    can be handed to NumPy pipelines or Manim shaders without copying (see
+    as_array, as_memoryview and take). Every scheme is a row of a
+    SchemeTable (a scheme built from a dict gets a table of its own); the
+    scalar accessors (rgb, rgba255, css_rgba, ...) index the table's plain
+    tuples, which are built for all of its schemes on first use.
+    
+    Derived palettes (tone ramps, alpha ramps and their hex strings) are
+    computed for all keys at once on first use and cached per scheme;
+    other modules cache their own conversions the same way with derived().
+    """
+    
+    __slots__ = ("name", "_keys", "_hex", "_index", "_rgba", "_rgba8", "_derived",
+                 "_table", "_row", "_scalars")
     
     def __init__(self, name: str, colors: Dict[str, str]):
+        # Invalid colors become black (with a warning)
+        self._bind(name, SchemeTable({name: colors}), 0)
+    
+    @classmethod
+    def _view(cls, name: str, table: "SchemeTable", row: int) -> "ColorScheme":
+        """Create a scheme over one row of a table's packed storage"""
+        scheme = cls.__new__(cls)
+        scheme._bind(name, table, row)
+        return scheme
+    
+    def _bind(self, name: str, table: "SchemeTable", row: int):
         self.name = name
-        self._hex_colors = colors
-        self._rgb_colors = {}
-        self._rgba_colors = {}
-        
-        # Pre-compute all color formats
-        for key, hex_value in colors.items():
-            try:
-                rgb = hex_to_rgb(hex_value)
-                self._rgb_colors[key] = rgb
-                self._rgba_colors[key] = (*rgb, 1.0)
-            except:
-                # Fallback for invalid colors
-                self._rgb_colors[key] = (0, 0, 0)
-                self._rgba_colors[key] = (0, 0, 0, 1.0)
+        self._keys = table.keys
+        self._hex = table._hex_row(row)
+        self._index = table.key_index
+        self._rgba = table.rgba[row]
+        self._rgba8 = table.rgba8[row]
+        self._derived = {}
+        self._table = table
+        self._row = row
+        self._scalars = None
+    
+    def _load_scalars(self) -> List[Tuple[Tuple[int, int, int], Tuple[float, float, float]]]:
+        self._scalars = self._table._scalar_rows()[self._row]
+        return self._scalars
     
     def hex(self, key: str) -> str:
         """Get color as hex string (e.g., '#FFFFFF')"""
-        return self._hex_colors.get(key, "#000000")
+        k = self._index.get(key)
+        return "#000000" if k is None else self._hex[k]
     
     def rgb(self, key: str) -> Tuple[float, float, float]:
         """Get color as RGB tuple (values 0-1)"""
-        return self._rgb_colors.get(key, (0, 0, 0))
+        k = self._index.get(key)
+        if k is None:
+            return (0.0, 0.0, 0.0)
+        return (self._scalars or self._load_scalars())[k][1]
     
     def rgba(self, key: str, alpha: float = 1.0) -> Tuple[float, float, float, float]:
         """Get color as RGBA tuple (values 0-1)"""
-        r, g, b = self.rgb(key)
+        k = self._index.get(key)
+        if k is None:
+            return (0.0, 0.0, 0.0, alpha)
+        r, g, b = (self._scalars or self._load_scalars())[k][1]
         return (r, g, b, alpha)
     
     def rgb255(self, key: str) -> Tuple[int, int, int]:
         """Get color as RGB tuple (values 0-255)"""
-        r, g, b = self.rgb(key)
-        return (int(r * 255), int(g * 255), int(b * 255))
+        k = self._index.get(key)
+        if k is None:
+            return (0, 0, 0)
+        return (self._scalars or self._load_scalars())[k][0]
     
     def rgba255(self, key: str, alpha: int = 255) -> Tuple[int, int, int, int]:
         """Get color as RGBA tuple (values 0-255)"""
-        r, g, b = self.rgb255(key)
+        k = self._index.get(key)
+        if k is None:
+            return (0, 0, 0, alpha)
+        r, g, b = (self._scalars or self._load_scalars())[k][0]
         return (r, g, b, alpha)
     
     def css_rgb(self, key: str) -> str:
         """Get color as CSS rgb string"""
-        r, g, b = self.rgb255(key)
-        return f"rgb({r}, {g}, {b})"
+        return "rgb({}, {}, {})".format(*self.rgb255(key))
     
     def css_rgba(self, key: str, alpha: float = 1.0) -> str:
         """Get color as CSS rgba string"""
         r, g, b = self.rgb255(key)
         return f"rgba({r}, {g}, {b}, {alpha})"
     
+    # ------------------------------------------------------------------
+    # Bulk / zero-copy access
+    # ------------------------------------------------------------------
+    
+    def as_array(self, dtype="float32") -> "np.ndarray":
+        """
+        Get all colors as a read-only (K x 4) RGBA array, rows in keys() order
+        
+        Args:
+            dtype: np.float32 for values 0-1 or np.uint8 for values 0-255
+            
+        Returns:
+            The scheme's own storage (no copy)
+        """
+        import numpy as np
+        if np.dtype(dtype) == np.uint8:
+            return self._rgba8
+        if np.dtype(dtype) == np.float32:
+            return self._rgba
+        raise ValueError(f"Unsupported dtype {dtype!r}; use np.float32 or np.uint8")
+    
+    def as_memoryview(self, dtype="float32") -> memoryview:
+        """Get the packed RGBA storage as a read-only buffer (e.g., for shaders)"""
+        return memoryview(self.as_array(dtype))
+    
+    def indices(self, keys: Iterable[str]) -> "np.ndarray":
+        """
+        Get the row of each key, for repeated fancy indexing into as_array()
+        
+        Raises:
+            KeyError: If a key is not part of this scheme
+        """
+        import numpy as np
+        index = self._index
+        return np.fromiter((index[key] for key in keys), dtype=np.intp)
+    
+    def take(self, keys: Iterable[str], dtype="float32") -> "np.ndarray":
+        """
+        Look up many colors at once
+        
+        Args:
+            keys: Color keys, repeats allowed (e.g., one per mobject)
+            dtype: np.float32 for values 0-1 or np.uint8 for values 0-255
+            
+        Returns:
+            New (N x 4) RGBA array
+            
+        Raises:
+            KeyError: If a key is not part of this scheme
+        """
+        return self.as_array(dtype)[self.indices(keys)]
+    
+    # ------------------------------------------------------------------
+    # Derived palettes (cached)
+    # ------------------------------------------------------------------
+    
+    def derived(self, cache_key, compute: Callable[[], Any]) -> Any:
+        """
+        Get a value computed from this scheme, computing it on first use
+        
+        Lets other modules cache per-scheme conversions (e.g. Manim color
+        tables) next to the built-in palettes; arrays are made read-only.
+        
+        Args:
+            cache_key: Hashable key; prefix it with the caller's name so it
+                cannot clash with other users (e.g. ("manim", "rgba"))
+            compute: Called without arguments on the first request for the key
+        """
+        value = self._derived.get(cache_key)
+        if value is None:
+            value = self._derived[cache_key] = compute()
+            if hasattr(value, "flags"):    # NumPy arrays
+                value.flags.writeable = False
+        return value
+    
+    def tone_ramp(self, levels: Iterable[int] = TONE_LEVELS) -> "np.ndarray":
+        """
+        Get tints and shades of every key (see tone_palette)
+        
+        Returns:
+            Read-only (K x N x 4) float32 array, cached per set of levels
+        """
+        levels = tuple(levels)
+        return self.derived(("tones", levels), lambda: tone_palette(self._rgba, levels))
+    
+    def tone(self, key: str, level: int) -> str:
+        """Get a tint/shade of a color as hex (e.g., tone("highlight", 300))"""
+        hex_table = self.derived(("tone_hex", level), lambda: tuple(
+            rgb_to_hex_many(self.tone_ramp((level,))[:, 0, :3]).tolist()))
+        return hex_table[self._index[key]]
+    
+    def alpha_ramp(self, alphas: Iterable[float] = ALPHA_LEVELS, premultiplied: bool = True) -> "np.ndarray":
+        """
+        Get every key at several opacities
+        
+        Args:
+            alphas: Opacity levels (0-1)
+            premultiplied: Multiply RGB by alpha (as blending shaders expect)
+            
+        Returns:
+            Read-only (K x A x 4) float32 array, cached per arguments
+        """
+        alphas = tuple(alphas)
+        
+        def compute():
+            import numpy as np
+            alpha = np.asarray(alphas, dtype=np.float32)[None, :, None]
+            ramp = np.repeat(self._rgba[:, None, :], len(alphas), axis=1)
+            ramp[..., 3:] = alpha
+            if premultiplied:
+                ramp[..., :3] *= alpha
+            return ramp
+        return self.derived(("alpha", alphas, premultiplied), compute)
+    
+    # ------------------------------------------------------------------
+    # Export
+    # ------------------------------------------------------------------
+    
     def to_dict(self) -> Dict[str, Any]:
         """Export scheme as dictionary with all formats"""
         return {
             "name": self.name,
-            "hex": self._hex_colors,
-            "rgb": {k: list(v) for k, v in self._rgb_colors.items()},
-            "rgb255": {k: list(self.rgb255(k)) for k in self._hex_colors.keys()},
+            "hex": dict(zip(self._keys, self._hex)),
+            "rgb": {k: list(self.rgb(k)) for k in self._keys},
+            "rgb255": {k: list(self.rgb255(k)) for k in self._keys},
         }
     
     def to_css_variables(self, prefix: str = "") -> str:
         """Generate CSS custom properties (variables) for this scheme"""
         lines = [":root {"]
-        for key, hex_value in self._hex_colors.items():
+        for key, hex_value in zip(self._keys, self._hex):
             var_name = f"--{prefix}{key.replace('_', '-')}" if prefix else f"--{key.replace('_', '-')}"
             lines.append(f"  {var_name}: {hex_value};")
         lines.append("}")
@@ -101,7 +428,7 @@ class ColorScheme:
         """Generate JavaScript object definition"""
         lines = [f"const {var_name} = {{"]
         items = []
-        for key, hex_value in self._hex_colors.items():
+        for key, hex_value in zip(self._keys, self._hex):
             items.append(f"  {key}: '{hex_value}'")
         lines.append(",\n".join(items))
         lines.append("};")
@@ -113,9 +440,117 @@ class ColorScheme:
     
     def keys(self) -> List[str]:
         """Get all color keys"""
-        return list(self._hex_colors.keys())
+        return list(self._keys)
 
 
+class SchemeTable:
+    """
+    Columnar store for a set of color schemes sharing the same keys
+    
+    All colors live in one (S schemes x K keys x 4) RGBA array (float32 plus
+    a uint8 copy) with name -> index maps, so cross-scheme questions are array
+    slices instead of loops over scheme.hex(key):
+    
+        table.role("highlight")   # (S x 4) highlight color of every scheme
+        table.block("dark")       # (K x 4) all colors of one scheme
+        table.rgba[:, :, :3]      # everything, as one array
+    
+    scheme(name) returns a ColorScheme whose arrays are views into the table.
+    """
+    
+    __slots__ = ("names", "keys", "scheme_index", "key_index", "rgba", "rgba8", "_hex", "_scalars")
+    
+    def __init__(self, data: Dict[str, Dict[str, str]]):
+        """
+        Args:
+            data: Scheme name -> {color key -> hex string}; every scheme must
+                have the same keys (they are stored in the first scheme's order)
+        """
+        import numpy as np
+        self.names = tuple(data.keys())
+        self.keys = tuple(next(iter(data.values()), {}).keys())
+        self.scheme_index = {name: s for s, name in enumerate(self.names)}
+        self.key_index = {key: k for k, key in enumerate(self.keys)}
+        
+        hex_table = []
+        for name, colors in data.items():
+            if set(colors) != set(self.keys):
+                raise ValueError(f"Scheme {name!r} does not have the same keys as {self.names[0]!r}")
+            hex_table.append(tuple(colors[key] for key in self.keys))
+        hex_array = np.array(hex_table, dtype=str).reshape(len(self.names), len(self.keys))
+        rgba8, valid = hex_to_rgb_many(hex_array, np.uint8)
+        for name, scheme_valid in zip(self.names, valid):
+            _warn_invalid(name, self.keys, scheme_valid)
+        rgba = rgba8.astype(np.float32) / np.float32(255)
+        rgba8.flags.writeable = False
+        rgba.flags.writeable = False
+        self.rgba8 = rgba8
+        self.rgba = rgba
+        self._hex = tuple(hex_table)
+        self._scalars = None
+    
+    @classmethod
+    def from_packed(cls, names: Iterable[str], keys: Iterable[str], rgba8: "np.ndarray") -> "SchemeTable":
+        """
+        Create a table over an existing (S x K x 4) uint8 array
+        
+        Used for compiled scheme snapshots: rgba8 may be a read-only memory
+        map and is not copied. Hex strings are regenerated (uppercase) on
+        demand instead of being stored.
+        """
+        import numpy as np
+        table = cls.__new__(cls)
+        table.names = tuple(names)
+        table.keys = tuple(keys)
+        table.scheme_index = {name: s for s, name in enumerate(table.names)}
+        table.key_index = {key: k for k, key in enumerate(table.keys)}
+        table.rgba8 = rgba8
+        table.rgba = rgba8.astype(np.float32) / np.float32(255)
+        table.rgba.flags.writeable = False
+        table._hex = None
+        table._scalars = None
+        return table
+    
+    def _hex_row(self, s: int) -> Tuple[str, ...]:
+        if self._hex is not None:
+            return self._hex[s]
+        rgba8 = self.rgba8[s]
+        return tuple(rgb_to_hex_many(rgba8, include_alpha=bool((rgba8[:, 3] != 255).any())).tolist())
+    
+    def _scalar_rows(self) -> List[List[Tuple[Tuple[int, int, int], Tuple[float, float, float]]]]:
+        """Per scheme and key: (0-255 RGB ints, 0-1 RGB floats), built on first use"""
+        if self._scalars is None:
+            self._scalars = [[((r, g, b), (r / 255.0, g / 255.0, b / 255.0)) for r, g, b, _ in row]
+                             for row in self.rgba8.tolist()]
+        return self._scalars
+    
+    def _array(self, dtype) -> "np.ndarray":
+        import numpy as np
+        if np.dtype(dtype) == np.uint8:
+            return self.rgba8
+        if np.dtype(dtype) == np.float32:
+            return self.rgba
+        raise ValueError(f"Unsupported dtype {dtype!r}; use np.float32 or np.uint8")
+    
+    def role(self, key: str, dtype="float32") -> "np.ndarray":
+        """Get one color key across all schemes as an (S x 4) view"""
+        return self._array(dtype)[:, self.key_index[key]]
+    
+    def block(self, name: str, dtype="float32") -> "np.ndarray":
+        """Get all colors of one scheme as a (K x 4) view"""
+        return self._array(dtype)[self.scheme_index[name]]
+    
+    def hex(self, name: str, key: str) -> str:
+        """Get one color as its original hex string"""
+        return self._hex_row(self.scheme_index[name])[self.key_index[key]]
+    
+    def scheme(self, name: str) -> ColorScheme:
+        """Get a ColorScheme whose storage is a view into this table"""
+        return ColorScheme._view(name, self, self.scheme_index[name])
+    
+    def __len__(self) -> int:
+        return len(self.names)
+
 # ============================================================================
 # PREDEFINED COLOR SCHEMES
 # ============================================================================
@@ -264,11 +699,96 @@ COLOR_SCHEMES_DATA = {
 }
 
 
-# Create ColorScheme objects for each predefined scheme
-COLOR_SCHEMES = {
-    name: ColorScheme(name, colors)
-    for name, colors in COLOR_SCHEMES_DATA.items()
-}
+class SchemeRegistry(Mapping):
+    """
+    Read-only name -> ColorScheme mapping that parses schemes on first use
+    
+    Importing the module only stores the raw hex data, and listing names
+    does not parse anything. The first lookup of a predefined scheme builds
+    the columnar SchemeTable over all of them (one vectorized parse, about
+    as fast as parsing a single scheme) and every scheme is a view into it,
+    so each color is stored once. Scheme objects are created on first
+    lookup and then cached.
+    
+    Tables of external schemes (see unified_scheme_library.load_schemes)
+    can be attached with add_table(); every name must be unique across the
+    predefined schemes and all attached tables.
+    """
+    
+    def __init__(self, data: Dict[str, Dict[str, str]]):
+        self._data = data
+        self._schemes = {}
+        self._table = None
+        self._tables: Dict[str, SchemeTable] = {}    # Source -> table
+    
+    def __getitem__(self, name: str) -> ColorScheme:
+        scheme = self._schemes.get(name)
+        if scheme is None:
+            if name in self._data:
+                scheme = self.table.scheme(name)
+            else:
+                table = next((t for t in self._tables.values() if name in t.scheme_index), None)
+                if table is None:
+                    raise KeyError(name)
+                scheme = table.scheme(name)
+            self._schemes[name] = scheme
+        return scheme
+    
+    def __iter__(self):
+        yield from self._data
+        for table in self._tables.values():
+            yield from table.names
+    
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+    
+    def __contains__(self, name) -> bool:
+        return name in self._data or any(name in t.scheme_index for t in self._tables.values())
+    
+    def add_table(self, table: SchemeTable, source: str):
+        """
+        Make the schemes of a SchemeTable available through this registry
+        
+        Args:
+            table: Schemes to add
+            source: Where the table came from (e.g. its directory); adding a
+                table from the same source again replaces the earlier one
+        
+        Raises:
+            ValueError: If a name is predefined or belongs to another source
+        """
+        for name in table.names:
+            if name in self._data:
+                raise ValueError(f"Scheme {name!r} from {source} conflicts with a predefined scheme")
+            owner = next((s for s, t in self._tables.items() if s != source and name in t.scheme_index), None)
+            if owner is not None:
+                raise ValueError(f"Scheme {name!r} from {source} is already registered from {owner}")
+        previous = self._tables.pop(source, None)
+        for name in previous.names if previous is not None else ():
+            self._schemes.pop(name, None)
+        self._tables[source] = table
+    
+    def tables(self) -> List[SchemeTable]:
+        """Every table in the registry: the predefined schemes, then attached tables"""
+        return [self.table] + list(self._tables.values())
+    
+    @property
+    def table(self) -> SchemeTable:
+        """SchemeTable over the predefined schemes (built on first access or lookup)"""
+        if self._table is None:
+            self._table = SchemeTable(self._data)
+        return self._table
+
+
+COLOR_SCHEMES = SchemeRegistry(COLOR_SCHEMES_DATA)
+
+
+def __getattr__(name: str):
+    # COLOR_TABLE packs every scheme into one columnar table; it is only
+    # built when first imported or accessed, or on the first scheme lookup
+    if name == "COLOR_TABLE":
+        return COLOR_SCHEMES.table
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_scheme(name: str = "default") -> ColorScheme:
@@ -286,7 +806,7 @@ def get_scheme(name: str = "default") -> ColorScheme:
         >>> print(scheme.hex("highlight"))
         '#ABDADC'
     """
-    return COLOR_SCHEMES.get(name, COLOR_SCHEMES["default"])
+    return COLOR_SCHEMES[name] if name in COLOR_SCHEMES else COLOR_SCHEMES["default"]
 
 
 def list_schemes() -> List[str]:
@@ -294,51 +814,106 @@ def list_schemes() -> List[str]:
     return list(COLOR_SCHEMES.keys())
 
 
-def export_all_schemes_to_css(filename: str = "color_schemes.css", prefix: str = ""):
+def scheme_css_block(scheme_name: str, scheme: ColorScheme, prefix: str = "",
+                     tones: Iterable[int] = TONE_LEVELS) -> str:
+    """CSS rule block for one scheme, as written by export_all_schemes_to_css"""
+    lines = [f"/* {scheme_name} color scheme */", f"[data-color-scheme='{scheme_name}'] {{"]
+    for key in sorted(scheme.keys()):
+        var_name = f"--{prefix}{key.replace('_', '-')}"
+        lines.append(f"  {var_name}: {scheme.hex(key).upper()};")
+    for key in sorted(scheme.keys()) if tones else ():
+        var_name = f"--{prefix}{key.replace('_', '-')}"
+        lines.extend(f"  {var_name}-{level}: {scheme.tone(key, level).upper()};" for level in tones)
+    lines.append("}")
+    return "\n".join(lines) + "\n\n"
+
+
+def export_all_schemes_to_css(filename: str = "color_schemes.css", prefix: str = "",
+                              tones: Iterable[int] = TONE_LEVELS, cache: Dict[str, str] = None):
     """
     Export all color schemes to a CSS file
     
+    The output is canonical (schemes and keys sorted, upper-case hex, LF
+    line endings), so the same schemes give the same bytes on any machine.
+    Only the predefined schemes are written; schemes registered from
+    external libraries (load_schemes(..., register=True)) are left out, so
+    the file does not depend on what the process loaded.
+    
     Args:
         filename: Output CSS filename
         prefix: Optional prefix for CSS variable names (e.g., "scheme-name-")
+        tones: Tone levels written as --key-<level> properties (() for none)
+        cache: Optional scheme name -> rendered block dict; blocks found in it
+            are reused and new ones are stored (used by watch mode)
     """
-    with open(filename, 'w') as f:
+    tones = tuple(tones)
+    cache = {} if cache is None else cache
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("/* Auto-generated color schemes for web use */\n")
         f.write("/* Generated from unified_color_schemes.py */\n\n")
         
-        for scheme_name, scheme in COLOR_SCHEMES.items():
-            f.write(f"/* {scheme_name} color scheme */\n")
-            f.write(f"[data-color-scheme='{scheme_name}'] {{\n")
-            for key in scheme.keys():
-                var_name = f"--{prefix}{key.replace('_', '-')}"
-                f.write(f"  {var_name}: {scheme.hex(key)};\n")
-            f.write("}\n\n")
+        for scheme_name in sorted(COLOR_SCHEMES_DATA):
+            if scheme_name not in cache:
+                cache[scheme_name] = scheme_css_block(scheme_name, COLOR_SCHEMES[scheme_name], prefix, tones)
+            f.write(cache[scheme_name])
 
 
-def export_all_schemes_to_js(filename: str = "color_schemes.js"):
+def export_all_schemes_to_js(filename: str = "color_schemes.js", tones: Iterable[int] = TONE_LEVELS,
+                             cache: Dict[Tuple[str, str], str] = None):
     """
     Export all color schemes to a JavaScript file
     
+    Tone ramps are written as one Uint8ClampedArray per scheme (keys x levels
+    x RGBA), so applets can index colors without parsing hex strings. Like
+    the CSS export, the output is canonical and holds the predefined
+    schemes only.
+    
     Args:
         filename: Output JavaScript filename
+        tones: Tone levels to include in COLOR_TONES (() for none)
+        cache: Optional (scheme name, "colors"/"tones") -> rendered entry
+            dict; entries found in it are reused and new ones are stored
     """
-    with open(filename, 'w') as f:
+    import numpy as np
+    tones = tuple(tones)
+    cache = {} if cache is None else cache
+    names = sorted(COLOR_SCHEMES_DATA)
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("// Auto-generated color schemes for JavaScript use\n")
         f.write("// Generated from unified_color_schemes.py\n\n")
         
         f.write("const COLOR_SCHEMES = {\n")
         scheme_lines = []
-        for scheme_name, scheme in COLOR_SCHEMES.items():
-            colors_obj = "{\n"
-            color_lines = []
-            for key in scheme.keys():
-                color_lines.append(f"    {key}: '{scheme.hex(key)}'")
-            colors_obj += ",\n".join(color_lines)
-            colors_obj += "\n  }"
-            scheme_lines.append(f"  {scheme_name}: {colors_obj}")
+        for scheme_name in names:
+            if (scheme_name, "colors") not in cache:
+                scheme = COLOR_SCHEMES[scheme_name]
+                colors_obj = "{\n"
+                color_lines = []
+                for key in sorted(scheme.keys()):
+                    color_lines.append(f"    {key}: '{scheme.hex(key).upper()}'")
+                colors_obj += ",\n".join(color_lines)
+                colors_obj += "\n  }"
+                cache[scheme_name, "colors"] = f"  {scheme_name}: {colors_obj}"
+            scheme_lines.append(cache[scheme_name, "colors"])
         f.write(",\n\n".join(scheme_lines))
         f.write("\n};\n\n")
         
+        # Tints/shades: COLOR_TONES[scheme][(key * levels + level) * 4 + channel]
+        keys = sorted(COLOR_SCHEMES[names[0]].keys()) if tones else []
+        f.write(f"const COLOR_TONE_KEYS = [{', '.join(repr(k) for k in keys)}];\n")
+        f.write(f"const COLOR_TONE_LEVELS = [{', '.join(str(level) for level in tones)}];\n")
+        f.write("const COLOR_TONES = {\n")
+        tone_lines = []
+        for scheme_name in names if tones else ():
+            if (scheme_name, "tones") not in cache:
+                scheme = COLOR_SCHEMES[scheme_name]
+                ramp = np.rint(scheme.tone_ramp(tones)[scheme.indices(keys)] * 255).astype(np.uint8)
+                values = ", ".join(str(v) for v in ramp.reshape(-1).tolist())
+                cache[scheme_name, "tones"] = f"  {scheme_name}: new Uint8ClampedArray([{values}])"
+            tone_lines.append(cache[scheme_name, "tones"])
+        f.write(",\n".join(tone_lines))
+        f.write("\n};\n\n")
+        
         # Add helper functions
         f.write("""
 // Helper function to get a color from a scheme
@@ -346,6 +921,16 @@ function getColor(schemeName, colorKey) {
   return COLOR_SCHEMES[schemeName]?.[colorKey] || '#000000';
 }
 
+// Helper function to get a tint/shade (e.g. level 300) as a hex string
+function getTone(schemeName, colorKey, level) {
+  const tones = COLOR_TONES[schemeName];
+  const k = COLOR_TONE_KEYS.indexOf(colorKey);
+  const l = COLOR_TONE_LEVELS.indexOf(level);
+  if (!tones || k < 0 || l < 0) return '#000000';
+  const i = (k * COLOR_TONE_LEVELS.length + l) * 4;
+  return '#' + Array.from(tones.subarray(i, i + 3), v => v.toString(16).padStart(2, '0')).join('').toUpperCase();
+}
+
 // Helper function to convert hex to RGB
 function hexToRgb(hex) {
   const result = /^#?([a-f\\d]{2})([a-f\\d]{2})([a-f\\d]{2})$/i.exec(hex);
@@ -364,7 +949,7 @@ function hexToRgba(hex, alpha = 1.0) {
 
 // Export for use in modules
 if (typeof module !== 'undefined' && module.exports) {
-  module.exports = { COLOR_SCHEMES, getColor, hexToRgb, hexToRgba };
+  module.exports = { COLOR_SCHEMES, COLOR_TONES, COLOR_TONE_KEYS, COLOR_TONE_LEVELS, getColor, getTone, hexToRgb, hexToRgba };
 }
 """)
 
@@ -384,6 +969,13 @@ def get_manim_color_dict(scheme_name: str = "default") -> Dict[str, str]:
     return {key: scheme.hex(key) for key in scheme.keys()}
 
 
+# Opt-in call profiling (see unified_profiling.py); nothing is wrapped unless
+# the UNIFIED_STYLE_PROFILE environment variable is set
+if os.environ.get("UNIFIED_STYLE_PROFILE") and __name__ != "__main__":
+    import unified_profiling
+    unified_profiling.install_from_env()
+
+
 if __name__ == "__main__":
     # Example usage and testing
     print("Available Color Schemes:")
@@ -0,0 +1,265 @@
+"""
+Unified Color Space Conversions
+================================
+
+Vectorized conversions between the color spaces used for interpolation and
+color analysis:
+- sRGB (gamma encoded, 0-1), the format stored by ColorScheme
+- Linear sRGB (light intensity, 0-1)
+- OKLab / OKLCH (perceptually uniform, Bjorn Ottosson 2020)
+- CIE XYZ and CIELAB (D65), used by the CIEDE2000 color difference
+
+Every function takes and returns NumPy arrays whose last axis holds the three
+channels, so whole palettes, gradient tables or images convert in one call.
+An optional fourth (alpha) channel is passed through unchanged by
+convert_color().
+
+OKLCH hue is expressed in degrees, matching CSS oklch().
+
+Version: 1.0
+"""
+
+import numpy as np
+from typing import List
+
+
+COLOR_SPACES = ("srgb", "linear", "oklab", "oklch")
+
+
+# ============================================================================
+# sRGB <-> LINEAR sRGB
+# ============================================================================
+
+def srgb_to_linear(rgb: np.ndarray) -> np.ndarray:
+    """Remove the sRGB transfer curve (values 0-1)"""
+    rgb = np.asarray(rgb, dtype=np.float64)
+    return np.where(rgb <= 0.04045, rgb / 12.92, ((rgb + 0.055) / 1.055) ** 2.4)
+
+
+def linear_to_srgb(linear: np.ndarray) -> np.ndarray:
+    """Apply the sRGB transfer curve (values 0-1, negatives clipped to 0)"""
+    linear = np.maximum(np.asarray(linear, dtype=np.float64), 0.0)
+    return np.where(linear <= 0.0031308, linear * 12.92, 1.055 * linear ** (1 / 2.4) - 0.055)
+
+
+# ============================================================================
+# LINEAR sRGB <-> OKLAB <-> OKLCH
+# ============================================================================
+
+_LINEAR_TO_LMS = np.array([
+    [0.4122214708, 0.5363325363, 0.0514459929],
+    [0.2119034982, 0.6806995451, 0.1073969566],
+    [0.0883024619, 0.2817188376, 0.6299787005],
+])
+
+_LMS_TO_OKLAB = np.array([
+    [0.2104542553, 0.7936177850, -0.0040720468],
+    [1.9779984951, -2.4285922050, 0.4505937099],
+    [0.0259040371, 0.7827717662, -0.8086757660],
+])
+
+_OKLAB_TO_LMS = np.linalg.inv(_LMS_TO_OKLAB)
+_LMS_TO_LINEAR = np.linalg.inv(_LINEAR_TO_LMS)
+
+
+def linear_to_oklab(linear: np.ndarray) -> np.ndarray:
+    """Convert linear sRGB to OKLab (L in 0-1)"""
+    lms = np.asarray(linear, dtype=np.float64) @ _LINEAR_TO_LMS.T
+    return np.cbrt(lms) @ _LMS_TO_OKLAB.T
+
+
+def oklab_to_linear(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab to linear sRGB (may fall outside 0-1 for out-of-gamut colors)"""
+    lms = np.asarray(lab, dtype=np.float64) @ _OKLAB_TO_LMS.T
+    return (lms ** 3) @ _LMS_TO_LINEAR.T
+
+
+def oklab_to_oklch(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab to OKLCH (hue in degrees, 0-360)"""
+    lab = np.asarray(lab, dtype=np.float64)
+    lch = np.empty_like(lab)
+    lch[..., 0] = lab[..., 0]
+    lch[..., 1] = np.hypot(lab[..., 1], lab[..., 2])
+    lch[..., 2] = np.degrees(np.arctan2(lab[..., 2], lab[..., 1])) % 360
+    return lch
+
+
+def oklch_to_oklab(lch: np.ndarray) -> np.ndarray:
+    """Convert OKLCH (hue in degrees) to OKLab"""
+    lch = np.asarray(lch, dtype=np.float64)
+    hue = np.radians(lch[..., 2])
+    lab = np.empty_like(lch)
+    lab[..., 0] = lch[..., 0]
+    lab[..., 1] = lch[..., 1] * np.cos(hue)
+    lab[..., 2] = lch[..., 1] * np.sin(hue)
+    return lab
+
+
+def srgb_to_oklab(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB (0-1) to OKLab"""
+    return linear_to_oklab(srgb_to_linear(rgb))
+
+
+def oklab_to_srgb(lab: np.ndarray) -> np.ndarray:
+    """Convert OKLab to sRGB (0-1, clipped into gamut)"""
+    return np.clip(linear_to_srgb(oklab_to_linear(lab)), 0.0, 1.0)
+
+
+def gamut_map_oklch(lch: np.ndarray, iterations: int = 16) -> np.ndarray:
+    """
+    Bring OKLCH colors into the sRGB gamut by reducing chroma only
+
+    Unlike clipping the RGB channels, this keeps lightness and hue, which is
+    what tints and shades should preserve. Uses a vectorized bisection.
+
+    Args:
+        lch: Array of shape (..., 3), L clipped to 0-1
+        iterations: Bisection steps (16 gives chroma to ~1e-5)
+
+    Returns:
+        OKLCH colors inside the sRGB gamut, float64
+    """
+    lch = np.array(lch, dtype=np.float64)
+    lch[..., 0] = np.clip(lch[..., 0], 0.0, 1.0)
+
+    def in_gamut(chroma):
+        candidate = lch.copy()
+        candidate[..., 1] = chroma
+        linear = oklab_to_linear(oklch_to_oklab(candidate))
+        return np.all((linear >= -1e-6) & (linear <= 1 + 1e-6), axis=-1)
+
+    low = np.zeros(lch.shape[:-1])
+    high = lch[..., 1].copy()
+    fits = in_gamut(high)
+    for _ in range(iterations):
+        middle = (low + high) / 2
+        ok = in_gamut(middle)
+        low = np.where(ok, middle, low)
+        high = np.where(ok, high, middle)
+    lch[..., 1] = np.where(fits, lch[..., 1], low)
+    return lch
+
+
+# ============================================================================
+# LINEAR sRGB <-> CIE XYZ <-> CIELAB (D65)
+# ============================================================================
+
+_LINEAR_TO_XYZ = np.array([
+    [0.4124564, 0.3575761, 0.1804375],
+    [0.2126729, 0.7151522, 0.0721750],
+    [0.0193339, 0.1191920, 0.9503041],
+])
+
+_D65_WHITE = np.array([0.95047, 1.0, 1.08883])
+
+
+def linear_to_xyz(linear: np.ndarray) -> np.ndarray:
+    """Convert linear sRGB to CIE XYZ (D65, Y of white = 1)"""
+    return np.asarray(linear, dtype=np.float64) @ _LINEAR_TO_XYZ.T
+
+
+def xyz_to_lab(xyz: np.ndarray) -> np.ndarray:
+    """Convert CIE XYZ (D65) to CIELAB (L in 0-100)"""
+    ratio = np.asarray(xyz, dtype=np.float64) / _D65_WHITE
+    epsilon, kappa = 216 / 24389, 24389 / 27
+    f = np.where(ratio > epsilon, np.cbrt(ratio), (kappa * ratio + 16) / 116)
+    lab = np.empty_like(f)
+    lab[..., 0] = 116 * f[..., 1] - 16
+    lab[..., 1] = 500 * (f[..., 0] - f[..., 1])
+    lab[..., 2] = 200 * (f[..., 1] - f[..., 2])
+    return lab
+
+
+def srgb_to_lab(rgb: np.ndarray) -> np.ndarray:
+    """Convert sRGB (0-1) to CIELAB (D65)"""
+    return xyz_to_lab(linear_to_xyz(srgb_to_linear(rgb)))
+
+
+# ============================================================================
+# GENERIC CONVERSION AND INTERPOLATION
+# ============================================================================
+
+_FROM_SRGB = {
+    "srgb": lambda rgb: np.asarray(rgb, dtype=np.float64),
+    "linear": srgb_to_linear,
+    "oklab": srgb_to_oklab,
+    "oklch": lambda rgb: oklab_to_oklch(srgb_to_oklab(rgb)),
+}
+
+_TO_SRGB = {
+    "srgb": lambda rgb: np.clip(np.asarray(rgb, dtype=np.float64), 0.0, 1.0),
+    "linear": lambda linear: np.clip(linear_to_srgb(linear), 0.0, 1.0),
+    "oklab": oklab_to_srgb,
+    "oklch": lambda lch: oklab_to_srgb(oklch_to_oklab(lch)),
+}
+
+
+def list_color_spaces() -> List[str]:
+    """Get list of supported color space names"""
+    return list(COLOR_SPACES)
+
+
+def _check_space(space: str):
+    if space not in _FROM_SRGB:
+        raise ValueError(f"Unknown color space {space!r}; choose from {', '.join(COLOR_SPACES)}")
+
+
+def convert_color(colors: np.ndarray, space: str, inverse: bool = False) -> np.ndarray:
+    """
+    Convert sRGB(A) colors into a color space, or back with inverse=True
+
+    Args:
+        colors: Array of shape (..., 3) or (..., 4); alpha passes through
+        space: One of "srgb", "linear", "oklab", "oklch"
+        inverse: Convert from `space` back to sRGB instead
+
+    Returns:
+        Converted float64 array with the same shape
+    """
+    _check_space(space)
+    colors = np.asarray(colors, dtype=np.float64)
+    convert = _TO_SRGB[space] if inverse else _FROM_SRGB[space]
+    result = np.empty_like(colors)
+    result[..., :3] = convert(colors[..., :3])
+    if colors.shape[-1] > 3:
+        result[..., 3:] = colors[..., 3:]
+    return result
+
+
+def interpolate_colors(
+    start: np.ndarray,
+    end: np.ndarray,
+    t: np.ndarray,
+    space: str = "oklab"
+) -> np.ndarray:
+    """
+    Interpolate between sRGB(A) colors in a chosen color space
+
+    start, end and t broadcast against each other (t gets a trailing channel
+    axis added), so one call can produce a whole gradient or a whole frame
+    sequence. OKLCH interpolation takes the shorter way around the hue circle.
+
+    Args:
+        start: Start colors (..., 3 or 4), sRGB 0-1
+        end: End colors, same channel count as start
+        t: Interpolation parameters (0 to 1)
+        space: Interpolation space ("srgb", "linear", "oklab", "oklch")
+
+    Returns:
+        Interpolated sRGB(A) colors, float64, 0-1
+    """
+    a = convert_color(start, space)
+    b = convert_color(end, space)
+    t = np.asarray(t, dtype=np.float64)[..., None]
+    if space == "oklch":
+        # Shortest hue path; achromatic endpoints take the other end's hue
+        delta = (b[..., 2] - a[..., 2] + 180) % 360 - 180
+        gray_a = a[..., 1] < 1e-6
+        gray_b = b[..., 1] < 1e-6
+        a[..., 2] = np.where(gray_a, b[..., 2], a[..., 2])
+        delta = np.where(gray_a | gray_b, 0.0, delta)
+        b[..., 2] = a[..., 2] + delta
+    mixed = a + (b - a) * t
+    if space == "oklch":
+        mixed[..., 2] %= 360
+    return convert_color(mixed, space, inverse=True)
@@ -0,0 +1,311 @@
+"""
+Design Tokens for Every Platform
+================================
+
+The numbers of the style guide - durations, spacing buffers, stroke widths,
+font sizes, the easing for each use case and the scheme color for each role -
+as one typed registry (DESIGN_TOKENS), compiled into:
+- design_tokens.css: CSS custom properties on :root (s, px, cubic-bezier())
+- design_tokens.js: a DESIGN_TOKENS object in web units (ms, px)
+- design_tokens.py: plain Python constants (spacing also in pixels)
+- manim_design_tokens.py: Manim-ready constants (run_time, buff,
+  stroke_width, font_size values and the rate functions themselves)
+
+Unit conversions (1 Manim unit = PIXELS_PER_UNIT pixels, seconds to
+milliseconds, easing names to cubic-bezier()) happen here, once, instead of
+in every applet and scene. build_assets.py keeps the files up to date (in
+watch mode, re-rendering only the tokens that changed) and copies the CSS
+and JS to ../css/design-tokens.css and ../js/design-tokens.js.
+
+Usage:
+    from unified_design_tokens import DESIGN_TOKENS, token_value
+
+    token_value("spacing.med_large")           # 0.5 (Manim units)
+    token_value("spacing.med_large", "js")     # 50 (pixels)
+
+Version: 1.0
+"""
+
+import json
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from unified_animation_timing import CSS_TIMING_FUNCTIONS, EASING_FUNCTIONS
+from unified_color_schemes import get_scheme
+
+
+# 1 Manim unit ~= 100 pixels at 1080p (see the style guide)
+PIXELS_PER_UNIT = 100
+
+
+class Token(NamedTuple):
+    """One design decision; its group (the name before the dot) fixes the unit"""
+    value: Any
+    description: str = ""
+
+
+# ============================================================================
+# TOKEN REGISTRY
+# ============================================================================
+
+# "<group>.<name>" -> Token; see TOKEN_GROUPS for the unit of each group
+DESIGN_TOKENS: Dict[str, Token] = {
+    "duration.quick": Token(0.5, "Brief transitions"),
+    "duration.default": Token(1.0, "Most animations, fade in"),
+    "duration.slow": Token(2.0, "Detailed transformations"),
+    "duration.very_slow": Token(3.0, "Complex sequences"),
+    "duration.fade_out": Token(0.8, "Standard fade out"),
+    "duration.emphasis": Token(0.8, "Indicate, appear with bounce"),
+    "duration.transform": Token(1.5, "Transforming equations and shapes"),
+    "duration.pause": Token(0.5, "Pause to show a result"),
+    "duration.text_display": Token(2.0, "Minimum time text stays on screen"),
+
+    "spacing.small": Token(0.1, "SMALL_BUFF, tight spacing"),
+    "spacing.med_small": Token(0.25, "MED_SMALL_BUFF"),
+    "spacing.med_large": Token(0.5, "MED_LARGE_BUFF, comfortable spacing"),
+    "spacing.large": Token(1.0, "LARGE_BUFF, generous spacing"),
+
+    "stroke.fine": Token(2, "Fine detail"),
+    "stroke.standard": Token(4, "Default"),
+    "stroke.emphasis": Token(6, "Emphasis"),
+    "stroke.bold": Token(8, "Bold"),
+
+    "font.small": Token(24, "Annotations, labels"),
+    "font.body": Token(48, "Main content"),
+    "font.header": Token(72, "Titles"),
+    "font.display": Token(96, "Key equations"),
+
+    "easing.appear": Token("smooth", "Fade in, grow"),
+    "easing.disappear": Token("smooth", "Fade out, shrink"),
+    "easing.move": Token("smooth", "Moving and transforming"),
+    "easing.fast_appear": Token("rush_into", "Fast appearance"),
+    "easing.fast_disappear": Token("rush_from", "Fast disappearance"),
+    "easing.bounce": Token("ease_out_back", "Appear with overshoot"),
+    "easing.emphasis": Token("there_and_back", "Brief highlight"),
+    "easing.constant_rate": Token("linear", "Constant rates"),
+
+    "color.text": Token("text", "Text, labels"),
+    "color.background": Token("background", "Backgrounds, de-emphasis"),
+    "color.primary": Token("accent", "Functions, curves, primary objects"),
+    "color.secondary": Token("displacement", "Secondary objects, comparisons"),
+    "color.important": Token("dot", "Important points, answers"),
+    "color.emphasis": Token("highlight", "Temporary highlights"),
+    "color.time": Token("time", "Time, animation progress"),
+}
+
+
+# ============================================================================
+# UNITS AND CONVERSIONS
+# ============================================================================
+
+def _number(value: float):
+    """Round away float noise; whole numbers become ints (10.000000000000002 -> 10)"""
+    value = round(float(value), 6)
+    return int(value) if value.is_integer() else value
+
+
+def _is_length(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool) and value >= 0
+
+
+def _js_easing_name(name: str) -> str:
+    """ease_out_back -> easeOutBack (the naming of easing_functions.js)"""
+    head, *rest = name.split("_")
+    return head + "".join(part.capitalize() for part in rest)
+
+
+class TokenGroup(NamedTuple):
+    """How the tokens of one group are checked and written for each platform"""
+    unit: str                              # Unit of the registry values
+    is_valid: Callable[[Any], bool]
+    css: Callable[[Any], Optional[str]]    # CSS value (None: no CSS equivalent)
+    js: Callable[[Any], Any]               # JSON-compatible value in web units
+    manim_prefix: str                      # Manim constant names: <prefix>_<NAME>
+
+
+TOKEN_GROUPS: Dict[str, TokenGroup] = {
+    "duration": TokenGroup("s", _is_length, lambda v: f"{_number(v)}s",
+                           lambda v: _number(v * 1000), "RUN_TIME"),
+    "spacing": TokenGroup("Manim units", _is_length, lambda v: f"{_number(v * PIXELS_PER_UNIT)}px",
+                          lambda v: _number(v * PIXELS_PER_UNIT), "BUFF"),
+    "stroke": TokenGroup("px", _is_length, lambda v: f"{_number(v)}px", _number, "STROKE_WIDTH"),
+    "font": TokenGroup("pt", _is_length, lambda v: f"{_number(v)}px", _number, "FONT_SIZE"),
+    "easing": TokenGroup("easing name", lambda v: v in EASING_FUNCTIONS,
+                         lambda v: CSS_TIMING_FUNCTIONS.get(v.replace("_", "-")), _js_easing_name, "RATE_FUNC"),
+    "color": TokenGroup("color scheme key", lambda v: v in get_scheme("default").keys(),
+                        lambda v: f"var(--{v.replace('_', '-')})", str, "COLOR"),
+}
+
+
+def validate_tokens(tokens: Dict[str, Token] = DESIGN_TOKENS):
+    """
+    Check every token's group and value type
+
+    Raises:
+        ValueError: For a name that is not "<group>.<name>" with a known
+            group, or a value that is not valid for its group (a negative
+            length, an unknown easing or scheme key)
+    """
+    for name, token in tokens.items():
+        group, _, short = name.partition(".")
+        if group not in TOKEN_GROUPS or not short.isidentifier():
+            raise ValueError(f"Token {name!r} is not '<group>.<name>' with a group of {list(TOKEN_GROUPS)}")
+        if not TOKEN_GROUPS[group].is_valid(token.value):
+            raise ValueError(f"Token {name!r} has an invalid {TOKEN_GROUPS[group].unit} value {token.value!r}")
+
+
+def token_value(name: str, platform: str = "python"):
+    """
+    A token's value for one platform
+
+    Args:
+        name: Token name, e.g. "duration.quick"
+        platform: "python" (registry units), "css" or "js"
+    """
+    value = DESIGN_TOKENS[name].value
+    if platform == "python":
+        return value
+    group = TOKEN_GROUPS[name.partition(".")[0]]
+    return group.css(value) if platform == "css" else group.js(value)
+
+
+def _grouped(tokens: Dict[str, Token]) -> Dict[str, List[str]]:
+    """Group -> sorted token names, groups in TOKEN_GROUPS order"""
+    validate_tokens(tokens)
+    return {group: sorted(n for n in tokens if n.partition(".")[0] == group) for group in TOKEN_GROUPS}
+
+
+# ============================================================================
+# EXPORT FUNCTIONS
+# ============================================================================
+#
+# Every exporter takes an optional `cache` of token name -> rendered text;
+# tokens found in it are reused and new ones are stored (used by watch
+# mode). Output is canonical: groups in TOKEN_GROUPS order, names sorted.
+
+def _rendered(name: str, cache: Dict[str, str], render: Callable[[str, Token], str]) -> str:
+    if name not in cache:
+        cache[name] = render(name, DESIGN_TOKENS[name])
+    return cache[name]
+
+
+def export_tokens_to_css(filename: str = "design_tokens.css", cache: Dict[str, str] = None):
+    """
+    Export the tokens as CSS custom properties (--<group>-<name>) on :root
+
+    Color roles refer to the scheme variables of color_schemes.css, so they
+    follow the active data-color-scheme. Easings without a CSS timing
+    function (e.g. there_and_back) are listed as comments.
+    """
+    cache = {} if cache is None else cache
+
+    def render(name: str, token: Token) -> str:
+        group, _, short = name.partition(".")
+        value = TOKEN_GROUPS[group].css(token.value)
+        if value is None:
+            return f"  /* --{group}-{short.replace('_', '-')}: {token.value} has no CSS equivalent */"
+        return f"  --{group}-{short.replace('_', '-')}: {value}; /* {token.description} */"
+
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("/* Auto-generated design tokens for web use */\n")
+        f.write("/* Generated from unified_design_tokens.py */\n\n")
+        f.write(":root {\n")
+        blocks = []
+        for group, names in _grouped(DESIGN_TOKENS).items():
+            lines = [f"  /* {group} */"] + [_rendered(n, cache, render) for n in names]
+            blocks.append("\n".join(lines))
+        f.write("\n\n".join(blocks))
+        f.write("\n}\n")
+
+
+def export_tokens_to_js(filename: str = "design_tokens.js", cache: Dict[str, str] = None):
+    """Export the tokens as a DESIGN_TOKENS object (durations in ms, lengths in px)"""
+    cache = {} if cache is None else cache
+
+    def render(name: str, token: Token) -> str:
+        group, _, short = name.partition(".")
+        value = json.dumps(TOKEN_GROUPS[group].js(token.value))
+        return f"    {short}: {value}"
+
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        f.write("// Auto-generated design tokens for JavaScript use\n")
+        f.write("// Generated from unified_design_tokens.py (durations in ms, lengths in px,\n")
+        f.write("// easings as EASING_FUNCTIONS names, colors as color scheme keys)\n\n")
+        f.write("const DESIGN_TOKENS = {\n")
+        groups = []
+        for group, names in _grouped(DESIGN_TOKENS).items():
+            entries = ",\n".join(_rendered(n, cache, render) for n in names)
+            groups.append(f"  {group}: {{\n{entries}\n  }}")
+        f.write(",\n\n".join(groups))
+        f.write("\n};\n\n")
+        f.write("// Export for use in modules\n")
+        f.write("if (typeof module !== 'undefined' && module.exports) {\n")
+        f.write("  module.exports = { DESIGN_TOKENS };\n")
+        f.write("}\n")
+
+
+def export_tokens_to_python(filename: str = "design_tokens.py", cache: Dict[str, str] = None):
+    """Export the tokens as Python constants (<GROUP>_<NAME>; spacing also as <...>_PX)"""
+    cache = {} if cache is None else cache
+
+    def render(name: str, token: Token) -> str:
+        group, _, short = name.partition(".")
+        constant = f"{group}_{short}".upper()
+        lines = [f"{constant} = {token.value!r}  # {token.description}"]
+        if group == "spacing":
+            lines.append(f"{constant}_PX = {TOKEN_GROUPS[group].js(token.value)!r}")
+        return "\n".join(lines)
+
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('"""Design tokens (auto-generated from unified_design_tokens.py; do not edit)"""\n\n')
+        f.write(f"PIXELS_PER_UNIT = {PIXELS_PER_UNIT}\n")
+        for group, names in _grouped(DESIGN_TOKENS).items():
+            f.write(f"\n# {group} ({TOKEN_GROUPS[group].unit})\n")
+            f.write("".join(_rendered(n, cache, render) + "\n" for n in names))
+
+
+def export_tokens_to_manim(filename: str = "manim_design_tokens.py", cache: Dict[str, str] = None):
+    """
+    Export the tokens as Manim constants
+
+    RUN_TIME_*, BUFF_*, STROKE_WIDTH_* and FONT_SIZE_* are numbers for the
+    matching keyword arguments, RATE_FUNC_* are the rate functions of
+    unified_animation_timing and COLOR_* are color scheme keys.
+    """
+    cache = {} if cache is None else cache
+
+    def render(name: str, token: Token) -> str:
+        group, _, short = name.partition(".")
+        constant = f"{TOKEN_GROUPS[group].manim_prefix}_{short.upper()}"
+        value = token.value if group == "easing" else repr(token.value)
+        return f"{constant} = {value}  # {token.description}"
+
+    grouped = _grouped(DESIGN_TOKENS)
+    easings = sorted({DESIGN_TOKENS[n].value for n in grouped["easing"]})
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        f.write('"""\n')
+        f.write("Manim constants from the design tokens (auto-generated from\n")
+        f.write("unified_design_tokens.py; do not edit)\n\n")
+        f.write("    self.play(FadeIn(obj), run_time=RUN_TIME_QUICK, rate_func=RATE_FUNC_APPEAR)\n")
+        f.write('"""\n\n')
+        f.write(f"from unified_animation_timing import {', '.join(easings)}\n")
+        for group, names in grouped.items():
+            f.write(f"\n# {group} ({TOKEN_GROUPS[group].unit})\n")
+            f.write("".join(_rendered(n, cache, render) + "\n" for n in names))
+
+
+def export_all_tokens():
+    """Write all four token files to the current directory"""
+    export_tokens_to_css()
+    export_tokens_to_js()
+    export_tokens_to_python()
+    export_tokens_to_manim()
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    validate_tokens()
+    for name in sorted(DESIGN_TOKENS, key=lambda n: (list(TOKEN_GROUPS).index(n.partition(".")[0]), n)):
+        print(f"  {name:24} {token_value(name)!r:18} css {token_value(name, 'css') or '-':34} "
+              f"js {json.dumps(token_value(name, 'js'))}")
+    export_all_tokens()
+    print("Exported design_tokens.css, design_tokens.js, design_tokens.py, manim_design_tokens.py")
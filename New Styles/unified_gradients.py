@@ -0,0 +1,233 @@
+"""
+Gradient Lookup Tables from Color Schemes
+==========================================
+
+Builds gradients between scheme colors (two keys or a multi-stop list of
+keys and/or hex strings), interpolated in linear sRGB, OKLab or OKLCH, and
+bakes them into 256- or 1024-entry RGBA lookup tables (LUTs).
+
+A LUT turns per-pixel or per-object color math (e.g. a density heatmap
+computing an hsl() string for every ring on every frame) into one index
+operation. LUTs can be exported as:
+- A CSS linear-gradient() string
+- A JavaScript Uint8ClampedArray with a lookup helper
+
+Usage:
+    from unified_gradients import gradient_lut, apply_lut
+
+    lut = gradient_lut(["background", "accent", "highlight"], scheme="dark")
+    colors = apply_lut(lut, densities, vmin=0, vmax=densities.max())
+
+Version: 1.0
+"""
+
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from unified_color_schemes import ColorScheme, get_scheme, hex_to_rgb_many, rgb_to_hex_many
+from unified_color_spaces import interpolate_colors
+
+
+def resolve_stops(
+    stops: Sequence[str],
+    scheme: Union[str, ColorScheme] = "default"
+) -> np.ndarray:
+    """
+    Turn a list of scheme keys and/or hex strings into sRGBA colors
+
+    Args:
+        stops: Color keys of the scheme (e.g. "highlight") or hex strings
+        scheme: Scheme name or ColorScheme used to resolve keys
+
+    Returns:
+        (M x 4) float64 array of sRGBA colors (0-1)
+
+    Raises:
+        ValueError: If a stop is neither a scheme key nor a valid hex color
+    """
+    if isinstance(scheme, str):
+        scheme = get_scheme(scheme)
+    keys = set(scheme.keys())
+    colors = np.empty((len(stops), 4))
+    for i, stop in enumerate(stops):
+        if stop in keys:
+            colors[i] = scheme.as_array()[scheme.indices([stop])[0]]
+        else:
+            rgba, valid = hex_to_rgb_many([stop])
+            if not valid[0]:
+                raise ValueError(f"Gradient stop {stop!r} is not a key of {scheme.name!r} or a hex color")
+            colors[i] = rgba[0]
+    return colors
+
+
+def gradient(
+    stops: Sequence[str],
+    t: np.ndarray,
+    scheme: Union[str, ColorScheme] = "default",
+    positions: Optional[Sequence[float]] = None,
+    space: str = "oklab"
+) -> np.ndarray:
+    """
+    Evaluate a multi-stop gradient at arbitrary positions
+
+    Args:
+        stops: Two or more scheme keys or hex strings
+        t: Positions along the gradient (0 to 1), any shape
+        scheme: Scheme name or ColorScheme used to resolve keys
+        positions: Optional increasing stop positions (default: evenly spaced)
+        space: Interpolation space ("srgb", "linear", "oklab", "oklch")
+
+    Returns:
+        sRGBA colors (0-1) with shape t.shape + (4,)
+    """
+    colors = resolve_stops(stops, scheme)
+    if len(colors) < 2:
+        raise ValueError("A gradient needs at least two stops")
+    if positions is None:
+        positions = np.linspace(0, 1, len(colors))
+    positions = np.asarray(positions, dtype=np.float64)
+    if positions.shape != (len(colors),) or np.any(np.diff(positions) < 0):
+        raise ValueError("positions must be increasing and match the number of stops")
+
+    t = np.clip(np.asarray(t, dtype=np.float64), positions[0], positions[-1])
+    segment = np.clip(np.searchsorted(positions, t, side="right") - 1, 0, len(colors) - 2)
+    span = positions[segment + 1] - positions[segment]
+    local = np.divide(t - positions[segment], span, out=np.zeros_like(t), where=span > 0)
+    return interpolate_colors(colors[segment], colors[segment + 1], local, space)
+
+
+def gradient_lut(
+    stops: Sequence[str],
+    scheme: Union[str, ColorScheme] = "default",
+    size: int = 256,
+    positions: Optional[Sequence[float]] = None,
+    space: str = "oklab"
+) -> np.ndarray:
+    """
+    Bake a gradient into an RGBA lookup table
+
+    Args:
+        stops: Two or more scheme keys or hex strings
+        scheme: Scheme name or ColorScheme used to resolve keys
+        size: Number of entries (256 or 1024 are typical)
+        positions: Optional increasing stop positions (default: evenly spaced)
+        space: Interpolation space ("srgb", "linear", "oklab", "oklch")
+
+    Returns:
+        (size x 4) uint8 RGBA array
+    """
+    colors = gradient(stops, np.linspace(0, 1, size), scheme, positions, space)
+    return np.rint(colors * 255).astype(np.uint8)
+
+
+def apply_lut(lut: np.ndarray, values: np.ndarray, vmin: float = 0.0, vmax: float = 1.0) -> np.ndarray:
+    """
+    Map values to colors through a LUT
+
+    Args:
+        lut: (N x 4) lookup table from gradient_lut()
+        values: Array of values, any shape
+        vmin: Value mapped to the first entry
+        vmax: Value mapped to the last entry
+
+    Returns:
+        Colors with shape values.shape + (4,), same dtype as the LUT
+    """
+    values = np.asarray(values, dtype=np.float64)
+    scale = (len(lut) - 1) / (vmax - vmin) if vmax != vmin else 0.0
+    index = np.clip(np.rint((values - vmin) * scale), 0, len(lut) - 1).astype(np.intp)
+    return lut[index]
+
+
+# ============================================================================
+# EXPORT FUNCTIONS
+# ============================================================================
+
+def lut_to_css_gradient(lut: np.ndarray, num_stops: int = 16, direction: str = "to right") -> str:
+    """
+    Export a LUT as a CSS linear-gradient() with evenly sampled stops
+
+    Args:
+        lut: (N x 4) uint8 lookup table
+        num_stops: Number of color stops to emit (2 or more)
+        direction: CSS gradient direction
+
+    Returns:
+        CSS linear-gradient() value
+    """
+    index = np.rint(np.linspace(0, len(lut) - 1, num_stops)).astype(np.intp)
+    opaque = bool(np.all(lut[index, 3] == 255))
+    hex_values = rgb_to_hex_many(lut[index, :3] if opaque else lut[index], include_alpha=not opaque)
+    stops = [f"{color} {100 * i / (num_stops - 1):.4g}%" for i, color in enumerate(hex_values)]
+    return f"linear-gradient({direction}, {', '.join(stops)})"
+
+
+def lut_to_javascript(lut: np.ndarray, var_name: str = "GRADIENT_LUT") -> str:
+    """
+    Export a LUT as a JavaScript typed array plus a lookup function
+
+    The generated function `<var_name>_rgba(value, vmin, vmax)` returns a
+    CSS rgba() string, and the raw Uint8ClampedArray can be copied straight
+    into ImageData for per-pixel work.
+
+    Args:
+        lut: (N x 4) uint8 lookup table
+        var_name: Name of the JavaScript constant
+
+    Returns:
+        JavaScript source
+    """
+    values = ",".join(str(v) for v in np.asarray(lut, dtype=np.uint8).ravel().tolist())
+    size = len(lut)
+    return (
+        f"const {var_name} = new Uint8ClampedArray([{values}]);\n"
+        f"\n"
+        f"function {var_name}_rgba(value, vmin = 0, vmax = 1) {{\n"
+        f"  const t = vmax === vmin ? 0 : (value - vmin) / (vmax - vmin);\n"
+        f"  const i = 4 * Math.min({size - 1}, Math.max(0, Math.round(t * {size - 1})));\n"
+        f"  return `rgba(${{{var_name}[i]}}, ${{{var_name}[i + 1]}}, ${{{var_name}[i + 2]}}, "
+        f"${{{var_name}[i + 3] / 255}})`;\n"
+        f"}}\n"
+    )
+
+
+def export_lut(
+    stops: Sequence[str],
+    filename: str,
+    scheme: Union[str, ColorScheme] = "default",
+    size: int = 256,
+    space: str = "oklab",
+    var_name: str = "GRADIENT_LUT"
+):
+    """
+    Build a gradient LUT and write it as JavaScript (.js) or CSS (.css)
+
+    Args:
+        stops: Two or more scheme keys or hex strings
+        filename: Output file; the extension selects the format
+        scheme: Scheme name or ColorScheme used to resolve keys
+        size: Number of LUT entries
+        space: Interpolation space
+        var_name: JavaScript constant / CSS custom property name
+    """
+    lut = gradient_lut(stops, scheme, size=size, space=space)
+    scheme_name = scheme if isinstance(scheme, str) else scheme.name
+    label = f"Stops: {', '.join(stops)} ({scheme_name}, {space})"
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
+        if filename.endswith(".js"):
+            f.write("// Auto-generated gradient lookup table\n")
+            f.write(f"// {label}\n\n")
+            f.write(lut_to_javascript(lut, var_name))
+        else:
+            f.write("/* Auto-generated gradient lookup table */\n")
+            f.write(f"/* {label} */\n\n")
+            css_name = var_name.lower().replace('_', '-')
+            f.write(f":root {{\n  --{css_name}: {lut_to_css_gradient(lut)};\n}}\n")
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    for space in ("srgb", "linear", "oklab", "oklch"):
+        lut = gradient_lut(["background", "accent", "highlight"], scheme="dark", size=256, space=space)
+        print(f"{space:7} {lut_to_css_gradient(lut, num_stops=5)}")
@@ -0,0 +1,122 @@
+"""
+Manim Adapter for the Unified Color Schemes
+============================================
+
+Passing hex strings to Manim (`Circle(color=scheme.hex("dot"))`) makes it
+re-parse the same hex for every mobject. This adapter keeps, per scheme, one
+cached and immutable mapping of pre-parsed float32 RGBA arrays - the format
+manimlib stores in its `fill_rgba` / `stroke_rgba` data and hands to its
+shaders - and writes them onto whole groups of mobjects by array assignment.
+
+Usage:
+    from unified_manim_adapter import apply_scheme, scheme_rgba
+
+    dots = VGroup(*[Dot() for _ in range(1000)])
+    apply_scheme(dots, "dot", "deep_jewel_tones")          # fill + stroke
+    apply_scheme(labels, "text", scheme, fill_opacity=1)
+
+    scheme_rgba("erau")["highlight"]   # read-only float32 [r, g, b, a]
+
+Version: 1.0
+"""
+
+from types import MappingProxyType
+from typing import Iterable, Mapping, Optional, Union
+
+import numpy as np
+
+from unified_color_schemes import COLOR_SCHEMES, ColorScheme
+
+
+def _resolve_scheme(scheme: Union[str, ColorScheme]) -> ColorScheme:
+    """The scheme itself, or the registered scheme of that name (no fallback to "default")"""
+    if not isinstance(scheme, str):
+        return scheme
+    if scheme not in COLOR_SCHEMES:
+        raise ValueError(f"Unknown color scheme {scheme!r}; choose from {', '.join(COLOR_SCHEMES)}")
+    return COLOR_SCHEMES[scheme]
+
+
+def scheme_rgba(scheme: Union[str, ColorScheme] = "default") -> Mapping[str, np.ndarray]:
+    """
+    Get a scheme's colors as pre-parsed RGBA arrays
+
+    Args:
+        scheme: Scheme name or ColorScheme (custom schemes work too)
+
+    Returns:
+        Read-only mapping of color key -> float32 array [r, g, b, a], cached
+        on the scheme object; the arrays are rows of its own packed storage
+
+    Raises:
+        ValueError: If no scheme has that name
+    """
+    scheme = _resolve_scheme(scheme)
+    return scheme.derived(("manim", "rgba"), lambda: MappingProxyType(
+        dict(zip(scheme.keys(), scheme.as_array()))))
+
+
+def scheme_hex(scheme: Union[str, ColorScheme] = "default") -> Mapping[str, str]:
+    """Cached read-only version of get_manim_color_dict()"""
+    scheme = _resolve_scheme(scheme)
+    return scheme.derived(("manim", "hex"), lambda: MappingProxyType({key: scheme.hex(key) for key in scheme.keys()}))
+
+
+def _with_opacity(rgb: np.ndarray, opacities: np.ndarray) -> np.ndarray:
+    """One RGBA row per existing opacity value, keeping the mobject's alpha"""
+    opacities = np.atleast_1d(np.asarray(opacities, dtype=np.float32))
+    rgba = np.empty((len(opacities), 4), dtype=np.float32)
+    rgba[:, :3] = rgb
+    rgba[:, 3] = opacities
+    return rgba
+
+
+def apply_scheme(
+    mobjects: Union[Iterable, "Mobject"],
+    role: str,
+    scheme: Union[str, ColorScheme] = "default",
+    fill: bool = True,
+    stroke: bool = True,
+    fill_opacity: Optional[float] = None,
+    stroke_opacity: Optional[float] = None
+):
+    """
+    Color many mobjects with one scheme role by writing their RGBA data
+
+    Works on every member of each mobject's family (so a VGroup colors all
+    its submobjects) and bypasses hex parsing entirely.
+
+    Args:
+        mobjects: A mobject (e.g. a VGroup) or an iterable of mobjects
+        role: Color key, e.g. "highlight"
+        scheme: Scheme name or ColorScheme (used as is, even if unregistered)
+        fill: Set the fill color
+        stroke: Set the stroke color
+        fill_opacity: New fill opacity (None keeps each mobject's own)
+        stroke_opacity: New stroke opacity (None keeps each mobject's own)
+
+    Returns:
+        The mobjects argument, for chaining
+    """
+    rgb = scheme_rgba(scheme)[role][:3]
+    targets = [mobjects] if hasattr(mobjects, "get_family") else mobjects
+    for mobject in targets:
+        for member in mobject.get_family():
+            if fill:
+                opacity = member.get_fill_opacities() if fill_opacity is None else fill_opacity
+                member.set_rgba_array(_with_opacity(rgb, opacity), name="fill_rgba")
+            if stroke:
+                opacity = member.get_stroke_opacities() if stroke_opacity is None else stroke_opacity
+                member.set_rgba_array(_with_opacity(rgb, opacity), name="stroke_rgba")
+    return mobjects
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    colors = scheme_rgba("deep_jewel_tones")
+    print(f"deep_jewel_tones: {len(colors)} cached RGBA arrays")
+    for key, rgba in colors.items():
+        print(f"  {key:20} {np.array2string(rgba, precision=3)}")
+    print(f"Cached: {scheme_rgba('deep_jewel_tones') is colors}, read-only: {not colors['dot'].flags.writeable}")
+    custom = ColorScheme("custom", {"dot": "#123456"})
+    print(f"Custom scheme keeps its colors: {np.allclose(scheme_rgba(custom)['dot'], custom.rgba('dot'))}")
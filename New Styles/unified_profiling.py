@@ -0,0 +1,310 @@
+"""
+Opt-in Call Profiling for Rate Functions and Color Lookups
+===========================================================
+
+Counts calls and accumulates wall time for:
+- Every callable in EASING_FUNCTIONS (unified_animation_timing.py)
+- The ColorScheme accessors hex, rgb, rgba, rgb255 and css_rgba
+
+Statistics are kept per name and per call site (file, line, function of the
+caller), and can be printed as a sorted report or dumped as a file readable
+by the standard pstats module (and tools such as snakeviz). Like cProfile,
+each name gets a self time (excluding profiled calls it makes, e.g. an
+accessor calling another accessor) and a cumulative time; a nested call's
+call site is the profiled function that made it.
+
+Nothing is wrapped unless profiling is switched on, so the disabled cost is
+zero. Two switches are available:
+
+Environment variable (whole process, report at exit):
+    UNIFIED_STYLE_PROFILE=1 manimgl scene.py MyScene          # print report
+    UNIFIED_STYLE_PROFILE=calls.prof manimgl scene.py MyScene # pstats file
+
+Context manager (a block of code):
+    from unified_profiling import profile_calls
+
+    with profile_calls() as profiler:
+        render_frames()
+    profiler.print_report()
+
+Note that rate functions imported directly by name
+(``from unified_animation_timing import smooth``) bypass the registry and
+are not counted; look them up with get_easing_function() to profile them.
+
+Version: 1.0
+"""
+
+import atexit
+import functools
+import marshal
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple, Optional
+
+
+PROFILE_ENV_VAR = "UNIFIED_STYLE_PROFILE"
+
+COLOR_ACCESSORS = ("hex", "rgb", "rgba", "rgb255", "css_rgba")
+
+# (filename, line number, function name), the key format used by pstats
+CallSite = Tuple[str, int, str]
+
+# File name of the pseudo-functions standing for profiled names in pstats
+PSEUDO_FILE = "<unified_style>"
+
+
+class CallProfiler:
+    """Accumulates call counts and times per name and per call site"""
+
+    def __init__(self):
+        # name -> [calls, self seconds, cumulative seconds]
+        self.totals: Dict[str, List[float]] = {}
+        # name -> {call site -> [calls, self seconds, cumulative seconds]}
+        self.sites: Dict[str, Dict[CallSite, List[float]]] = {}
+        self._originals: Dict[Tuple[str, str], Callable] = {}
+        # Per thread: [seconds spent in profiled callees, pseudo call site]
+        # of every profiled call in progress, innermost last
+        self._local = threading.local()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def wrap(self, name: str, func: Callable) -> Callable:
+        """Return a wrapper around func that records calls under name"""
+        totals = self.totals.setdefault(name, [0, 0.0, 0.0])
+        sites = self.sites.setdefault(name, {})
+        clock = time.perf_counter
+        getframe = sys._getframe
+        local = self._local
+        pseudo_site = (PSEUDO_FILE, 0, name)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            stack = getattr(local, "stack", None)
+            if stack is None:
+                stack = local.stack = []
+            current = [0.0, pseudo_site]
+            stack.append(current)
+            start = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                stack.pop()
+                if stack:
+                    # Called from another profiled function: charge it to
+                    # that function's cumulative time, not its self time
+                    parent = stack[-1]
+                    parent[0] += elapsed
+                    site = parent[1]
+                else:
+                    caller = getframe(1)
+                    code = caller.f_code
+                    site = (code.co_filename, caller.f_lineno, code.co_name)
+                own = elapsed - current[0]
+                totals[0] += 1
+                totals[1] += own
+                totals[2] += elapsed
+                entry = sites.get(site)
+                if entry is None:
+                    sites[site] = [1, own, elapsed]
+                else:
+                    entry[0] += 1
+                    entry[1] += own
+                    entry[2] += elapsed
+
+        wrapper.__profiled__ = True
+        return wrapper
+
+    def install(self):
+        """Wrap the easing registry and ColorScheme accessors in place"""
+        if self._originals:
+            return
+        # Imported here so the library modules can enable profiling from
+        # their own import without a circular import
+        import unified_animation_timing
+        import unified_color_schemes
+
+        registry = unified_animation_timing.EASING_FUNCTIONS
+        for name, func in list(registry.items()):
+            self._originals[("easing", name)] = func
+            registry[name] = self.wrap(f"easing.{name}", func)
+
+        cls = unified_color_schemes.ColorScheme
+        for name in COLOR_ACCESSORS:
+            func = cls.__dict__[name]
+            self._originals[("scheme", name)] = func
+            setattr(cls, name, self.wrap(f"ColorScheme.{name}", func))
+
+    def uninstall(self):
+        """Restore the original, unwrapped callables"""
+        import unified_animation_timing
+        import unified_color_schemes
+
+        registry = unified_animation_timing.EASING_FUNCTIONS
+        cls = unified_color_schemes.ColorScheme
+        for (kind, name), func in self._originals.items():
+            if kind == "easing":
+                registry[name] = func
+            else:
+                setattr(cls, name, func)
+        self._originals.clear()
+
+    def reset(self):
+        """Zero all counters while keeping wrappers installed"""
+        for totals in self.totals.values():
+            totals[0], totals[1], totals[2] = 0, 0.0, 0.0
+        for sites in self.sites.values():
+            sites.clear()
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def rows(self) -> List[Tuple[str, int, float, float]]:
+        """(name, calls, self seconds, cumulative seconds) for every called name, most self time first"""
+        rows = [(name, int(calls), own, total) for name, (calls, own, total) in self.totals.items() if calls]
+        return sorted(rows, key=lambda r: r[2], reverse=True)
+
+    def format_report(self, top_sites: int = 5) -> str:
+        """
+        Format a sorted text report
+
+        Args:
+            top_sites: Number of call sites to list under each name
+
+        Returns:
+            Report text
+        """
+        lines = [
+            "Unified Style Call Profile",
+            "==========================",
+            f"{'name':34} {'calls':>12} {'self (s)':>12} {'total (s)':>12} {'self/call (us)':>15}",
+        ]
+        for name, calls, own, total in self.rows():
+            lines.append(f"{name:34} {calls:>12} {own:>12.4f} {total:>12.4f} {own / calls * 1e6:>15.3f}")
+            sites = sorted(self.sites[name].items(), key=lambda item: item[1][2], reverse=True)
+            for (filename, lineno, func_name), (site_calls, site_own, site_total) in sites[:top_sites]:
+                if filename == PSEUDO_FILE:
+                    where = f"via {func_name}"
+                else:
+                    where = f"{os.path.basename(filename)}:{lineno} ({func_name})"
+                lines.append(f"    {where:30} {int(site_calls):>12} {site_own:>12.4f} {site_total:>12.4f}")
+        return "\n".join(lines)
+
+    def print_report(self, top_sites: int = 5, file=None):
+        """Print the sorted report (to stderr by default)"""
+        print(self.format_report(top_sites), file=file or sys.stderr)
+
+    def dump_stats(self, filename: str):
+        """
+        Write statistics in the marshal format read by pstats.Stats
+
+        Each profiled name becomes a pseudo-function whose callers are the
+        recorded call sites (or the pseudo-functions of the profiled
+        functions that called it), with separate self and cumulative times.
+
+        Args:
+            filename: Output file (conventionally *.prof)
+        """
+        stats = {}
+        for name, (calls, own, total) in self.totals.items():
+            if not calls:
+                continue
+            callers = {
+                site: (int(site_calls), int(site_calls), site_own, site_total)
+                for site, (site_calls, site_own, site_total) in self.sites[name].items()
+            }
+            stats[(PSEUDO_FILE, 0, name)] = (int(calls), int(calls), own, total, callers)
+        with open(filename, 'wb') as f:
+            marshal.dump(stats, f)
+
+
+# ============================================================================
+# SWITCHES
+# ============================================================================
+
+_active_profiler: Optional[CallProfiler] = None
+
+
+def get_active_profiler() -> Optional[CallProfiler]:
+    """The profiler currently installed, or None when profiling is off"""
+    return _active_profiler
+
+
+@contextmanager
+def profile_calls(report: bool = False, stats_file: Optional[str] = None):
+    """
+    Profile rate-function and color lookups inside a with-block
+
+    Args:
+        report: Print the sorted report when the block exits
+        stats_file: Optional pstats-compatible output file written on exit
+
+    Yields:
+        The CallProfiler collecting the statistics
+    """
+    global _active_profiler
+    if _active_profiler is not None:
+        # Nested use shares the outer profiler
+        yield _active_profiler
+        return
+    profiler = CallProfiler()
+    profiler.install()
+    _active_profiler = profiler
+    try:
+        yield profiler
+    finally:
+        profiler.uninstall()
+        _active_profiler = None
+        if report:
+            profiler.print_report()
+        if stats_file:
+            profiler.dump_stats(stats_file)
+
+
+def install_from_env():
+    """
+    Enable process-wide profiling if UNIFIED_STYLE_PROFILE is set
+
+    A value ending in .prof or .pstats is used as the stats file name;
+    any other non-empty value prints the report at exit. Safe to call
+    more than once.
+    """
+    global _active_profiler
+    setting = os.environ.get(PROFILE_ENV_VAR, "")
+    if not setting or _active_profiler is not None:
+        return
+    profiler = CallProfiler()
+    # Set before installing: install() imports the library modules, whose
+    # import hooks call back into this function
+    _active_profiler = profiler
+    profiler.install()
+
+    def _finish():
+        if setting.endswith((".prof", ".pstats")):
+            profiler.dump_stats(setting)
+            print(f"Profile written to {setting}", file=sys.stderr)
+        else:
+            profiler.print_report()
+
+    atexit.register(_finish)
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    import unified_animation_timing
+    import unified_color_schemes
+
+    with profile_calls() as profiler:
+        scheme = unified_color_schemes.get_scheme("default")
+        rate = unified_animation_timing.get_easing_function("smooth")
+        for i in range(10000):
+            rate(i / 10000)
+            scheme.hex("highlight")
+            scheme.css_rgba("accent", 0.5)
+    profiler.print_report(file=sys.stdout)
@@ -0,0 +1,234 @@
+"""
+Palette Quantization to Scheme Colors
+======================================
+
+Snaps raster images to strictly on-brand colors:
+- PaletteIndex finds the nearest palette color of many pixels at once in
+  OKLab, by vectorized brute force for a single scheme's handful of colors
+  and with a KD-tree (scipy, when installed) for large merged palettes
+- quantize() walks big images chunk by chunk and can apply Floyd-Steinberg
+  error diffusion for smooth gradients
+- The output is a palette-indexed uint8 array, which PNG/GIF encoders store
+  as indexed color and which compresses far better than RGBA
+
+Usage:
+    from unified_quantize import PaletteIndex, quantize, dequantize
+
+    index = PaletteIndex.from_schemes(["erau", "dark"])
+    indices = quantize(image, index, dither=True)   # (H x W) uint8
+    preview = dequantize(indices, index)            # (H x W x 4) uint8
+
+Version: 1.0
+"""
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from unified_color_schemes import ColorScheme, get_scheme, hex_to_rgb_many
+from unified_color_spaces import srgb_to_oklab
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:    # brute force handles every palette size, just slower
+    cKDTree = None
+
+
+# Palettes at least this large use a KD-tree when scipy is available
+KDTREE_MIN_COLORS = 32
+
+DEFAULT_CHUNK_PIXELS = 1 << 18
+
+
+# ============================================================================
+# NEAREST-COLOR INDEX
+# ============================================================================
+
+class PaletteIndex:
+    """Nearest-color lookup over a fixed palette, in OKLab"""
+
+    def __init__(self, colors: Union[np.ndarray, Sequence[str]], use_tree: Optional[bool] = None):
+        """
+        Build the index
+
+        Args:
+            colors: (K x 3/4) sRGB colors (uint8 0-255 or float 0-1) or a
+                list of hex strings; duplicates are removed, order is kept
+            use_tree: Force (True) or disable (False) the KD-tree; by default
+                it is used for KDTREE_MIN_COLORS or more colors when scipy
+                is installed
+        """
+        if len(colors) and isinstance(colors[0], str):
+            rgba, valid = hex_to_rgb_many(colors)
+            if not valid.all():
+                bad = [c for c, ok in zip(colors, valid) if not ok]
+                raise ValueError(f"Invalid hex colors in palette: {', '.join(bad)}")
+            rgb8 = np.rint(rgba[:, :3] * 255).astype(np.uint8)
+        else:
+            colors = np.asarray(colors)
+            rgb8 = colors[:, :3] if colors.dtype == np.uint8 else np.rint(colors[:, :3] * 255)
+            rgb8 = rgb8.astype(np.uint8)
+
+        _, first = np.unique(rgb8, axis=0, return_index=True)
+        self.palette = rgb8[np.sort(first)]
+        if len(self.palette) > 256:
+            raise ValueError("Palettes are limited to 256 colors (uint8 indices)")
+        self.lab = srgb_to_oklab(self.palette / 255.0)
+        # |x - p|^2 = |x|^2 - 2 x.p + |p|^2; |x|^2 is constant per pixel
+        self._lab_t = self.lab.T.copy()
+        self._half_norm = 0.5 * np.sum(self.lab ** 2, axis=1)
+
+        if use_tree is None:
+            use_tree = cKDTree is not None and len(self.palette) >= KDTREE_MIN_COLORS
+        if use_tree and cKDTree is None:
+            raise ImportError("use_tree=True requires scipy")
+        self._tree = cKDTree(self.lab) if use_tree else None
+
+    @classmethod
+    def from_scheme(cls, scheme: Union[str, ColorScheme], keys: Optional[Sequence[str]] = None):
+        """Index the colors of one scheme (all keys by default)"""
+        scheme = get_scheme(scheme) if isinstance(scheme, str) else scheme
+        return cls(scheme.take(keys or scheme.keys(), np.uint8))
+
+    @classmethod
+    def from_schemes(cls, schemes: Sequence[Union[str, ColorScheme]], **kwargs):
+        """Index the merged, de-duplicated colors of several schemes"""
+        resolved = [get_scheme(s) if isinstance(s, str) else s for s in schemes]
+        return cls(np.concatenate([s.as_array(np.uint8) for s in resolved]), **kwargs)
+
+    def __len__(self) -> int:
+        return len(self.palette)
+
+    def nearest_lab(self, lab: np.ndarray) -> np.ndarray:
+        """
+        Palette indices nearest to OKLab colors
+
+        Args:
+            lab: (N x 3) OKLab colors
+
+        Returns:
+            (N,) uint8 palette indices
+        """
+        if self._tree is not None:
+            return self._tree.query(lab)[1].astype(np.uint8)
+        return np.argmax(lab @ self._lab_t - self._half_norm, axis=1).astype(np.uint8)
+
+    def nearest(self, rgb: np.ndarray, chunk_pixels: int = DEFAULT_CHUNK_PIXELS) -> np.ndarray:
+        """
+        Palette indices nearest to sRGB colors
+
+        Args:
+            rgb: (..., 3/4) uint8 (0-255) or float (0-1) colors; alpha ignored
+            chunk_pixels: Pixels converted per batch (bounds temporary memory)
+
+        Returns:
+            uint8 indices with shape rgb.shape[:-1]
+        """
+        rgb = np.asarray(rgb)
+        pixels = rgb.reshape(-1, rgb.shape[-1])
+        scale = 255.0 if rgb.dtype == np.uint8 else 1.0
+        result = np.empty(len(pixels), dtype=np.uint8)
+        for start in range(0, len(pixels), chunk_pixels):
+            chunk = pixels[start:start + chunk_pixels, :3]
+            result[start:start + len(chunk)] = self.nearest_lab(srgb_to_oklab(chunk / scale))
+        return result.reshape(rgb.shape[:-1])
+
+
+# ============================================================================
+# IMAGE QUANTIZATION
+# ============================================================================
+
+# Floyd-Steinberg weights: right, below-left, below, below-right
+_FS_RIGHT, _FS_BELOW_LEFT, _FS_BELOW, _FS_BELOW_RIGHT = 7 / 16, 3 / 16, 5 / 16, 1 / 16
+
+
+def _dither_rows(lab: np.ndarray, index: PaletteIndex, carry: np.ndarray) -> tuple:
+    """
+    Floyd-Steinberg over a block of rows; carry is the error entering the first row
+
+    Pixel (y, x) only receives error from (y, x-1) and from (y-1, x-1..x+1),
+    so all pixels with the same x + 2y are independent and are processed as
+    one vectorized step, anti-diagonal by anti-diagonal (a wavefront). The
+    result is the same as the pixel-by-pixel scan, in W + 2H steps.
+    """
+    height, width, _ = lab.shape
+    palette_lab = index.lab
+    # One padding column on each side absorbs the error leaving the image;
+    # the extra row collects the error for the next block
+    work = np.zeros((height + 1, width + 2, 3))
+    work[:height, 1:-1] = lab
+    work[0, 1:-1] += carry
+    result = np.empty((height, width), dtype=np.uint8)
+    for step in range(width + 2 * (height - 1)):
+        ys = np.arange(max(0, (step - width + 2) // 2), min(height - 1, step // 2) + 1)
+        xs = step - 2 * ys + 1
+        color = work[ys, xs]
+        nearest = index.nearest_lab(color)
+        result[ys, xs - 1] = nearest
+        error = color - palette_lab[nearest]
+        work[ys, xs + 1] += error * _FS_RIGHT
+        work[ys + 1, xs - 1] += error * _FS_BELOW_LEFT
+        work[ys + 1, xs] += error * _FS_BELOW
+        work[ys + 1, xs + 1] += error * _FS_BELOW_RIGHT
+    return result, work[height, 1:-1]
+
+
+def quantize(
+    image: np.ndarray,
+    index: PaletteIndex,
+    dither: bool = False,
+    chunk_rows: int = 256
+) -> np.ndarray:
+    """
+    Map every pixel of an image to its nearest palette color
+
+    Args:
+        image: (H x W x 3/4) uint8 (0-255) or float (0-1) image
+        index: Palette to quantize to
+        dither: Apply Floyd-Steinberg error diffusion (in OKLab), computed
+            one anti-diagonal of pixels at a time
+        chunk_rows: Rows converted per batch
+
+    Returns:
+        (H x W) uint8 palette indices
+    """
+    image = np.asarray(image)
+    if not dither:
+        return index.nearest(image)
+
+    height, width = image.shape[:2]
+    scale = 255.0 if image.dtype == np.uint8 else 1.0
+    result = np.empty((height, width), dtype=np.uint8)
+    carry = np.zeros((width, 3))
+    for start in range(0, height, chunk_rows):
+        lab = srgb_to_oklab(image[start:start + chunk_rows, :, :3] / scale)
+        result[start:start + len(lab)], carry = _dither_rows(lab, index, carry)
+    return result
+
+
+def dequantize(indices: np.ndarray, index: PaletteIndex) -> np.ndarray:
+    """Expand palette indices back into an opaque (H x W x 4) uint8 image"""
+    rgba = np.full((len(index), 4), 255, dtype=np.uint8)
+    rgba[:, :3] = index.palette
+    return rgba[indices]
+
+
+def palette_for_png(index: PaletteIndex) -> List[int]:
+    """Flat [r, g, b, r, g, b, ...] palette, as PIL's Image.putpalette() expects"""
+    return index.palette.reshape(-1).tolist()
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    index = PaletteIndex.from_scheme("erau")
+    print(f"erau palette: {len(index)} distinct colors")
+
+    y, x = np.mgrid[0:64, 0:256]
+    ramp = np.stack([x, y * 4, 255 - x], axis=-1).astype(np.uint8)
+    plain = quantize(ramp, index)
+    dithered = quantize(ramp, index, dither=True)
+    print(f"Plain:    {len(np.unique(plain))} colors used, indices {plain.dtype} {plain.shape}")
+    print(f"Dithered: {len(np.unique(dithered))} colors used")
+
+    exact = index.nearest(index.palette)
+    print(f"Palette colors map to themselves: {bool(np.all(exact == np.arange(len(index))))}")
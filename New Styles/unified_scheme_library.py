@@ -0,0 +1,266 @@
+"""
+External Color Scheme Libraries with a Compiled Snapshot
+=========================================================
+
+Loads color schemes from a directory of JSON or TOML files instead of the
+hard-coded COLOR_SCHEMES_DATA, for deployments with many per-course or
+per-brand schemes. Each file holds one scheme:
+
+    # courses/phys101.toml                  // courses/phys101.json
+    name = "phys101"                        {"name": "phys101",
+    [colors]                                 "colors": {"text": "#FFFFFF", ...}}
+    text = "#FFFFFF"
+    ...
+
+`name` defaults to the file name and `colors` may also be the top level.
+Every scheme must define exactly the 11 semantic keys of the built-in
+schemes, with valid hex colors.
+
+The first load validates and parses every file and writes a compiled
+snapshot (SNAPSHOT_NAME) next to them: a small header, the scheme and key
+name tables and one packed (S x K x 4) uint8 RGBA block. Later processes
+memory-map that block directly while the snapshot still matches its
+sources, so worker start-up does not re-parse thousands of files.
+
+Usage:
+    from unified_scheme_library import load_schemes
+
+    table = load_schemes("schemes/", register=True)
+    get_scheme("phys101").hex("highlight")
+    table.role("highlight")      # (S x 4) across the whole library
+
+Version: 1.0
+"""
+
+import hashlib
+import json
+import os
+import struct
+import sys
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from unified_color_schemes import (
+    COLOR_SCHEMES,
+    COLOR_SCHEMES_DATA,
+    SchemeTable,
+    hex_to_rgb_many,
+)
+
+try:
+    import tomllib
+except ImportError:    # Python < 3.11
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
+
+# The semantic keys every scheme must define, in storage order
+SCHEME_KEYS = tuple(COLOR_SCHEMES_DATA["default"].keys())
+
+SNAPSHOT_NAME = "schemes.bin"
+
+SCHEME_EXTENSIONS = (".json", ".toml")
+
+# magic, format version, scheme count, key count, name table bytes,
+# data offset, fingerprint of the source files (sha1)
+_HEADER = struct.Struct("<4sIIIIQ20s")
+_MAGIC = b"USCH"
+_VERSION = 1
+_DATA_ALIGNMENT = 64
+
+
+# ============================================================================
+# SOURCE FILES
+# ============================================================================
+
+def scheme_files(path: str) -> List[str]:
+    """Sorted JSON/TOML scheme files directly inside a directory"""
+    return sorted(
+        os.path.join(path, name) for name in os.listdir(path)
+        if name.lower().endswith(SCHEME_EXTENSIONS)
+    )
+
+
+def source_fingerprint(files: List[str]) -> bytes:
+    """Hash of the file names, sizes and modification times"""
+    digest = hashlib.sha1()
+    for filename in files:
+        stat = os.stat(filename)
+        digest.update(f"{os.path.basename(filename)}\0{stat.st_size}\0{stat.st_mtime_ns}\n".encode())
+    return digest.digest()
+
+
+def read_scheme_file(filename: str) -> Tuple[str, Dict[str, str]]:
+    """
+    Read and validate one scheme file
+
+    Returns:
+        (name, {key: hex}) with keys in SCHEME_KEYS order
+
+    Raises:
+        ValueError: If the name is not a non-empty single-line string, keys
+            are missing or unknown, or a color is invalid
+    """
+    if filename.lower().endswith(".toml"):
+        if tomllib is None:
+            raise ImportError(f"Reading {filename} requires Python 3.11+ or the tomli package")
+        with open(filename, "rb") as f:
+            data = tomllib.load(f)
+    else:
+        with open(filename, encoding="utf-8") as f:
+            data = json.load(f)
+
+    name = data.get("name", os.path.splitext(os.path.basename(filename))[0])
+    if not isinstance(name, str) or not name.strip() or "\n" in name or "\r" in name:
+        raise ValueError(f"{filename}: scheme name must be a non-empty string without line breaks, got {name!r}")
+    colors = data.get("colors", {k: v for k, v in data.items() if k != "name"})
+
+    missing = [key for key in SCHEME_KEYS if key not in colors]
+    unknown = [key for key in colors if key not in SCHEME_KEYS]
+    if missing or unknown:
+        raise ValueError(f"{filename}: missing keys {missing}, unknown keys {unknown}")
+    hex_values = [colors[key] for key in SCHEME_KEYS]
+    if not all(isinstance(value, str) for value in hex_values):
+        raise ValueError(f"{filename}: colors must be hex strings")
+    _, valid = hex_to_rgb_many(hex_values, np.uint8)
+    if not valid.all():
+        bad = [key for key, ok in zip(SCHEME_KEYS, valid) if not ok]
+        raise ValueError(f"{filename}: invalid colors for {bad}")
+    return name, dict(zip(SCHEME_KEYS, hex_values))
+
+
+def parse_scheme_files(files: List[str]) -> Tuple[List[str], np.ndarray]:
+    """
+    Parse and validate scheme files into names and one packed array
+
+    Returns:
+        (names, rgba8) with rgba8 of shape (S x K x 4), uint8
+    """
+    names, hex_table = [], []
+    seen = {}
+    for filename in files:
+        name, colors = read_scheme_file(filename)
+        if name in seen:
+            raise ValueError(f"Scheme {name!r} is defined in both {seen[name]} and {filename}")
+        seen[name] = filename
+        names.append(name)
+        hex_table.append(list(colors.values()))
+    rgba8, _ = hex_to_rgb_many(np.array(hex_table, dtype=str).reshape(len(names), len(SCHEME_KEYS)), np.uint8)
+    return names, rgba8
+
+
+# ============================================================================
+# COMPILED SNAPSHOT
+# ============================================================================
+
+def write_snapshot(filename: str, names: List[str], keys: Tuple[str, ...],
+                   rgba8: np.ndarray, fingerprint: bytes):
+    """Write names and packed colors as a snapshot file (atomically)"""
+    name_table = "\n".join(list(keys) + list(names)).encode("utf-8")
+    header_size = _HEADER.size + len(name_table)
+    data_offset = -(-header_size // _DATA_ALIGNMENT) * _DATA_ALIGNMENT
+    temporary = f"{filename}.{os.getpid()}.tmp"
+    try:
+        with open(temporary, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, len(names), len(keys), len(name_table),
+                                 data_offset, fingerprint))
+            f.write(name_table)
+            f.write(b"\0" * (data_offset - header_size))
+            f.write(np.ascontiguousarray(rgba8, dtype=np.uint8).tobytes())
+        os.replace(temporary, filename)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def read_snapshot(filename: str, fingerprint: bytes = None):
+    """
+    Memory-map a snapshot file
+
+    Args:
+        filename: Snapshot written by write_snapshot()
+        fingerprint: Expected source fingerprint; a mismatch returns None
+
+    Returns:
+        (names, keys, rgba8) with rgba8 a read-only (S x K x 4) memmap, or
+        None when the file is missing, stale or not a snapshot
+    """
+    try:
+        with open(filename, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, count, key_count, table_size, data_offset, stored = _HEADER.unpack(header)
+            if magic != _MAGIC or version != _VERSION:
+                return None
+            if fingerprint is not None and stored != fingerprint:
+                return None
+            table = f.read(table_size).decode("utf-8").split("\n")
+    except FileNotFoundError:
+        return None
+    keys, names = table[:key_count], table[key_count:]
+    if count == 0:
+        return names, keys, np.zeros((0, key_count, 4), dtype=np.uint8)
+    rgba8 = np.memmap(filename, dtype=np.uint8, mode="r", offset=data_offset,
+                      shape=(count, key_count, 4))
+    return names, keys, rgba8
+
+
+def load_schemes(path: str, register: bool = False, use_snapshot: bool = True) -> SchemeTable:
+    """
+    Load a directory of JSON/TOML scheme files
+
+    The compiled snapshot next to the files is used when it matches them
+    (same names, sizes and modification times); otherwise the files are
+    parsed, validated and the snapshot is rewritten (skipped when it cannot
+    be written, e.g. in a read-only directory).
+
+    Args:
+        path: Directory containing the scheme files
+        register: Also make the schemes available to get_scheme();
+            registering the same directory again replaces its schemes
+        use_snapshot: Read and write the compiled snapshot
+
+    Returns:
+        SchemeTable over the loaded schemes (backed by the memory map when
+        the snapshot was used)
+
+    Raises:
+        ValueError: With register=True, if a scheme name is predefined or
+            already registered from another directory
+    """
+    files = scheme_files(path)
+    fingerprint = source_fingerprint(files)
+    snapshot_path = os.path.join(path, SNAPSHOT_NAME)
+
+    snapshot = read_snapshot(snapshot_path, fingerprint) if use_snapshot else None
+    if snapshot is not None and tuple(snapshot[1]) == SCHEME_KEYS:
+        names, _, rgba8 = snapshot
+    else:
+        names, rgba8 = parse_scheme_files(files)
+        if use_snapshot:
+            try:
+                write_snapshot(snapshot_path, names, SCHEME_KEYS, rgba8, fingerprint)
+            except OSError:    # e.g. a read-only directory; the snapshot is only a cache
+                pass
+        rgba8.flags.writeable = False
+
+    table = SchemeTable.from_packed(names, SCHEME_KEYS, rgba8)
+    if register:
+        COLOR_SCHEMES.add_table(table, os.path.realpath(path))
+    return table
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    if len(sys.argv) != 2:
+        print("Usage: python unified_scheme_library.py SCHEME_DIR")
+        sys.exit(2)
+    table = load_schemes(sys.argv[1])
+    print(f"Loaded {len(table)} schemes from {sys.argv[1]} "
+          f"({'memory-mapped snapshot' if isinstance(table.rgba8, np.memmap) else 'parsed'})")
+    for name in table.names[:10]:
+        print(f"  {name:24} highlight={table.hex(name, 'highlight')}")
@@ -0,0 +1,151 @@
+"""
+Animated Scheme-to-Scheme Transitions
+======================================
+
+Computes a whole theme transition (e.g. `dark` -> `high_contrast`) in one
+vectorized pass: every semantic key of the scheme is interpolated in a
+perceptual color space along an easing curve from EASING_FUNCTIONS, giving
+an (F frames x K keys x 4) RGBA array.
+
+The same transition can be exported as CSS @keyframes over the `--key`
+custom properties used by color_schemes.css, so applets get the identical
+global theme fade.
+
+Usage:
+    from unified_scheme_transitions import scheme_transition
+
+    frames = scheme_transition("dark", "high_contrast", easing="smooth", frames=60)
+    frames[i, scheme.indices(["highlight"])[0]]   # highlight color at frame i
+
+Version: 1.0
+"""
+
+from typing import Callable, Union
+
+import numpy as np
+
+from unified_animation_timing import evaluate_easing, get_easing_function
+from unified_color_schemes import ColorScheme, get_scheme, rgb_to_hex_many
+from unified_color_spaces import interpolate_colors
+
+
+def _resolve_scheme(scheme: Union[str, ColorScheme]) -> ColorScheme:
+    return get_scheme(scheme) if isinstance(scheme, str) else scheme
+
+
+def eased_progress(easing: Union[str, Callable[[float], float]], frames: int) -> np.ndarray:
+    """
+    Sample an easing curve at `frames` evenly spaced times from 0 to 1
+
+    Args:
+        easing: Name in EASING_FUNCTIONS or a rate function
+        frames: Number of frames (2 or more)
+
+    Returns:
+        Array of eased progress values, one per frame
+    """
+    if frames < 2:
+        raise ValueError("A transition needs at least two frames")
+    func = get_easing_function(easing) if isinstance(easing, str) else easing
+    return evaluate_easing(func, np.linspace(0, 1, frames))
+
+
+def scheme_transition(
+    from_scheme: Union[str, ColorScheme],
+    to_scheme: Union[str, ColorScheme],
+    easing: Union[str, Callable[[float], float]] = "smooth",
+    frames: int = 60,
+    space: str = "oklab"
+) -> np.ndarray:
+    """
+    Interpolate every color of one scheme into another
+
+    Args:
+        from_scheme: Starting scheme (name or ColorScheme)
+        to_scheme: Target scheme; must provide all keys of from_scheme
+        easing: Name in EASING_FUNCTIONS or a rate function
+        frames: Number of frames, including the first and last
+        space: Interpolation space ("srgb", "linear", "oklab", "oklch")
+
+    Returns:
+        (frames x K x 4) float32 RGBA array (0-1); keys are in
+        from_scheme.keys() order
+    """
+    start = _resolve_scheme(from_scheme)
+    end = _resolve_scheme(to_scheme)
+    keys = start.keys()
+    progress = eased_progress(easing, frames)
+    colors = interpolate_colors(
+        start.as_array()[None, :, :],
+        end.take(keys)[None, :, :],
+        progress[:, None],
+        space,
+    )
+    return colors.astype(np.float32)
+
+
+def transition_to_css_keyframes(
+    from_scheme: Union[str, ColorScheme],
+    to_scheme: Union[str, ColorScheme],
+    easing: Union[str, Callable[[float], float]] = "smooth",
+    steps: int = 20,
+    space: str = "oklab",
+    name: str = None,
+    duration: float = 1.0,
+    prefix: str = ""
+) -> str:
+    """
+    Export a scheme transition as CSS @keyframes over the --key properties
+
+    The easing and perceptual path are baked into `steps` keyframes, and the
+    custom properties are registered with @property so browsers interpolate
+    between keyframes; the animation itself therefore runs with linear timing.
+
+    Args:
+        from_scheme: Starting scheme (name or ColorScheme)
+        to_scheme: Target scheme
+        easing: Name in EASING_FUNCTIONS or a rate function
+        steps: Number of keyframes (2 or more)
+        space: Interpolation space
+        name: Keyframes name (default "<from>-to-<to>")
+        duration: Duration in seconds for the generated usage rule
+        prefix: Optional prefix for CSS variable names, as in
+            export_all_schemes_to_css
+
+    Returns:
+        CSS text with @property rules, the @keyframes block and a
+        [data-scheme-transition] rule that plays it
+    """
+    start = _resolve_scheme(from_scheme)
+    end = _resolve_scheme(to_scheme)
+    name = name or f"{start.name}-to-{end.name}".replace('_', '-')
+    colors = scheme_transition(start, end, easing, steps, space)
+    hex_values = rgb_to_hex_many(colors[..., :3])
+    var_names = [f"--{prefix}{key.replace('_', '-')}" for key in start.keys()]
+
+    lines = [f"/* {start.name} -> {end.name} ({easing if isinstance(easing, str) else easing.__name__}, {space}) */"]
+    for var_name, initial in zip(var_names, hex_values[0]):
+        lines.append(f"@property {var_name} {{ syntax: '<color>'; inherits: true; initial-value: {initial}; }}")
+    lines.append("")
+    lines.append(f"@keyframes {name} {{")
+    for i, frame in enumerate(hex_values):
+        offset = 100 * i / (steps - 1)
+        values = " ".join(f"{var_name}: {value};" for var_name, value in zip(var_names, frame))
+        lines.append(f"  {offset:.4g}% {{ {values} }}")
+    lines.append("}")
+    lines.append("")
+    lines.append(f"[data-scheme-transition='{name}'] {{")
+    lines.append(f"  animation: {name} {duration:g}s linear forwards;")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+if __name__ == "__main__":
+    # Example usage and testing
+    frames = scheme_transition("dark", "high_contrast", easing="smooth", frames=5)
+    keys = get_scheme("dark").keys()
+    print(f"dark -> high_contrast, {frames.shape[0]} frames x {frames.shape[1]} keys")
+    for i, row in enumerate(rgb_to_hex_many(frames[..., :3])):
+        print(f"  frame {i}: highlight={row[keys.index('highlight')]} accent={row[keys.index('accent')]}")
+    print()
+    print(transition_to_css_keyframes("dark", "high_contrast", steps=5))
@@ -574,7 +574,7 @@ def print_full_guide():
 
 def export_guide_to_markdown(filename: str = "STYLE_GUIDE.md"):
     """Export the complete guide as Markdown documentation"""
-    with open(filename, 'w', encoding='utf-8') as f:
+    with open(filename, 'w', encoding='utf-8', newline='\n') as f:
         f.write("# Unified Style Guide\n\n")
         f.write("Complete documentation for maintaining visual consistency ")
         f.write("across Manim, SVG, and web-based productions.\n\n")
@@ -0,0 +1,336 @@
+"""
+SVG Recoloring Between Color Schemes
+=====================================
+
+Rethemes SVG diagrams drawn with one scheme's colors to another scheme:
+`fill`, `stroke`, `stop-color` and `color` attributes, and the same
+properties inside `style` attributes, are rewritten when their hex value
+belongs to the source scheme. With --variables the colors become
+`var(--key)` references instead, so SVGs inlined in a page follow
+color_schemes.css (presentation attributes cannot hold var(), so those move
+into the style attribute).
+
+Files are streamed through an incremental (expat) XML parser and only the
+start tags that change are rewritten, so comments, whitespace and everything
+else in the file stay byte-for-byte identical. Directories are processed
+with a process pool, and files whose content and options are unchanged
+since the last run are skipped by content hash.
+
+Command line:
+    python unified_svg_recolor.py diagrams/ -o diagrams_erau/ --from dark --to erau
+    python unified_svg_recolor.py diagrams/ --in-place --from dark --variables
+
+Version: 1.0
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Union
+from xml.parsers import expat
+
+from unified_color_lut3d import PRIMARY_ROLES
+from unified_color_schemes import ColorScheme, get_scheme
+
+
+COLOR_ATTRIBUTES = ("fill", "stroke", "stop-color", "color")
+
+CACHE_FILE = ".svg_recolor_cache.json"
+
+READ_CHUNK = 1 << 16
+
+_HEX_COLOR = re.compile(rb"(?<![\w(])#(?:[0-9a-fA-F]{6}|[0-9a-fA-F]{3})\b")    # not url(#id)
+_ATTRIBUTE = re.compile(rb"""(\s+)([\w:.-]+)(\s*=\s*)(["'])(.*?)\4""", re.S)
+_STYLE_PROPERTY = re.compile(
+    rb"((?:^|;)\s*(?:" + b"|".join(a.encode() for a in COLOR_ATTRIBUTES) + rb")\s*:\s*)([^;]+)"
+)
+
+
+def _normalize_hex(value: bytes) -> bytes:
+    value = value.upper()
+    if len(value) == 4:
+        value = b"#" + bytes(c for c in value[1:] for _ in range(2))
+    return value
+
+
+def color_mapping(
+    from_scheme: Union[str, ColorScheme],
+    to_scheme: Optional[Union[str, ColorScheme]] = None,
+    variables: bool = False,
+    prefix: str = ""
+) -> Dict[bytes, bytes]:
+    """
+    Replacement for each source scheme color
+
+    Colors shared by several roles map to the first role in PRIMARY_ROLES
+    order, then keys() order.
+
+    Args:
+        from_scheme: Scheme the SVGs were drawn with
+        to_scheme: Scheme to recolor to (not needed with variables=True)
+        variables: Map to `var(--key)` references instead of hex values
+        prefix: Optional prefix for CSS variable names, as in
+            export_all_schemes_to_css
+
+    Returns:
+        Uppercase #RRGGBB bytes -> replacement bytes
+    """
+    start = get_scheme(from_scheme) if isinstance(from_scheme, str) else from_scheme
+    if not variables:
+        if to_scheme is None:
+            raise ValueError("to_scheme is required unless variables=True")
+        end = get_scheme(to_scheme) if isinstance(to_scheme, str) else to_scheme
+    keys = sorted(start.keys(), key=lambda k: PRIMARY_ROLES.index(k) if k in PRIMARY_ROLES else len(PRIMARY_ROLES))
+    mapping = {}
+    for key in keys:
+        source = _normalize_hex(start.hex(key).encode())
+        if source in mapping:
+            continue
+        if variables:
+            mapping[source] = f"var(--{prefix}{key.replace('_', '-')})".encode()
+        else:
+            mapping[source] = end.hex(key).encode()
+    return mapping
+
+
+# ============================================================================
+# STREAMING REWRITE
+# ============================================================================
+
+def _tag_end(data: bytes, start: int) -> int:
+    """Index just past the '>' closing the tag at `start`, skipping quoted values"""
+    quote = None
+    for i in range(start + 1, len(data)):
+        c = data[i:i + 1]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in (b'"', b"'"):
+            quote = c
+        elif c == b">":
+            return i + 1
+    raise ValueError("Unterminated start tag")
+
+
+def _recolor_tag(tag: bytes, mapping: Dict[bytes, bytes]) -> bytes:
+    def replace_hex(match):
+        return mapping.get(_normalize_hex(match.group(0)), match.group(0))
+
+    # var() is not allowed in presentation attributes, only in CSS, so
+    # attributes mapped to var(--key) move into the style attribute
+    moved = []
+
+    def replace_attribute(match):
+        space, name, equals, quote, value = match.groups()
+        if name.decode() in COLOR_ATTRIBUTES:
+            value = _HEX_COLOR.sub(replace_hex, value)
+            if value.startswith(b"var("):
+                moved.append(name + b": " + value)
+                return b""
+        elif name == b"style":
+            value = _STYLE_PROPERTY.sub(
+                lambda m: m.group(1) + _HEX_COLOR.sub(replace_hex, m.group(2)), value)
+        return space + name + equals + quote + value + quote
+
+    tag = _ATTRIBUTE.sub(replace_attribute, tag)
+    if not moved:
+        return tag
+    style = re.search(rb"""(?<![\w:.-])style\s*=\s*(["'])(.*?)\1""", tag, re.S)
+    if style:
+        # A property the style attribute sets itself overrides the
+        # presentation attribute, so the moved declaration is dropped; the
+        # others go first, where they cannot override anything either
+        existing = style.group(2).strip().rstrip(b";")
+        declared = {name.lower() for name in re.findall(rb"(?:^|;)\s*([\w-]+)\s*:", existing)}
+        moved = [d for d in moved if d.split(b":")[0].lower() not in declared]
+        value = b"; ".join(moved + ([existing] if existing else []))
+        return tag[:style.start(2)] + value + tag[style.end(2):]
+    close = len(tag) - (2 if tag.endswith(b"/>") else 1)
+    return tag[:close].rstrip() + b' style="' + b"; ".join(moved) + b'"' + tag[close:]
+
+
+def recolor_stream(source, destination, mapping: Dict[bytes, bytes]) -> int:
+    """
+    Recolor an SVG read from one binary file object into another
+
+    Args:
+        source: Readable binary file object
+        destination: Writable binary file object
+        mapping: From color_mapping()
+
+    Returns:
+        Number of start tags rewritten
+    """
+    parser = expat.ParserCreate()
+    state = {"buffer": b"", "offset": 0, "changed": 0}
+
+    def start_element(name, attributes):
+        if not any(a in attributes for a in COLOR_ATTRIBUTES + ("style",)):
+            return
+        start = parser.CurrentByteIndex - state["offset"]
+        buffer = state["buffer"]
+        end = _tag_end(buffer, start)
+        tag = buffer[start:end]
+        recolored = _recolor_tag(tag, mapping)
+        if recolored != tag:
+            state["changed"] += 1
+        # Everything before the end of this tag is final; write it out
+        destination.write(buffer[:start])
+        destination.write(recolored)
+        state["buffer"] = buffer[end:]
+        state["offset"] += end
+
+    parser.StartElementHandler = start_element
+    while True:
+        chunk = source.read(READ_CHUNK)
+        state["buffer"] += chunk
+        parser.Parse(chunk, not chunk)
+        if not chunk:
+            break
+    destination.write(state["buffer"])
+    return state["changed"]
+
+
+def recolor_file(source: str, destination: str, mapping: Dict[bytes, bytes]) -> int:
+    """Recolor one SVG file (destination may equal source); returns tags rewritten"""
+    directory, filename = os.path.split(destination)
+    temporary = os.path.join(directory, f".{filename}.{os.getpid()}.tmp")
+    try:
+        with open(source, "rb") as src, open(temporary, "wb") as dst:
+            changed = recolor_stream(src, dst, mapping)
+        os.replace(temporary, destination)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+    return changed
+
+
+# ============================================================================
+# DIRECTORY PROCESSING
+# ============================================================================
+
+def _file_hash(path: str, options: str) -> str:
+    digest = hashlib.sha256(options.encode())
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _recolor_job(job) -> tuple:
+    source, destination, mapping = job
+    os.makedirs(os.path.dirname(destination) or ".", exist_ok=True)
+    return source, recolor_file(source, destination, mapping)
+
+
+def recolor_directory(
+    source_dir: str,
+    output_dir: Optional[str],
+    mapping: Dict[bytes, bytes],
+    workers: Optional[int] = None,
+    use_cache: bool = True
+) -> Dict[str, int]:
+    """
+    Recolor every .svg below a directory in parallel
+
+    Args:
+        source_dir: Directory searched recursively for .svg files
+        output_dir: Mirror directory for results (None rewrites in place)
+        mapping: From color_mapping()
+        workers: Process pool size (default: CPU count)
+        use_cache: Skip files whose content hash matches the last run
+
+    Returns:
+        Relative path -> tags rewritten, for the files that were processed
+    """
+    output_dir = output_dir or source_dir
+    cache_path = os.path.join(output_dir, CACHE_FILE)
+    cache = {}
+    if use_cache and os.path.exists(cache_path):
+        with open(cache_path) as f:
+            cache = json.load(f)
+    options = repr(sorted(mapping.items()))
+
+    jobs, hashes = [], {}
+    for root, _, files in os.walk(source_dir):
+        for name in sorted(files):
+            if not name.lower().endswith(".svg"):
+                continue
+            source = os.path.join(root, name)
+            relative = os.path.relpath(source, source_dir)
+            destination = os.path.join(output_dir, relative)
+            digest = _file_hash(source, options)
+            # In place, the cache holds the hash of our own output
+            if cache.get(relative) == digest and os.path.exists(destination):
+                continue
+            hashes[relative] = digest
+            jobs.append((source, destination, mapping))
+
+    results = {}
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for source, changed in pool.map(_recolor_job, jobs, chunksize=8):
+                results[os.path.relpath(source, source_dir)] = changed
+
+    if use_cache:
+        for relative in results:
+            if output_dir == source_dir:
+                hashes[relative] = _file_hash(os.path.join(source_dir, relative), options)
+            cache[relative] = hashes[relative]
+        os.makedirs(output_dir, exist_ok=True)
+        with open(cache_path, "w") as f:
+            json.dump(cache, f, indent=2, sort_keys=True)
+    return results
+
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Recolor SVG files from one color scheme to another")
+    parser.add_argument("source", help="SVG file or directory")
+    parser.add_argument("-o", "--output", help="Output file or directory")
+    parser.add_argument("--in-place", action="store_true", help="Rewrite the source files")
+    parser.add_argument("--from", dest="from_scheme", required=True, help="Scheme the SVGs use")
+    parser.add_argument("--to", dest="to_scheme", help="Scheme to recolor to")
+    parser.add_argument("--variables", action="store_true", help="Write var(--key) references instead of hex")
+    parser.add_argument("--prefix", default="", help="CSS variable prefix")
+    parser.add_argument("--workers", type=int, help="Process pool size")
+    parser.add_argument("--no-cache", action="store_true", help="Process every file")
+    args = parser.parse_args(argv)
+
+    if not (args.output or args.in_place):
+        parser.error("give --output or --in-place")
+    if not (args.to_scheme or args.variables):
+        parser.error("give --to or --variables")
+    mapping = color_mapping(args.from_scheme, args.to_scheme, args.variables, args.prefix)
+
+    if os.path.isdir(args.source):
+        results = recolor_directory(args.source, None if args.in_place else args.output,
+                                    mapping, args.workers, not args.no_cache)
+        print(f"Recolored {len(results)} file(s), {sum(results.values())} tag(s) changed")
+    else:
+        changed = recolor_file(args.source, args.source if args.in_place else args.output, mapping)
+        print(f"Recolored {args.source}: {changed} tag(s) changed")
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        sys.exit(main())
+
+    # Example usage and testing
+    import io
+    mapping = color_mapping("dark", variables=True)
+    fill, style_fill = get_scheme("dark").hex("highlight"), get_scheme("dark").hex("time")
+    results = []
+    for svg in (f'<svg><rect fill="{fill}" stroke="{style_fill}"/></svg>',
+                f'<svg><rect fill="{fill}" style="opacity:.5;fill:{style_fill}"/></svg>',
+                f'<svg><rect fill="{fill}" stroke="{fill}" style="fill:{style_fill}"/></svg>'):
+        out = io.BytesIO()
+        recolor_stream(io.BytesIO(svg.encode()), out, mapping)
+        results.append(out.getvalue().decode())
+        print(f"  {svg}\n    -> {results[-1]}")
+    # A fill set in style must keep overriding the fill attribute
+    print(f"Style declarations keep precedence: {results[1].count('fill') == 1 and 'var(--time)' in results[1]}")
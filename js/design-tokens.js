@@ -0,0 +1,64 @@
+// Auto-generated design tokens for JavaScript use
+// Generated from unified_design_tokens.py (durations in ms, lengths in px,
+// easings as EASING_FUNCTIONS names, colors as color scheme keys)
+
+const DESIGN_TOKENS = {
+  duration: {
+    default: 1000,
+    emphasis: 800,
+    fade_out: 800,
+    pause: 500,
+    quick: 500,
+    slow: 2000,
+    text_display: 2000,
+    transform: 1500,
+    very_slow: 3000
+  },
+
+  spacing: {
+    large: 100,
+    med_large: 50,
+    med_small: 25,
+    small: 10
+  },
+
+  stroke: {
+    bold: 8,
+    emphasis: 6,
+    fine: 2,
+    standard: 4
+  },
+
+  font: {
+    body: 48,
+    display: 96,
+    header: 72,
+    small: 24
+  },
+
+  easing: {
+    appear: "smooth",
+    bounce: "easeOutBack",
+    constant_rate: "linear",
+    disappear: "smooth",
+    emphasis: "thereAndBack",
+    fast_appear: "rushInto",
+    fast_disappear: "rushFrom",
+    move: "smooth"
+  },
+
+  color: {
+    background: "background",
+    emphasis: "highlight",
+    important: "dot",
+    primary: "accent",
+    secondary: "displacement",
+    text: "text",
+    time: "time"
+  }
+};
+
+// Export for use in modules
+if (typeof module !== 'undefined' && module.exports) {
+  module.exports = { DESIGN_TOKENS };
+}